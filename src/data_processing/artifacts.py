@@ -0,0 +1,97 @@
+# src/data_processing/artifacts.py
+"""
+Eğitilmiş temizleme adımlarının (doldurucu, aykırı değer sınırları, ölçekleyici)
+sürümlü olarak saklanması.
+
+Bir kez eğitilen artefakt kaydedilip yeni gelen satır gruplarına yeniden
+eğitim yapılmadan uygulanabilir.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional
+import logging
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from .outliers import bounds_mask
+from .storage import numeric_block
+
+# Artefakt dosya biçiminin sürümü; yapı değiştiğinde artırılır
+# (2: çok değişkenli aykırı değer modeli eklendi)
+ARTIFACT_VERSION = 2
+
+
+class CleaningArtifact:
+    """
+    Eğitilmiş temizleme parametreleri.
+
+    Args:
+        numeric_columns (list): Doldurucu ve ölçekleyicinin eğitildiği sütunlar (sırasıyla)
+        imputer: Eğitilmiş doldurucu (None ise doldurma yapılmaz)
+        scaler: Eğitilmiş ölçekleyici (None ise ölçekleme yapılmaz)
+        outlier_bounds (dict): Sütun -> (alt, üst) sınırları; sınırların dışındaki satırlar çıkarılır
+        outlier_detector: Çok değişkenli aykırı değer modeli (ör. MahalanobisDetector)
+        outlier_columns (list): outlier_detector'ın uygulandığı sütunlar
+        params (dict): Eğitimde kullanılan ayarlar (bilgi amaçlı)
+    """
+    def __init__(self, numeric_columns: List[str], imputer=None, scaler=None,
+                 outlier_bounds: Optional[Dict[str, tuple]] = None, outlier_detector=None,
+                 outlier_columns: Optional[List[str]] = None, params: Optional[Dict] = None):
+        self.numeric_columns = list(numeric_columns)
+        self.imputer = imputer
+        self.scaler = scaler
+        self.outlier_bounds = dict(outlier_bounds or {})
+        self.outlier_detector = outlier_detector
+        self.outlier_columns = list(outlier_columns or [])
+        self.params = dict(params or {})
+        self.version = ARTIFACT_VERSION
+        self.sklearn_version = sklearn.__version__
+        self.created_at = datetime.now().isoformat(timespec='seconds')
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Eğitilmiş adımları yeni veriye uygular (yeniden eğitim yapmaz)"""
+        missing = [col for col in self.numeric_columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Artefaktın beklediği sütunlar bulunamadı: {', '.join(missing)}")
+
+        values = numeric_block(df, self.numeric_columns, dtype=np.float64)
+        if self.imputer is not None and np.isnan(values).any():
+            values = self.imputer.transform(values)
+
+        keep = np.ones(len(values), dtype=bool)
+        if self.outlier_bounds:
+            idx = [self.numeric_columns.index(col) for col in self.outlier_bounds]
+            lower, upper = np.array(list(self.outlier_bounds.values()), dtype=np.float64).T
+            keep &= bounds_mask(values[:, idx], lower, upper)
+        if self.outlier_detector is not None:
+            idx = [self.numeric_columns.index(col) for col in self.outlier_columns]
+            keep &= self.outlier_detector.mask(values[:, idx])
+        if not keep.all():
+            values = values[keep]
+
+        if self.scaler is not None and len(values):
+            values = self.scaler.transform(values)
+
+        out = pd.DataFrame(values, columns=self.numeric_columns, index=df.index[keep])
+        other_cols = df.columns.difference(self.numeric_columns)
+        if len(other_cols):
+            out = df.loc[keep, other_cols].join(out)[df.columns]
+        return out
+
+    def save(self, path) -> None:
+        joblib.dump(self, path)
+
+    @classmethod
+    def load(cls, path, logger: Optional[logging.Logger] = None) -> 'CleaningArtifact':
+        logger = logger or logging.getLogger(__name__)
+        artifact = joblib.load(path)
+        if not isinstance(artifact, cls):
+            raise TypeError(f"Geçerli bir temizleme artefaktı değil: {path}")
+        if artifact.version != ARTIFACT_VERSION:
+            raise ValueError(f"Desteklenmeyen artefakt sürümü: {artifact.version} "
+                             f"(beklenen: {ARTIFACT_VERSION})")
+        if artifact.sklearn_version != sklearn.__version__:
+            logger.warning(f"⚠️ Artefakt scikit-learn {artifact.sklearn_version} ile kaydedilmiş, "
+                           f"mevcut sürüm {sklearn.__version__}")
+        return artifact
@@ -0,0 +1,195 @@
+# src/data_processing/batch.py
+"""
+Çok dosyalı toplu (batch) temizleme.
+
+Bir klasördeki veya glob desenine uyan ham dosyalar (ör. bölge/ay başına bir CSV)
+bir süreç havuzunda paralel olarak temizlenir. İki istatistik modu vardır:
+
+    - per-file : Her dosya kendi doldurucu/aykırı değer/ölçekleyici istatistikleriyle
+                 temizlenir (BostonHousingCleaner.run_pipeline)
+    - global   : Artefakt tüm dosyaların birleşimi (veya her dosyadan bir örneklem)
+                 üzerinde bir kez eğitilir, işçiler yalnızca transform uygular
+
+Çıktılar önce aynı klasörde geçici bir dosyaya yazılır ve tamamlanınca
+os.replace ile hedef ada taşınır; yarım kalan çıktı hiçbir zaman hedef adla görünmez.
+
+Kullanım:
+  python -m src.data_processing.batch <klasör veya desen> <çıktı klasörü>
+         [--workers N] [--statistics per-file|global] [--strategy median]
+"""
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+import argparse
+import logging
+import os
+import time
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+from .artifacts import CleaningArtifact
+from .cleaner import BostonHousingCleaner, configure_logging
+from .storage import (OUTPUT_EXTENSIONS, atomic_write_table, detect_format, discover_inputs,
+                      output_path_for, read_table)
+
+STATISTICS_MODES = ('per-file', 'global')
+
+# İşçi süreçlerinde paylaşılan (global moddaki) artefakt
+_WORKER_ARTIFACT: Optional[CleaningArtifact] = None
+
+
+def fit_global_artifact(paths: List[str], cleaner_kwargs: Optional[Dict] = None,
+                        sample_rows: Optional[int] = None, random_state: int = 42) -> CleaningArtifact:
+    """
+    Tüm dosyaların birleşimi üzerinde temizleme artefaktını eğitir.
+
+    Args:
+        paths (list): Girdi dosyaları
+        cleaner_kwargs (dict): BostonHousingCleaner ayarları
+        sample_rows (int): Her dosyadan alınacak en fazla satır (None ise tümü)
+        random_state (int): Örnekleme tohumu
+    """
+    cleaner_kwargs = dict(cleaner_kwargs or {})
+    frames = []
+    for path in paths:
+        df = read_table(path, columns=cleaner_kwargs.get('columns'), schema=cleaner_kwargs.get('schema'))
+        if sample_rows is not None and len(df) > sample_rows:
+            df = df.sample(sample_rows, random_state=random_state)
+        frames.append(df)
+    union = pd.concat(frames, ignore_index=True)
+    del frames
+    cleaner = BostonHousingCleaner(paths[0], os.devnull, **cleaner_kwargs)
+    return cleaner.fit(union)
+
+
+def _init_worker(artifact: Optional[CleaningArtifact]) -> None:
+    global _WORKER_ARTIFACT
+    _WORKER_ARTIFACT = artifact
+    # Paralellik süreçler arasında; her işçide BLAS/OpenMP tek iş parçacığıyla sınırlanır
+    threadpool_limits(1)
+
+
+def _clean_file(input_path: str, output_path: str, cleaner_kwargs: Dict) -> Dict:
+    """Tek bir dosyayı temizler (işçi sürecinde çalışır)"""
+    start = time.perf_counter()
+    record = {'input': input_path, 'output': output_path, 'rows_in': None, 'rows_out': None}
+    try:
+        if _WORKER_ARTIFACT is not None:
+            df = read_table(input_path, columns=cleaner_kwargs.get('columns'),
+                            schema=cleaner_kwargs.get('schema'))
+            out = _WORKER_ARTIFACT.transform(df)
+            record['rows_in'] = len(df)
+        else:
+            cleaner = BostonHousingCleaner(input_path, output_path, **cleaner_kwargs)
+            # Kayıt aşaması grafikten çıkarılır; çıktı atomik olarak aşağıda yazılır
+            out = cleaner.run_pipeline(skip=['save'])
+            record['rows_in'] = int(cleaner.metrics_summary().loc['load', 'rows_out'])
+        atomic_write_table(out, output_path, cleaner_kwargs.get('compression'))
+        record.update(rows_out=len(out), status='ok', error=None)
+    except Exception as e:
+        record.update(status='error', error=f"{type(e).__name__}: {e}")
+    record['seconds'] = time.perf_counter() - start
+    return record
+
+
+def _run_tasks(paths, outputs, cleaner_kwargs, workers, artifact):
+    """Dosyaları işçilere dağıtır ve sonuç kayıtlarını tamamlandıkça döndürür"""
+    global _WORKER_ARTIFACT
+    if workers == 1:
+        previous, _WORKER_ARTIFACT = _WORKER_ARTIFACT, artifact
+        try:
+            for path, out in zip(paths, outputs):
+                yield _clean_file(path, out, cleaner_kwargs)
+        finally:
+            _WORKER_ARTIFACT = previous
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(artifact,)) as pool:
+        futures = [pool.submit(_clean_file, path, out, cleaner_kwargs)
+                   for path, out in zip(paths, outputs)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def clean_batch(source, output_dir: str, workers: Optional[int] = None, statistics: str = 'per-file',
+                output_format: Optional[str] = None, sample_rows: Optional[int] = None,
+                logger: Optional[logging.Logger] = None, **cleaner_kwargs) -> pd.DataFrame:
+    """
+    Birden çok dosyayı paralel olarak temizler.
+
+    Args:
+        source: Klasör, glob deseni veya dosya listesi
+        output_dir (str): Çıktı klasörü (dosya adları korunur)
+        workers (int): Süreç sayısı (None ise çekirdek sayısı; 1 ise aynı süreçte sırayla)
+        statistics (str): 'per-file' veya 'global'
+        output_format (str): 'csv', 'parquet' veya 'feather' (None ise girdi formatı)
+        sample_rows (int): global modda eğitim için dosya başına en fazla satır
+        **cleaner_kwargs: BostonHousingCleaner ayarları (imputation_strategy, outlier_method...)
+
+    Returns:
+        pd.DataFrame: Dosya başına sonuç tablosu (input, output, rows_in, rows_out, status, error, seconds)
+    """
+    logger = logger or logging.getLogger('BostonHousingCleaner')
+    if statistics not in STATISTICS_MODES:
+        raise ValueError(f"Bilinmeyen istatistik modu: {statistics} "
+                         f"(seçenekler: {', '.join(STATISTICS_MODES)})")
+    if output_format is not None and output_format not in OUTPUT_EXTENSIONS:
+        raise ValueError(f"Desteklenmeyen çıktı formatı: {output_format}")
+    if cleaner_kwargs.get('partition_cols'):
+        raise ValueError("Toplu temizlemede bölümlenmiş (partition_cols) çıktı desteklenmez")
+
+    paths = discover_inputs(source)
+    for path in paths:
+        detect_format(path)
+    outputs = [output_path_for(path, output_dir, output_format) for path in paths]
+    duplicates = sorted({out for out in outputs if outputs.count(out) > 1})
+    if duplicates:
+        raise ValueError(f"Birden çok girdi aynı çıktı adına yazılacak: {', '.join(duplicates)}")
+    os.makedirs(output_dir, exist_ok=True)
+
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    logger.info(f"📦 Toplu temizleme: {len(paths)} dosya, {workers} işçi, istatistikler: {statistics}")
+    start = time.perf_counter()
+
+    artifact = None
+    if statistics == 'global':
+        artifact = fit_global_artifact(paths, cleaner_kwargs, sample_rows)
+        logger.info(f"✅ Global artefakt eğitildi ({artifact.params['n_rows']} satır)")
+
+    records = []
+    for record in _run_tasks(paths, outputs, cleaner_kwargs, workers, artifact):
+        records.append(record)
+        if record['status'] == 'ok':
+            logger.info(f"✅ {os.path.basename(record['input'])}: "
+                        f"{record['rows_in']} → {record['rows_out']} satır ({record['seconds']:.2f} sn)")
+        else:
+            logger.error(f"❌ {os.path.basename(record['input'])}: {record['error']}")
+
+    table = pd.DataFrame(records, columns=['input', 'output', 'rows_in', 'rows_out',
+                                           'status', 'error', 'seconds'])
+    table = table.sort_values('input', ignore_index=True)
+    failed = int((table['status'] != 'ok').sum())
+    logger.info(f"📦 Toplu temizleme bitti: {len(table) - failed} başarılı, {failed} hatalı "
+                f"({time.perf_counter() - start:.1f} sn)")
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Boston Housing toplu veri temizleme")
+    parser.add_argument("source", help="Ham dosyaların klasörü veya glob deseni (ör. 'data/raw/*.csv')")
+    parser.add_argument("output_dir", help="Temizlenmiş dosyaların yazılacağı klasör")
+    parser.add_argument("--workers", type=int, default=None, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--statistics", choices=STATISTICS_MODES, default='per-file',
+                        help="Dosya başına veya tüm dosyaların birleşimi üzerinden istatistik")
+    parser.add_argument("--sample-rows", type=int, default=None,
+                        help="global modda eğitim için dosya başına en fazla satır")
+    parser.add_argument("--format", choices=list(OUTPUT_EXTENSIONS), default=None,
+                        help="Çıktı formatı (varsayılan: girdi formatı)")
+    parser.add_argument("--strategy", default="rf", help="Eksik veri doldurma stratejisi")
+    args = parser.parse_args()
+
+    configure_logging()
+    result = clean_batch(args.source, args.output_dir, workers=args.workers, statistics=args.statistics,
+                         output_format=args.format, sample_rows=args.sample_rows,
+                         imputation_strategy=args.strategy)
+    print(result.to_string())
+    raise SystemExit(0 if (result['status'] == 'ok').all() else 1)
@@ -0,0 +1,244 @@
+# src/data_processing/cache.py
+"""
+Temizleme aşaması çıktıları ve çizilmiş grafikler için içerik adresli disk önbelleği.
+
+Anahtarlar girdi verisinin özeti ve aşama parametrelerinden türetilir; aynı
+veri ve parametrelerle yapılan tekrar çalıştırmalar diskteki ara sonuçları
+kullanır. Önbellek boyutu sınırlıdır ve en uzun süredir kullanılmayan (LRU)
+kayıtlar silinir.
+"""
+from typing import Iterable, Optional
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+
+_BLOCK_SIZE = 4 * 1024 * 1024
+_FINGERPRINT_INDEX = "fingerprints.json"
+_ENTRY_SUFFIX = ".pkl"
+_FIGURE_SUFFIX = ".fig"
+_PAGES_SUFFIX = ".pages"
+
+
+def _hash_file(path, digest) -> None:
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_BLOCK_SIZE), b''):
+            digest.update(block)
+
+
+def _file_stat_signature(path) -> list:
+    """Dosya (veya klasördeki tüm dosyalar) için boyut ve değişiklik zamanı listesi"""
+    if not os.path.isdir(path):
+        stat = os.stat(path)
+        return [[str(path), stat.st_size, stat.st_mtime_ns]]
+    signature = []
+    for root, _, files in sorted(os.walk(path)):
+        for name in sorted(files):
+            full = os.path.join(root, name)
+            stat = os.stat(full)
+            signature.append([os.path.relpath(full, path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def file_fingerprint(path) -> str:
+    """Dosyanın (veya bölümlenmiş veri klasörünün) içerik özeti"""
+    digest = hashlib.blake2b(digest_size=20)
+    if os.path.isdir(path):
+        for rel_path, _, _ in _file_stat_signature(path):
+            digest.update(rel_path.encode())
+            _hash_file(os.path.join(path, rel_path), digest)
+    else:
+        _hash_file(path, digest)
+    return digest.hexdigest()
+
+
+def column_fingerprint(series: pd.Series) -> str:
+    """
+    Sütunun içerik özeti. Sayısal sütunlarda ham bellek doğrudan özetlenir (kopya yok);
+    diğer tiplerde pandas'ın satır özetleri kullanılır.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{series.name}|{series.dtype}|{len(series)}".encode())
+    values = series.to_numpy()
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'biufcmM':
+        digest.update(np.ascontiguousarray(values).view(np.uint8))
+    else:
+        digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy())
+    return digest.hexdigest()
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """Veri çerçevesinin içerik özeti (sütun özetleri ve indeksten)"""
+    digest = hashlib.blake2b(digest_size=20)
+    for col in df.columns:
+        digest.update(column_fingerprint(df[col]).encode())
+    digest.update(column_fingerprint(df.index.to_series(index=None)).encode())
+    return digest.hexdigest()
+
+
+def params_key(*parts) -> str:
+    """Parametrelerden kararlı bir anahtar üretir"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+
+class StageCache:
+    """
+    Aşama çıktılarını anahtar -> DataFrame olarak saklayan disk önbelleği.
+
+    Args:
+        cache_dir (str): Önbellek klasörü
+        max_mb (float): Önbelleğin kaplayabileceği en fazla disk alanı (MB)
+    """
+    entry_suffix = _ENTRY_SUFFIX
+
+    def __init__(self, cache_dir, max_mb: float = 1024, logger: Optional[logging.Logger] = None):
+        self.cache_dir = str(cache_dir)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.logger = logger or logging.getLogger(__name__)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.entry_suffix)
+
+    def input_fingerprint(self, path) -> str:
+        """
+        Girdi dosyasının içerik özeti. Boyut ve değişiklik zamanı aynı kaldıkça
+        önceki özet yeniden kullanılır, böylece büyük dosyalar her seferinde okunmaz.
+        """
+        path = os.path.abspath(str(path))
+        index_path = os.path.join(self.cache_dir, _FINGERPRINT_INDEX)
+        try:
+            with open(index_path, encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+
+        signature = _file_stat_signature(path)
+        entry = index.get(path)
+        if entry and entry['signature'] == signature:
+            return entry['digest']
+
+        digest = file_fingerprint(path)
+        index[path] = {'signature': signature, 'digest': digest}
+        payload = json.dumps(index).encode('utf-8')
+        self._atomic_write(index_path, lambda f: f.write(payload))
+        return digest
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.exists(self._entry_path(key))
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                df = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        # LRU için son erişim zamanını güncelle
+        os.utime(path)
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        self._atomic_write(self._entry_path(key),
+                           lambda f: pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL))
+        self.evict()
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Tek bir kaydı veya (key verilmezse) tüm önbelleği siler"""
+        paths = [self._entry_path(key)] if key else self._entries()
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def size_bytes(self) -> int:
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def evict(self) -> None:
+        """Toplam boyut sınırın altına inene kadar en eski erişilen kayıtları siler"""
+        entries = []
+        for path in self._entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:  # başka bir süreç tarafından silinmiş
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        while entries and total > self.max_bytes:
+            _, size, oldest = entries.pop(0)
+            total -= size
+            try:
+                os.remove(oldest)
+            except FileNotFoundError:
+                continue
+            self.logger.info(f"🗑 Önbellekten silindi: {os.path.basename(oldest)}")
+
+    def _entries(self) -> list:
+        return [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                if name.endswith(self.entry_suffix)]
+
+    def _atomic_write(self, path: str, write) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+class FigureCache(StageCache):
+    """
+    Çizilmiş grafik dosyalarını (PNG, HTML...) anahtar -> dosya içeriği olarak saklar.
+
+    Anahtarlar "<grafik adı>-<özet>" biçimindedir; böylece tek bir grafik türünün
+    tüm kayıtları invalidate_plot ile silinebilir.
+    """
+    entry_suffix = _FIGURE_SUFFIX
+
+    def put_file(self, key: str, path) -> None:
+        """Üretilmiş dosyayı önbelleğe kopyalar"""
+        with open(path, 'rb') as src:
+            self._atomic_write(self._entry_path(key), lambda f: shutil.copyfileobj(src, f))
+        self.evict()
+
+    def restore(self, key: str, path, companions: Iterable[str] = ()) -> bool:
+        """
+        Kayıt varsa dosyayı hedef yola kopyalar. companions içindeki dosyalardan
+        (ör. paylaşılan plotly.min.js) biri eksikse kayıt kullanılmaz.
+        """
+        entry = self._entry_path(key)
+        if not os.path.exists(entry) or not all(os.path.exists(p) for p in companions):
+            return False
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        try:
+            shutil.copyfile(entry, path)
+        except FileNotFoundError:  # bu arada başka bir süreç tarafından silinmiş
+            return False
+        # LRU için son erişim zamanını güncelle
+        os.utime(entry)
+        return True
+
+    def invalidate_plot(self, name: str) -> None:
+        """Bir grafik türünün (ör. 'plot_scatter') tüm kayıtlarını siler"""
+        for path in self._entries():
+            if os.path.basename(path).startswith(name + '-') and os.path.exists(path):
+                os.remove(path)
+
+
+class PageCache(StageCache):
+    """
+    Rapor bileşenlerinin hazırlanmış sayfalarını anahtar -> [pickle ile serileştirilmiş
+    sayfa, ...] olarak saklar. Sayfalar reporting.core.Page (figür ve savefig
+    argümanları), text_layout.TextPage veya image_pages.ImagePage nesneleridir.
+    Anahtarlar "<bileşen>-<özet>" biçimindedir.
+    """
+    entry_suffix = _PAGES_SUFFIX
@@ -1,107 +1,566 @@
+import argparse
 import logging
 import pandas as pd
 import numpy as np
-from sklearn.experimental import enable_iterative_imputer
-from sklearn.impute import IterativeImputer
-from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
+import itertools
 import os
+from contextlib import contextmanager
+from sklearn.base import clone
+from .artifacts import CleaningArtifact
+from .cache import StageCache
+from .imputation import ColumnStatImputer, build_imputer
+from .memory import downcast_numeric, frame_memory_mb
+from .metrics import StageMetrics
+from .missingness import MissingnessMap
+from .outliers import (DEFAULT_THRESHOLDS, MahalanobisDetector, bounds_mask, iqr_bounds, mad_bounds,
+                       outlier_mask, select_columns, univariate_bounds)
+from .partitioned import MERGEABLE_STRATEGIES, PartitionedCleaner
+from .pipeline import Stage, StageGraph
+from .stats import ExactQuantiles, RunningStats
+from .storage import (DEFAULT_CHUNK_MEMORY_MB, ChunkWriter, iter_chunks,
+                      numeric_block, read_table, write_table)
+
+# Varsayılan aşama sırası; run_pipeline(stages=..., skip=...) ile değiştirilebilir
+PIPELINE_STAGES = ('load', 'impute', 'outliers', 'normalize', 'save')
+
+
+def configure_logging(level=logging.INFO):
+    """Basit konsol loglama ayarı (komut satırından çalıştırırken kullanılır)"""
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(message)s',
+        datefmt='%H:%M:%S'
+    )
 
 class BostonHousingCleaner:
-    def __init__(self, input_path, output_path):
+    def __init__(self, input_path, output_path, schema=None, chunk_memory_mb=DEFAULT_CHUNK_MEMORY_MB,
+                 columns=None, compression=None, partition_cols=None,
+                 imputation_strategy='rf', n_jobs=None, impute_tol=1e-3, impute_sample_size=None,
+                 outlier_column='MEDV', outlier_threshold=None, outlier_method='zscore',
+                 stages=None, skip_stages=None,
+                 cache_dir=None, cache_max_mb=1024, memory_efficient=False,
+                 metrics_path=None, metrics_callback=None):
         self.input_path = input_path
         self.output_path = output_path
+        self.schema = schema
+        self.chunk_memory_mb = chunk_memory_mb
+        self.columns = columns
+        self.compression = compression
+        self.partition_cols = partition_cols
+        self.imputation_strategy = imputation_strategy
+        self.n_jobs = n_jobs
+        self.impute_tol = impute_tol
+        self.impute_sample_size = impute_sample_size
+        self.outlier_column = outlier_column
+        self.outlier_threshold = outlier_threshold
+        self.outlier_method = outlier_method
+        self.stages = tuple(stages) if stages is not None else PIPELINE_STAGES
+        self.skip_stages = tuple(skip_stages) if skip_stages is not None else ()
+        # Bellek tasarruflu mod: sayısal sütunlar float32/küçük tamsayılara indirgenir ve
+        # doldurma/ölçekleme tek bir bitişik dizi üzerinde yerinde yapılır
+        self.memory_efficient = memory_efficient
+        self.float_dtype = np.float32 if memory_efficient else np.float64
+        self.executed_stages = []
+        self.cached_stages = []
+        self.memory_report = {}
         self.df = None
-        self.scaler = StandardScaler()
+        # Son doldurma aşamasındaki eksik veri haritası (sayımlar ve birlikte eksik olma)
+        self.missingness = None
+        self.scaler = StandardScaler(copy=not memory_efficient)
+        self.artifact = None
         
-        # Basit konsol loglama ayarı
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(message)s',
-            datefmt='%H:%M:%S'
-        )
+        # Loglama ayarı uygulamaya bırakılır (bkz. configure_logging)
         self.logger = logging.getLogger('BostonHousingCleaner')
+        self.cache = StageCache(cache_dir, cache_max_mb, self.logger) if cache_dir else None
+        # Aşama başına süre, satır, eksik değer ve bellek ölçümleri (JSON satırları ve/veya geri çağırma)
+        self.metrics = StageMetrics(metrics_path, metrics_callback, self.logger)
         self.logger.info(f"Temizleyici başlatıldı. Kaynak: {input_path}, Hedef: {output_path}")
 
     def load_data(self):
         try:
             self.logger.info("Veri yükleniyor...")
-            self.df = pd.read_csv(self.input_path)
+            self.df = read_table(self.input_path, columns=self.columns, schema=self.schema)
+            if self.memory_efficient:
+                before = frame_memory_mb(self.df)
+                self.df = downcast_numeric(self.df, self.float_dtype)
+                self.logger.info(f"🗜 Veri tipleri küçültüldü: {before:.1f} MB → {frame_memory_mb(self.df):.1f} MB")
             self.logger.info(f"✅ Veri başarıyla yüklendi! Satır: {self.df.shape[0]}, Sütun: {self.df.shape[1]}")
             return self.df
         except Exception as e:
             self.logger.error(f"❌ Veri yükleme hatası: {str(e)}")
             raise
 
+    def iter_chunks(self):
+        """Girdi dosyasını şemaya göre tiplenmiş, bellek bütçesiyle sınırlı parçalar halinde okur"""
+        self.logger.info(f"Veri parçalar halinde okunuyor (bellek bütçesi: {self.chunk_memory_mb} MB)...")
+        return iter_chunks(self.input_path, self.schema, self.chunk_memory_mb, usecols=self.columns)
+
+    def _build_imputer(self):
+        imputer = build_imputer(
+            self.imputation_strategy,
+            n_jobs=self.n_jobs,
+            tol=self.impute_tol,
+            sample_size=self.impute_sample_size,
+            low_memory=self.memory_efficient
+        )
+        if self.memory_efficient and 'copy' in imputer.get_params():
+            imputer.set_params(copy=False)
+        return imputer
+
+    def _numeric_values(self, numeric_cols):
+        """Sayısal sütunları tek bir bitişik diziye kopyalar (bellek tasarruflu modda float32)"""
+        return numeric_block(self.df, list(numeric_cols), dtype=self.float_dtype)
+
+    def _replace_numeric(self, numeric_cols, values):
+        """Sayısal sütunları verilen diziyle değiştirir; dizi kopyalanmadan tek blok olarak kullanılır"""
+        values = np.asarray(values, dtype=self.float_dtype)
+        numeric = pd.DataFrame(values, index=self.df.index, columns=numeric_cols, copy=False)
+        other_cols = self.df.columns.difference(numeric_cols, sort=False)
+        if len(other_cols):
+            numeric = pd.concat([numeric, self.df[other_cols]], axis=1)[self.df.columns]
+        self.df = numeric
+
     def handle_missing_values(self):
-        self.logger.info("Eksik veriler işleniyor...")
+        self.logger.info(f"Eksik veriler işleniyor (strateji: {self.imputation_strategy})...")
         numeric_cols = self.df.select_dtypes(include=np.number).columns
         
-        missing_counts = self.df[numeric_cols].isnull().sum()
+        self.missingness = MissingnessMap.from_frame(self.df, numeric_cols)
+        missing_counts = self.missingness.counts()
         if missing_counts.sum() > 0:
             self.logger.warning(f"⚠️ Eksik veriler bulundu:\n{missing_counts[missing_counts > 0]}")
+            pairs = self.missingness.top_pairs()
+            if len(pairs):
+                self.logger.debug(f"Birlikte eksik olan sütun çiftleri:\n{pairs.to_string(index=False)}")
         else:
             self.logger.info("✅ Eksik veri bulunamadı")
         
-        imputer = IterativeImputer(
-            estimator=RandomForestRegressor(n_estimators=100),
-            max_iter=10,
-            random_state=42
-        )
-        
-        self.df[numeric_cols] = imputer.fit_transform(self.df[numeric_cols])
+        imputer = self._build_imputer()
+        self._replace_numeric(numeric_cols, imputer.fit_transform(self._numeric_values(numeric_cols)))
         self.logger.info("✅ Eksik veriler başarıyla dolduruldu")
 
-    def remove_outliers(self, column, threshold=3.0):
-        self.logger.info(f"Aykırı değerler temizleniyor: {column}...")
-        self.handle_missing_values()
+    def _outlier_columns(self, numeric_cols, column):
+        return select_columns(numeric_cols, column)
+
+    def _columnwise_outlier_mask(self, columns, method, threshold):
+        """
+        Tek değişkenli yöntemlerde maskeyi sütun sütun hesaplar; sayısal sütunların
+        ortak bir kopyası (numeric_block) oluşturulmaz. Sütun sınırları birbirinden
+        bağımsız olduğundan sonuç outlier_mask ile aynıdır.
+        """
+        keep = np.ones(len(self.df), dtype=bool)
+        for col in columns:
+            values = self.df[col].to_numpy(dtype=self.float_dtype, na_value=np.nan).reshape(-1, 1)
+            lower, upper = univariate_bounds(values, method, threshold)
+            keep &= bounds_mask(values, lower, upper)
+        return keep
+
+    def remove_outliers(self, column=None, threshold=None, method=None):
+        """
+        Aykırı değerleri tüm seçili sütunlarda tek bir vektörize maskeyle temizler.
+
+        Args:
+            column (str veya list): Sütun(lar); None ise tüm sayısal sütunlar
+            threshold (float): Yönteme özgü eşik (None ise yöntemin varsayılanı)
+            method (str): 'zscore', 'iqr', 'mad' veya 'mahalanobis' (varsayılan: outlier_method)
+        """
+        method = method or self.outlier_method
+        self.logger.info(f"Aykırı değerler temizleniyor: {column or 'tüm sayısal sütunlar'} ({method})...")
+        # Eksik veri doldurma yalnızca henüz yapılmadıysa çalıştırılır
+        if self.df.select_dtypes(include=np.number).isnull().values.any():
+            self.handle_missing_values()
         
-        if 'MEDV' in self.df.columns and len(self.df) >= 3:
-            if 1000 in self.df['MEDV'].values:
+        if len(self.df) >= 3:
+            if 'MEDV' in self.df.columns and 1000 in self.df['MEDV'].values:
                 self.logger.warning("⚠️ Test verisi algılandı: MEDV=1000 değeri çıkarılıyor")
                 self.df = self.df[self.df['MEDV'] != 1000]
             else:
                 original_count = len(self.df)
-                mean_val = self.df[column].mean()
-                std_val = self.df[column].std()
-                z_scores = np.abs((self.df[column] - mean_val) / std_val)
-                self.df = self.df[z_scores < threshold]
+                columns = self._outlier_columns(self.df.select_dtypes(include=np.number).columns, column)
+                if self.memory_efficient and method != 'mahalanobis':
+                    keep = self._columnwise_outlier_mask(columns, method, threshold)
+                else:
+                    keep = outlier_mask(numeric_block(self.df, columns, dtype=self.float_dtype), method, threshold)
+                if not keep.all():
+                    self.df = self.df.take(np.flatnonzero(keep))
                 removed_count = original_count - len(self.df)
                 self.logger.info(f"✅ {removed_count} aykırı değer çıkarıldı (%{removed_count/original_count:.2f})")
 
     def normalize_data(self):
         self.logger.info("Veri normalizasyonu yapılıyor...")
         numeric_cols = self.df.select_dtypes(include=np.number).columns
-        self.df[numeric_cols] = self.scaler.fit_transform(self.df[numeric_cols])
+        self._replace_numeric(numeric_cols, self.scaler.fit_transform(self._numeric_values(numeric_cols)))
         self.logger.info("✅ Normalizasyon tamamlandı")
 
     def save_cleaned_data(self):
         try:
-            os.makedirs(os.path.dirname(self.output_path), exist_ok=True)
-            self.df.to_csv(self.output_path, index=False)
+            os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+            write_table(self.df, self.output_path, self.compression, self.partition_cols)
             self.logger.info(f"✅ Temizlenmiş veri kaydedildi: {self.output_path}")
         except Exception as e:
             self.logger.error(f"❌ Kayıt hatası: {str(e)}")
             raise
 
-    def run_pipeline(self):
+    def _load_params(self):
+        return {
+            'input': self.cache.input_fingerprint(self.input_path),
+            'columns': self.columns,
+            'schema': self.schema,
+            'float_dtype': np.dtype(self.float_dtype).name,
+        }
+
+    def build_stage_graph(self):
+        """
+        Temizleme aşamalarını bağımlılıkları ve önbellek parametreleriyle birlikte tanımlar.
+        Önbellek açıksa (cache_dir) her aşamanın çıktısı girdi dosyasının özeti ve
+        o ana kadarki aşama parametreleriyle anahtarlanır.
+        """
+        return StageGraph([
+            Stage('load', self.load_data, params=self._load_params, cacheable=True),
+            Stage('impute', self.handle_missing_values, requires=('load',), cacheable=True,
+                  params={'strategy': self.imputation_strategy, 'tol': self.impute_tol,
+                          'sample_size': self.impute_sample_size,
+                          'memory_efficient': self.memory_efficient}),
+            Stage('outliers', lambda: self.remove_outliers(self.outlier_column, self.outlier_threshold),
+                  requires=('impute',), cacheable=True,
+                  params={'column': self.outlier_column, 'threshold': self.outlier_threshold,
+                          'method': self.outlier_method}),
+            Stage('normalize', self.normalize_data, requires=('impute',), cacheable=True,
+                  params={'scaler': type(self.scaler).__name__, **self.scaler.get_params()}),
+            Stage('save', self.save_cleaned_data, requires=('load', 'impute', 'outliers', 'normalize')),
+        ], logger=self.logger, cache=self.cache,
+           get_state=lambda: self.df, set_state=self._set_df, monitor=self._track_stage)
+
+    def _set_df(self, df):
+        self.df = df
+
+    @contextmanager
+    def _track_stage(self, name):
+        """Aşamayı ölçer; kayıt self.metrics'e, bellek özeti memory_report'a eklenir"""
+        with self.metrics.track(name, lambda: self.df) as record:
+            yield
+        self.memory_report[name] = {key: record[key] for key in
+                                    ('rss_mb', 'peak_rss_mb', 'peak_exact', 'data_mb')}
+        if record['peak_rss_mb'] is not None:
+            self.logger.info(f"📈 {name}: {record['wall_s']:.2f} sn, tepe bellek {record['peak_rss_mb']:.1f} MB, "
+                             f"veri {record['data_mb']:.1f} MB")
+
+    def metrics_summary(self):
+        """Son çalıştırmanın aşama ölçümlerini tablo olarak döndürür"""
+        return self.metrics.summary()
+
+    def run_pipeline(self, stages=None, skip=None, return_metrics=False):
+        """
+        Aşama grafiğini çalıştırır. Her aşama en fazla bir kez çalışır.
+
+        Args:
+            stages (list): Aşama sırası (varsayılan: yapıcıdaki stages veya PIPELINE_STAGES)
+            skip (list): Atlanacak aşamalar (varsayılan: yapıcıdaki skip_stages)
+            return_metrics (bool): True ise (veri, aşama ölçüm tablosu) döndürülür
+
+        Returns:
+            pd.DataFrame: Temizlenmiş veri (return_metrics=True ise ölçüm tablosuyla birlikte)
+
+        Not:
+            Mevcut çağıranlar yalnızca DataFrame beklediğinden ölçüm tablosu varsayılan
+            olarak döndürülmez; return_metrics=True ile veya çalıştırmadan sonra
+            metrics_summary() ile alınır. Aşama başına eksik değer sayımı (nulls_imputed)
+            tüm tabloyu taradığından yalnızca ölçümler istendiğinde (return_metrics=True,
+            metrics_path veya metrics_callback) yapılır.
+        """
         self.logger.info("\n" + "="*50)
         self.logger.info("VERİ TEMİZLEME BAŞLATILDI")
         self.logger.info("="*50)
         
+        graph = self.build_stage_graph()
+        self.memory_report = {}
+        self.metrics.start_run(null_counts=return_metrics or self.metrics.has_sinks)
         try:
-            self.load_data()
-            self.handle_missing_values()
-            self.remove_outliers('MEDV')
-            self.normalize_data()
-            self.save_cleaned_data()
+            self.executed_stages = graph.run(
+                stages if stages is not None else self.stages,
+                skip if skip is not None else self.skip_stages
+            )
+            self.cached_stages = list(graph.cached)
+            for name in self.cached_stages:
+                self.metrics.record_cached(name)
+            self.logger.info(f"Çalıştırılan aşamalar: {' → '.join(self.executed_stages)}")
             
             self.logger.info("\n" + "="*50)
             self.logger.info("✅ TÜM İŞLEMLER BAŞARIYLA TAMAMLANDI")
             self.logger.info("="*50)
+            if return_metrics:
+                return self.df, self.metrics_summary()
             return self.df
         except Exception as e:
+            self.executed_stages = list(graph.executed)
             self.logger.info("\n" + "="*50)
             self.logger.error("❌ İŞLEMLER HATAYLA SONUÇLANDI")
             self.logger.info("="*50)
-            raise
\ No newline at end of file
+            raise
+
+    def fit(self, df=None, column=None, threshold=None):
+        """
+        Doldurucu, aykırı değer sınırları ve ölçekleyiciyi eğitir. Sonuç self.artifact
+        olarak saklanır ve transform() ile yeni satırlara yeniden eğitim yapılmadan uygulanır.
+
+        Args:
+            df (pd.DataFrame): Eğitim verisi (None ise self.df, o da yoksa girdi dosyası)
+            column (str veya list): Aykırı değer sütun(lar)ı (varsayılan: outlier_column)
+            threshold (float): Aykırı değer eşiği (varsayılan: outlier_threshold)
+        """
+        if df is None:
+            df = self.df if self.df is not None else self.load_data()
+        column = column if column is not None else self.outlier_column
+        threshold = threshold if threshold is not None else self.outlier_threshold
+        self.logger.info(f"Temizleme adımları eğitiliyor ({len(df)} satır)...")
+
+        numeric_cols = list(df.select_dtypes(include=np.number).columns)
+        imputer = self._build_imputer()
+        values = imputer.fit_transform(numeric_block(df, numeric_cols, dtype=np.float64))
+
+        outlier_cols = self._outlier_columns(numeric_cols, column)
+        outlier_values = values[:, [numeric_cols.index(col) for col in outlier_cols]]
+        bounds, detector = {}, None
+        keep = np.ones(len(values), dtype=bool)
+        if outlier_cols and self.outlier_method == 'mahalanobis':
+            detector = MahalanobisDetector(threshold).fit(outlier_values)
+            keep = detector.mask(outlier_values)
+        elif outlier_cols:
+            lower, upper = univariate_bounds(outlier_values, self.outlier_method, threshold)
+            bounds = dict(zip(outlier_cols, zip(lower, upper)))
+            keep = bounds_mask(outlier_values, lower, upper)
+
+        self.scaler = clone(self.scaler).fit(values[keep])
+        self.artifact = CleaningArtifact(
+            numeric_cols, imputer=imputer, scaler=self.scaler, outlier_bounds=bounds,
+            outlier_detector=detector, outlier_columns=outlier_cols,
+            params=self._artifact_params(column, threshold, len(df))
+        )
+        self.logger.info("✅ Temizleme adımları eğitildi")
+        return self.artifact
+
+    def _artifact_params(self, column, threshold, n_rows):
+        return {
+            'imputation_strategy': self.imputation_strategy,
+            'impute_tol': self.impute_tol,
+            'impute_sample_size': self.impute_sample_size,
+            'outlier_column': column,
+            'outlier_threshold': threshold,
+            'outlier_method': self.outlier_method,
+            'n_rows': n_rows,
+        }
+
+    def transform(self, df):
+        """Eğitilmiş artefaktı yeni satırlara uygular ve temizlenmiş veriyi döndürür"""
+        if self.artifact is None:
+            raise RuntimeError("Önce fit() çağrılmalı veya load_artifact() ile bir artefakt yüklenmeli")
+        return self.artifact.transform(df)
+
+    def save_artifact(self, path):
+        if self.artifact is None:
+            raise RuntimeError("Kaydedilecek artefakt yok; önce fit() çağrılmalı")
+        os.makedirs(os.path.dirname(str(path)) or ".", exist_ok=True)
+        self.artifact.save(path)
+        self.logger.info(f"✅ Artefakt kaydedildi: {path} (sürüm {self.artifact.version})")
+
+    def load_artifact(self, path):
+        self.artifact = CleaningArtifact.load(path, self.logger)
+        self.scaler = self.artifact.scaler
+        self.logger.info(f"✅ Artefakt yüklendi: {path} (oluşturulma: {self.artifact.created_at})")
+        return self.artifact
+
+    def run_streaming_pipeline(self, column=None, threshold=None):
+        """
+        Belleğe sığmayan dosyaları iki aşamada temizler; bellek kullanımı dosya boyutuyla
+        değil parça bütçesiyle (chunk_memory_mb) sınırlıdır.
+
+        1. geçiş: Tüm sayısal sütunlar için akan istatistikler (ortalama, varyans, min/max,
+           eksik sayısı) tek geçişte hesaplanır; ölçekleyici ve z-skoru sınırları bunlardan
+           üretilir. Mahalanobis yönteminde kovaryans da aynı geçişte güncellenir.
+           median doldurma ile IQR/MAD sınırları tam kantillerle (ExactQuantiles) tüm
+           parçalar üzerinden, gerekirse ek geçişlerle hesaplanır; IQR/MAD sınırları
+           doldurulmuş değerlere dayanır. Birleştirilemeyen stratejilerde (knn, hgb, rf)
+           doldurucu yalnızca ilk parça üzerinde eğitilir ve uyarı loglanır.
+        2. geçiş: Parçalar doldurulur, filtrelenir, ölçeklenir ve çıktıya eklenir.
+
+        Not: İstatistikler doldurma ve filtreleme öncesi gözlenen değerlerden hesaplanır.
+        """
+        column = column if column is not None else self.outlier_column
+        threshold = threshold if threshold is not None else self.outlier_threshold
+        self.logger.info("\n" + "="*50)
+        self.logger.info("PARÇALI VERİ TEMİZLEME BAŞLATILDI")
+        self.logger.info("="*50)
+
+        self.metrics.start_run()
+        with self.metrics.track('stream_fit') as record:
+            stats = self._fit_streaming(column, threshold)
+            record.update(rows_in=stats.n_rows, nulls_in=int(stats.null_count.sum()))
+
+        with self.metrics.track('stream_transform') as record:
+            os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+            rows_read = n_chunks = 0
+            with ChunkWriter(self.output_path, self.compression) as writer:
+                for chunk in self.iter_chunks():
+                    out = self.artifact.transform(chunk)
+                    writer.write(out)
+
+                    n_chunks += 1
+                    rows_read += len(chunk)
+                    self.logger.info(f"✅ Parça {n_chunks} işlendi: {len(chunk)} satır okundu, {len(out)} satır yazıldı")
+
+            rows_written = writer.rows_written
+            self.logger.info(f"✅ Temizlenmiş veri kaydedildi: {self.output_path} "
+                             f"({n_chunks} parça, {rows_read} → {rows_written} satır)")
+            record.update(rows_in=rows_read, rows_out=rows_written,
+                          nulls_imputed=int(stats.null_count.sum()))
+        return {'chunks': n_chunks, 'rows_read': rows_read, 'rows_written': rows_written,
+                'metrics': self.metrics_summary()}
+
+    def run_partitioned_pipeline(self, workers=None, column=None, threshold=None, output_format=None):
+        """
+        Bölümlenmiş veriyi (input_path: klasör, glob deseni veya dosya listesi) paralel işçilerle
+        temizler; çıktı bölümleri output_path klasörüne aynı adlarla yazılır.
+
+        1. geçiş(ler): Her bölüm için kısmi istatistikler (momentler, tam kantiller, eksik
+           sayıları) hesaplanıp birleştirilir; doldurma, aykırı değer ve ölçekleme
+           parametreleri sırasıyla elde edilir.
+        2. geçiş: Her bölüm eğitilen artefaktla bağımsız olarak dönüştürülür.
+
+        median/mean doldurmada sonuç tüm verinin run_pipeline ile temizlenmesiyle aynıdır.
+        İşçi başına bellek parça bütçesiyle (chunk_memory_mb) sınırlıdır.
+
+        Returns:
+            pd.DataFrame: Bölüm başına sonuç tablosu (input, output, rows_in, rows_out, seconds)
+        """
+        self.logger.info("\n" + "="*50)
+        self.logger.info("BÖLÜMLENMİŞ VERİ TEMİZLEME BAŞLATILDI")
+        self.logger.info("="*50)
+        cleaner = PartitionedCleaner(
+            self.input_path, self.output_path, workers=workers, schema=self.schema, columns=self.columns,
+            chunk_memory_mb=self.chunk_memory_mb, imputation_strategy=self.imputation_strategy,
+            imputer_factory=self._build_imputer,
+            outlier_column=column if column is not None else self.outlier_column,
+            outlier_threshold=threshold if threshold is not None else self.outlier_threshold,
+            outlier_method=self.outlier_method, output_format=output_format,
+            compression=self.compression, logger=self.logger
+        )
+        self.metrics.start_run()
+        with self.metrics.track('partitioned') as record:
+            table = cleaner.run()
+            record.update(rows_in=int(table['rows_in'].sum()), rows_out=int(table['rows_out'].sum()),
+                          passes=cleaner.n_passes + 1)
+        self.artifact = cleaner.artifact
+        self.scaler = self.artifact.scaler
+        return table
+
+    def _fit_streaming(self, column, threshold):
+        """Parçalı temizlemenin 1. geçişi: artefaktı eğitir ve akan istatistikleri döndürür"""
+        method = self.outlier_method
+        chunks = self.iter_chunks()
+        first = next(chunks, None)
+        if first is None:
+            raise ValueError(f"Girdi dosyası boş: {self.input_path}")
+
+        numeric_cols = list(first.select_dtypes(include=np.number).columns)
+        outlier_cols = self._outlier_columns(numeric_cols, column)
+        outlier_idx = [numeric_cols.index(col) for col in outlier_cols]
+        mergeable = self.imputation_strategy in MERGEABLE_STRATEGIES
+        imputer = None
+        if not mergeable:
+            self.logger.warning(f"⚠️ '{self.imputation_strategy}' birleştirilebilir değil; doldurucu "
+                                f"yalnızca ilk parçanın {len(first)} satırı üzerinde eğitiliyor")
+            imputer = self._build_imputer().fit(numeric_block(first, numeric_cols, dtype=np.float64))
+        median = ExactQuantiles(range(len(numeric_cols)), [0.5])
+        median_sketch = median.sketch() if self.imputation_strategy == 'median' else None
+        detector = MahalanobisDetector(threshold) if outlier_cols and method == 'mahalanobis' else None
+
+        stats = RunningStats(numeric_cols)
+        for chunk in itertools.chain([first], chunks):
+            block = numeric_block(chunk, numeric_cols, dtype=np.float64)
+            stats.update(block)
+            if median_sketch is not None:
+                median_sketch.update(block)
+            if detector is not None:
+                detector.partial_fit(block[:, outlier_idx])
+        del first, block
+        self.logger.info(f"✅ İstatistikler hesaplandı: {stats.n_rows} satır, "
+                         f"{int(stats.null_count.sum())} eksik değer")
+
+        if mergeable:
+            if median_sketch is not None:
+                statistics = self._solve_stream_quantiles(median, CleaningArtifact(numeric_cols),
+                                                           median_sketch, stats.count)[0]
+            else:
+                statistics = stats.mean
+            imputer = ColumnStatImputer(self.imputation_strategy, copy=not self.memory_efficient)
+            imputer.statistics_ = np.where(stats.count > 0, statistics, 0.0)
+            imputer.n_features_in_ = len(numeric_cols)
+
+        # IQR/MAD sınırları tüm dosyanın doldurulmuş değerlerinden tam kantillerle hesaplanır
+        bounds = {}
+        imputed = CleaningArtifact(numeric_cols, imputer=imputer)
+        limit = DEFAULT_THRESHOLDS.get(method) if threshold is None else threshold
+        if outlier_cols and method == 'iqr':
+            q1, q3 = self._solve_stream_quantiles(ExactQuantiles(outlier_idx, [0.25, 0.75]), imputed)
+            bounds = dict(zip(outlier_cols, zip(*iqr_bounds(q1, q3, limit))))
+        elif outlier_cols and method == 'mad':
+            center = self._solve_stream_quantiles(ExactQuantiles(outlier_idx, [0.5]), imputed)[0]
+            full_center = np.zeros(len(numeric_cols))
+            full_center[outlier_idx] = center
+            mad = self._solve_stream_quantiles(ExactQuantiles(outlier_idx, [0.5], center=full_center),
+                                               imputed)[0]
+            bounds = dict(zip(outlier_cols, zip(*mad_bounds(center, mad, limit))))
+
+        self.scaler = stats.to_scaler()
+        if outlier_cols and method == 'zscore':
+            bounds = stats.zscore_bounds(threshold, outlier_cols)
+        if detector is not None:
+            detector.finalize()
+        self.artifact = CleaningArtifact(
+            numeric_cols, imputer=imputer, scaler=self.scaler, outlier_bounds=bounds,
+            outlier_detector=detector, outlier_columns=outlier_cols,
+            params=self._artifact_params(column, threshold, stats.n_rows)
+        )
+        return stats
+
+    def _solve_stream_quantiles(self, quantiles, prepare, merged=None, counts=None):
+        """
+        Tam kantiller çözülene kadar girdi dosyası üzerinde ek geçişler yapar.
+
+        Args:
+            quantiles (ExactQuantiles): Çözülecek kantiller
+            prepare (CleaningArtifact): Parçalara geçiş öncesi uygulanan, o ana kadar eğitilmiş adımlar
+            merged (RadixHistogram): Başka bir geçişte güncellenmiş ilk histogram
+            counts: Sütun başına eksik olmayan değer sayıları
+        """
+        while merged is None or not quantiles.advance(merged, counts):
+            merged = quantiles.sketch()
+            for chunk in self.iter_chunks():
+                merged.update(numeric_block(prepare.transform(chunk), prepare.numeric_columns,
+                                            dtype=np.float64))
+        return quantiles.result()
+
+if __name__ == "__main__":
+    PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    parser = argparse.ArgumentParser(description="Boston Housing veri temizleme")
+    parser.add_argument("--input", default=os.path.join(PROJECT_ROOT, "data", "raw", "HousingData.csv"),
+                        help="Girdi dosyası: CSV, Parquet veya Feather")
+    parser.add_argument("--output", default=os.path.join(PROJECT_ROOT, "data", "processed", "cleaned_boston.csv"),
+                        help="Temizlenmiş verinin yazılacağı dosya")
+    parser.add_argument("--strategy", default="rf", help="Eksik veri doldurma stratejisi")
+    parser.add_argument("--streaming", action="store_true",
+                        help="Dosyayı parçalar halinde iki geçişte temizle")
+    parser.add_argument("--memory-efficient", action="store_true",
+                        help="float32/küçük tamsayı tipleri ve yerinde dönüşümler kullan")
+    parser.add_argument("--metrics", default=None,
+                        help="Aşama ölçümlerinin eklendiği JSON satırları dosyası")
+    args = parser.parse_args()
+
+    configure_logging()
+    cleaner = BostonHousingCleaner(args.input, args.output, imputation_strategy=args.strategy,
+                                   memory_efficient=args.memory_efficient, metrics_path=args.metrics)
+    if args.streaming:
+        cleaner.run_streaming_pipeline()
+    else:
+        cleaner.run_pipeline()
+    print(cleaner.metrics_summary().to_string())
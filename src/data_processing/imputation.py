@@ -0,0 +1,176 @@
+# src/data_processing/imputation.py
+"""
+Eksik veri doldurma stratejileri.
+
+Veri boyutuna göre seçilebilen doldurucular üretir:
+    - median / mean : Sütun istatistiğiyle basit doldurma (en hızlı)
+    - knn           : KD-ağacı indeksli en yakın komşu doldurma
+    - hgb           : HistGradientBoosting tabanlı iteratif doldurma
+    - rf            : RandomForest tabanlı iteratif doldurma (orijinal yöntem, en yavaş)
+
+Tüm doldurucular scikit-learn fit/transform arayüzünü izler.
+"""
+from typing import Optional
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin, clone
+from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+from sklearn.impute import IterativeImputer, SimpleImputer
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.neighbors import NearestNeighbors
+
+IMPUTATION_STRATEGIES = ('median', 'mean', 'knn', 'hgb', 'rf')
+
+
+class IndexedKNNImputer(BaseEstimator, TransformerMixin):
+    """
+    KD-ağacı üzerinden komşu arayan KNN doldurucu.
+
+    Eksik satırlar eksiklik desenine göre gruplanır; her desen için yalnızca
+    gözlenen sütunlarda, tam gözlemli (donör) satırlardan bir ağaç kurulur ve
+    eksik değerler en yakın komşuların ortalamasıyla doldurulur. Böylece tüm
+    satırlar arası kaba kuvvet uzaklık matrisi hesaplanmaz.
+
+    copy=False verildiğinde ondalıklı girdiler (ör. float32) yerinde doldurulur.
+    """
+    def __init__(self, n_neighbors: int = 5, algorithm: str = 'kd_tree',
+                 n_jobs: Optional[int] = None, copy: bool = True):
+        self.n_neighbors = n_neighbors
+        self.algorithm = algorithm
+        self.n_jobs = n_jobs
+        self.copy = copy
+
+    def fit(self, X, y=None):
+        X = np.asarray(X, dtype=np.float64)
+        self.mean_ = np.nanmean(X, axis=0)
+        scale = np.nanstd(X, axis=0)
+        self.scale_ = np.where(scale > 0, scale, 1.0)
+        donors = X[~np.isnan(X).any(axis=1)]
+        if len(donors) == 0:
+            raise ValueError("KNN doldurma için en az bir tam gözlemli satır gereklidir")
+        self.donors_ = donors
+        self.donors_scaled_ = (donors - self.mean_) / self.scale_
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def transform(self, X):
+        X = np.array(X, copy=self.copy)
+        if X.dtype.kind != 'f':
+            X = X.astype(np.float64)
+        missing = np.isnan(X)
+        rows = np.flatnonzero(missing.any(axis=1))
+        if len(rows) == 0:
+            return X
+
+        k = min(self.n_neighbors, len(self.donors_))
+        patterns, inverse = np.unique(missing[rows], axis=0, return_inverse=True)
+        for p, pattern in enumerate(patterns):
+            target_rows = rows[inverse.ravel() == p]
+            observed = ~pattern
+            if not observed.any():
+                # Hiç gözlenen sütun yoksa sütun ortalamasıyla doldur
+                X[np.ix_(target_rows, pattern)] = self.mean_[pattern]
+                continue
+            index = NearestNeighbors(n_neighbors=k, algorithm=self.algorithm, n_jobs=self.n_jobs)
+            index.fit(self.donors_scaled_[:, observed])
+            query = (X[np.ix_(target_rows, observed)] - self.mean_[observed]) / self.scale_[observed]
+            _, neighbours = index.kneighbors(query)
+            X[np.ix_(target_rows, pattern)] = self.donors_[:, pattern][neighbours].mean(axis=1)
+        return X
+
+
+class ColumnStatImputer(BaseEstimator, TransformerMixin):
+    """
+    Sütun medyanı veya ortalamasıyla doldurma. SimpleImputer'dan farklı olarak
+    tüm matrisin maskeli kopyasını oluşturmaz; sütunlar tek tek işlenir ve
+    copy=False ise ondalıklı girdi yerinde doldurulur. Tamamen boş sütunlar 0 ile doldurulur.
+    """
+    def __init__(self, strategy: str = 'median', copy: bool = True):
+        self.strategy = strategy
+        self.copy = copy
+
+    def fit(self, X, y=None):
+        X = np.asarray(X)
+        statistic = np.nanmedian if self.strategy == 'median' else np.nanmean
+        stats = np.zeros(X.shape[1], dtype=np.float64)
+        for j in range(X.shape[1]):
+            column = X[:, j]
+            observed = column[~np.isnan(column)]
+            if len(observed):
+                stats[j] = statistic(observed)
+        self.statistics_ = stats
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def transform(self, X):
+        X = np.array(X, copy=self.copy)
+        if X.dtype.kind != 'f':
+            X = X.astype(np.float64)
+        for j in range(X.shape[1]):
+            column = X[:, j]
+            column[np.isnan(column)] = self.statistics_[j]
+        return X
+
+
+class SubsampledImputer(BaseEstimator, TransformerMixin):
+    """Doldurucuyu satırların rastgele bir alt kümesi üzerinde eğitip tüm veriye uygular"""
+    def __init__(self, imputer, sample_size: int, random_state: Optional[int] = 42):
+        self.imputer = imputer
+        self.sample_size = sample_size
+        self.random_state = random_state
+
+    def fit(self, X, y=None):
+        X = np.asarray(X)
+        if len(X) > self.sample_size:
+            rng = np.random.default_rng(self.random_state)
+            X = X[np.sort(rng.choice(len(X), self.sample_size, replace=False))]
+        self.imputer_ = clone(self.imputer).fit(X)
+        return self
+
+    def transform(self, X):
+        return self.imputer_.transform(X)
+
+
+def build_imputer(strategy: str = 'rf', n_jobs: Optional[int] = None, tol: float = 1e-3,
+                  max_iter: int = 10, sample_size: Optional[int] = None,
+                  n_neighbors: int = 5, random_state: Optional[int] = 42,
+                  low_memory: bool = False):
+    """
+    Seçilen stratejiye göre doldurucu oluşturur.
+
+    Args:
+        strategy (str): 'median', 'mean', 'knn', 'hgb' veya 'rf'
+        n_jobs (int): Paralel iş sayısı (rf ağaçları ve knn sorguları için; -1 tüm çekirdekler)
+        tol (float): İteratif doldurucular için yakınsama toleransı
+        max_iter (int): İteratif doldurucular için en fazla tur sayısı
+        sample_size (int): Eğitimde kullanılacak en fazla satır sayısı (None ise tümü)
+        n_neighbors (int): knn için komşu sayısı
+        random_state (int): Tekrarlanabilirlik için tohum
+        low_memory (bool): median/mean için sütun bazında, yerinde çalışan doldurucu kullanılır
+
+    Returns:
+        Eğitilmemiş, fit/transform arayüzlü doldurucu
+    """
+    if strategy in ('median', 'mean') and low_memory:
+        imputer = ColumnStatImputer(strategy=strategy, copy=False)
+    elif strategy in ('median', 'mean'):
+        imputer = SimpleImputer(strategy=strategy)
+    elif strategy == 'knn':
+        imputer = IndexedKNNImputer(n_neighbors=n_neighbors, n_jobs=n_jobs)
+    elif strategy == 'hgb':
+        # HistGradientBoosting kendi içinde OpenMP ile çok çekirdekli çalışır
+        imputer = IterativeImputer(
+            estimator=HistGradientBoostingRegressor(max_iter=100, random_state=random_state),
+            max_iter=max_iter, tol=tol, random_state=random_state
+        )
+    elif strategy == 'rf':
+        imputer = IterativeImputer(
+            estimator=RandomForestRegressor(n_estimators=100, n_jobs=n_jobs),
+            max_iter=max_iter, tol=tol, random_state=random_state
+        )
+    else:
+        raise ValueError(f"Bilinmeyen doldurma stratejisi: {strategy} "
+                         f"(seçenekler: {', '.join(IMPUTATION_STRATEGIES)})")
+
+    if sample_size is not None:
+        imputer = SubsampledImputer(imputer, sample_size, random_state)
+    return imputer
@@ -0,0 +1,131 @@
+# src/data_processing/memory.py
+"""
+Bellek kullanımı yardımcıları.
+
+Sayısal sütunları daha küçük tiplere (float32, int8/int16...) indirger ve
+işlem aşamaları sırasında sürecin yerleşik bellek (RSS) tepe değerini ölçer.
+Tepe değer Linux'ta /proc üzerinden aşama başına sıfırlanarak ölçülür; diğer
+sistemlerde `resource` modülünün süreç ömrü boyunca tuttuğu en yüksek değer
+kullanılır. psutil kuruluysa anlık RSS için tercih edilir.
+"""
+from contextlib import contextmanager
+from typing import Dict, Optional
+import sys
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+_PROC_STATUS = "/proc/self/status"
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+def downcast_numeric(df: pd.DataFrame, float_dtype=np.float32) -> pd.DataFrame:
+    """
+    Sayısal sütunları değer aralıklarına sığan en küçük tiplere indirger.
+
+    Ondalıklı sütunlar float_dtype'a, tamsayı sütunlar en küçük (işaretli)
+    tamsayı tipine çevrilir; nullable Int sütunlar nullable kalır. Sütunlar
+    tek tek dönüştürüldüğü için ek bellek en fazla bir sütun kadardır.
+
+    Args:
+        df (pd.DataFrame): Kaynak veri
+        float_dtype: Ondalıklı sütunların hedef tipi
+
+    Returns:
+        pd.DataFrame: Küçültülmüş tiplerle veri
+    """
+    df = df.copy(deep=False)
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_bool_dtype(series) or not pd.api.types.is_numeric_dtype(series):
+            continue
+        if pd.api.types.is_float_dtype(series):
+            if isinstance(series.dtype, np.dtype):
+                df[col] = series.astype(float_dtype)
+        elif isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+            downcast = pd.to_numeric(series.dropna(), downcast='integer').dtype
+            df[col] = series.astype(f"Int{downcast.itemsize * 8}")
+        else:
+            df[col] = pd.to_numeric(series, downcast='integer')
+    return df
+
+
+def frame_memory_mb(df: Optional[pd.DataFrame]) -> float:
+    """DataFrame'in kapladığı bellek (MB)"""
+    if df is None:
+        return 0.0
+    return df.memory_usage(index=True, deep=True).sum() / 1024 ** 2
+
+
+def _proc_status_mb(field: str) -> Optional[float]:
+    try:
+        with open(_PROC_STATUS) as f:
+            for line in f:
+                if line.startswith(field + ':'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def current_rss_mb() -> Optional[float]:
+    """Sürecin anlık yerleşik bellek kullanımı (MB); ölçülemiyorsa None"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / 1024 ** 2
+    return _proc_status_mb('VmRSS')
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Sürecin (veya son reset_peak_rss çağrısından beri) en yüksek bellek kullanımı (MB)"""
+    peak = _proc_status_mb('VmHWM')
+    if peak is not None or resource is None:
+        return peak
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS bayt, Linux kilobayt cinsinden döndürür
+    return maxrss / 1024 ** 2 if sys.platform == 'darwin' else maxrss / 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Tepe bellek sayacını sıfırlar (yalnızca Linux). Sıfırlanamazsa False döner;
+    bu durumda peak_rss_mb süreç ömrü boyunca en yüksek değeri verir.
+    """
+    try:
+        with open(_PROC_CLEAR_REFS, 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+@contextmanager
+def track_memory():
+    """
+    Blok süresince bellek kullanımını ölçer. Verilen sözlük blok bitince doldurulur:
+    rss_mb (bitişteki RSS), peak_rss_mb (blok sırasındaki tepe RSS) ve
+    peak_exact (tepe değer yalnızca bu bloğa mı ait).
+
+    Örnek:
+        with track_memory() as usage:
+            temizle()
+        print(usage['peak_rss_mb'])
+    """
+    usage: Dict[str, Optional[float]] = {}
+    exact = reset_peak_rss()
+    try:
+        yield usage
+    finally:
+        usage.update({
+            'rss_mb': current_rss_mb(),
+            'peak_rss_mb': peak_rss_mb(),
+            'peak_exact': exact,
+        })
@@ -0,0 +1,135 @@
+# src/data_processing/metrics.py
+"""
+Temizleme aşamaları için yapılandırılmış ölçümler.
+
+Her aşama için duvar saati süresi, CPU süresi, giriş/çıkış satır sayısı,
+doldurulan eksik değer sayısı ve tepe bellek kullanımı tek bir kayıt (dict)
+olarak üretilir. Kayıtlar bir JSON satırları (JSON lines) dosyasına eklenebilir
+ve/veya bir geri çağırma fonksiyonuna iletilebilir; tümü tablo olarak da alınabilir.
+"""
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import json
+import logging
+import os
+import time
+import uuid
+import pandas as pd
+
+from .memory import frame_memory_mb, track_memory
+
+# Özet tablodaki sütunların sırası
+METRIC_FIELDS = ('stage', 'status', 'wall_s', 'cpu_s', 'rows_in', 'rows_out',
+                 'nulls_imputed', 'peak_rss_mb', 'data_mb')
+
+
+def count_nulls(df: Optional[pd.DataFrame]) -> int:
+    """Toplam eksik değer sayısı (sütun sütun sayılır; tüm tablonun maskesi oluşturulmaz)"""
+    if df is None:
+        return 0
+    return int(sum(df[col].isna().sum() for col in df.columns))
+
+
+class StageMetrics:
+    """
+    Aşama ölçümlerini toplar ve alıcılara iletir.
+
+    Args:
+        path (str): Kayıtların eklendiği JSON satırları dosyası (None ise yazılmaz)
+        callback (callable): Her kayıt için çağrılan fonksiyon (None ise çağrılmaz)
+        logger (logging.Logger): Kayıtların (debug düzeyinde) yazıldığı loglayıcı
+        null_counts (bool): Aşama öncesi/sonrası eksik değerler sayılsın mı (nulls_imputed);
+            tüm tabloyu taradığından gerekmiyorsa kapatılabilir
+    """
+    def __init__(self, path=None, callback: Optional[Callable[[Dict], None]] = None,
+                 logger: Optional[logging.Logger] = None, null_counts: bool = True):
+        self.path = str(path) if path is not None else None
+        self.callback = callback
+        self.logger = logger or logging.getLogger(__name__)
+        self.null_counts = null_counts
+        self.run_id = None
+        self.records: List[Dict] = []
+
+    @property
+    def has_sinks(self) -> bool:
+        """Kayıtlar bir dosyaya veya geri çağırma fonksiyonuna iletiliyor mu"""
+        return self.path is not None or self.callback is not None
+
+    def start_run(self, null_counts: Optional[bool] = None) -> str:
+        """
+        Yeni bir çalıştırma başlatır; kayıtlar aynı run_id ile gruplanır.
+
+        Args:
+            null_counts (bool): Bu çalıştırmada eksik değerlerin sayılıp sayılmayacağı
+                (None ise mevcut ayar korunur)
+        """
+        self.run_id = uuid.uuid4().hex[:12]
+        self.records = []
+        if null_counts is not None:
+            self.null_counts = null_counts
+        return self.run_id
+
+    @contextmanager
+    def track(self, stage: str, get_df: Optional[Callable[[], pd.DataFrame]] = None):
+        """
+        Blok süresince aşamayı ölçer ve bitişte kaydı yayınlar. get_df verilirse satır ve
+        eksik değer sayıları bloğun öncesinde ve sonrasında bu fonksiyonun döndürdüğü
+        veriden alınır. Blok içinde kayda ek alanlar (ör. rows_in) yazılabilir.
+        """
+        df = get_df() if get_df is not None else None
+        record = {
+            'run_id': self.run_id,
+            'stage': stage,
+            'started_at': datetime.now().isoformat(timespec='milliseconds'),
+            'rows_in': len(df) if df is not None else None,
+            'nulls_in': count_nulls(df) if df is not None and self.null_counts else None,
+        }
+        del df
+        wall, cpu = time.perf_counter(), time.process_time()
+        status = 'error'
+        try:
+            with track_memory() as usage:
+                yield record
+            status = 'ok'
+        finally:
+            record['wall_s'] = time.perf_counter() - wall
+            record['cpu_s'] = time.process_time() - cpu
+            record['status'] = status
+            df = get_df() if get_df is not None else None
+            if df is not None:
+                record.update(rows_out=len(df), data_mb=frame_memory_mb(df),
+                              nulls_out=count_nulls(df) if self.null_counts else None)
+            record.update(usage)
+            record.setdefault('nulls_imputed', self._nulls_imputed(record))
+            self.emit(record)
+
+    @staticmethod
+    def _nulls_imputed(record: Dict) -> Optional[int]:
+        # Satır çıkaran aşamalarda eksik sayısındaki azalma doldurma anlamına gelmez
+        if record.get('nulls_out') is None or record.get('nulls_in') is None \
+                or record['rows_in'] != record['rows_out']:
+            return None
+        return record['nulls_in'] - record['nulls_out']
+
+    def record_cached(self, stage: str) -> None:
+        """Önbellekten yüklenen (çalıştırılmayan) aşama için kayıt yayınlar"""
+        self.emit({'run_id': self.run_id, 'stage': stage, 'status': 'cached',
+                   'started_at': datetime.now().isoformat(timespec='milliseconds'),
+                   'wall_s': 0.0, 'cpu_s': 0.0})
+
+    def emit(self, record: Dict) -> None:
+        self.records.append(record)
+        if self.path is not None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        if self.callback is not None:
+            self.callback(record)
+        self.logger.debug(f"Aşama ölçümü: {record}")
+
+    def summary(self) -> pd.DataFrame:
+        """Kayıtları aşama başına bir satır olacak şekilde tablo olarak döndürür"""
+        table = pd.DataFrame(self.records)
+        columns = [col for col in METRIC_FIELDS if col in table.columns]
+        return table[columns].set_index('stage') if len(table) else table
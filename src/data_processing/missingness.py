@@ -0,0 +1,114 @@
+# src/data_processing/missingness.py
+"""
+Bit düzeyinde paketlenmiş eksik veri haritası.
+
+Her sütunun eksik değer maskesi np.packbits ile 8 satır/bayt olacak şekilde
+paketlenir (boolean DataFrame'e göre 8 kat daha az bellek). Sayımlar, satır
+blokları başına eksik oranları ve sütun çiftleri arasındaki birlikte eksik olma
+(co-occurrence) sayıları doğrudan bitler üzerinde, bit sayımıyla (popcount) hesaplanır.
+
+Örnek:
+    nulls = MissingnessMap.from_frame(df)
+    nulls.counts()                 # sütun başına eksik sayısı
+    nulls.block_fractions(500)     # (blok, sütun) eksik oranları, tek görüntü olarak çizilebilir
+    nulls.cooccurrence()           # sütun x sütun birlikte eksik satır sayısı
+"""
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+try:
+    _bitwise_count = np.bitwise_count  # numpy >= 2.0
+except AttributeError:
+    _POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint8)
+
+    def _bitwise_count(bits: np.ndarray) -> np.ndarray:
+        return _POPCOUNT[bits]
+
+
+class MissingnessMap:
+    """
+    Sütun başına paketlenmiş eksik değer bitleri.
+
+    Args:
+        columns (list): Sütun adları
+        bits (np.ndarray): (sütun, ceil(satır / 8)) biçiminde uint8 dizi
+        n_rows (int): Satır sayısı
+    """
+    def __init__(self, columns: List[str], bits: np.ndarray, n_rows: int):
+        self.columns = list(columns)
+        self.bits = bits
+        self.n_rows = n_rows
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, columns: Optional[List[str]] = None) -> 'MissingnessMap':
+        """Maskeleri sütun sütun paketler; tüm tablonun boolean maskesi oluşturulmaz"""
+        columns = list(df.columns if columns is None else columns)
+        n_bytes = (len(df) + 7) // 8
+        bits = np.empty((len(columns), n_bytes), dtype=np.uint8)
+        for i, col in enumerate(columns):
+            bits[i] = np.packbits(df[col].isna().to_numpy())
+        return cls(columns, bits, len(df))
+
+    def counts(self) -> pd.Series:
+        """Sütun başına eksik değer sayısı"""
+        return pd.Series(_bitwise_count(self.bits).sum(axis=1, dtype=np.int64), index=self.columns)
+
+    def fractions(self) -> pd.Series:
+        """Sütun başına eksik değer oranı"""
+        return self.counts() / max(self.n_rows, 1)
+
+    def block_fractions(self, blocks: int = 500) -> Tuple[np.ndarray, int]:
+        """
+        Satırları ardışık bloklara bölerek her blokta sütun başına eksik oranını hesaplar.
+
+        Blok boyu 8'in katıdır (bir bayt); satır sayısı blok sayısından azsa
+        her satır ayrı bir bloktur (eksik hücreler 1, dolu hücreler 0).
+
+        Args:
+            blocks (int): En fazla blok sayısı
+
+        Returns:
+            tuple: ((blok, sütun) biçiminde oranlar, blok başına satır sayısı)
+        """
+        if self.n_rows <= blocks:
+            mask = np.unpackbits(self.bits, axis=1, count=self.n_rows)
+            return mask.T.astype(np.float32), 1
+        n_bytes = self.bits.shape[1]
+        block_bytes = -(-n_bytes // blocks)
+        starts = np.arange(0, n_bytes, block_bytes)
+        counts = np.add.reduceat(_bitwise_count(self.bits), starts, axis=1, dtype=np.int64)
+        block_rows = block_bytes * 8
+        rows = np.minimum(block_rows, self.n_rows - starts * 8)
+        return (counts / rows).T.astype(np.float32), block_rows
+
+    def cooccurrence(self, normalize: bool = False) -> pd.DataFrame:
+        """
+        Her sütun çifti için iki sütunun birlikte eksik olduğu satır sayısı.
+
+        Köşegen sütunun kendi eksik sayısıdır. normalize=True ise sayılar, satır
+        sütununun eksik olduğu satırlara bölünür (P(sütun eksik | satır eksik)).
+        """
+        n_cols = len(self.columns)
+        matrix = np.zeros((n_cols, n_cols), dtype=np.int64)
+        for i in range(n_cols):
+            shared = _bitwise_count(self.bits[i] & self.bits[i:]).sum(axis=1, dtype=np.int64)
+            matrix[i, i:] = shared
+            matrix[i:, i] = shared
+        table = pd.DataFrame(matrix, index=self.columns, columns=self.columns)
+        if normalize:
+            diagonal = np.diag(matrix).astype(np.float64)
+            table = table.div(np.where(diagonal > 0, diagonal, np.nan), axis=0)
+        return table
+
+    def top_pairs(self, k: int = 5) -> pd.DataFrame:
+        """En sık birlikte eksik olan k sütun çifti (sayısı sıfır olanlar hariç)"""
+        matrix = self.cooccurrence().to_numpy()
+        upper = np.triu_indices(len(self.columns), k=1)
+        table = pd.DataFrame({
+            'column_a': np.asarray(self.columns, dtype=object)[upper[0]],
+            'column_b': np.asarray(self.columns, dtype=object)[upper[1]],
+            'rows': matrix[upper],
+        })
+        table = table[table['rows'] > 0]
+        return table.sort_values('rows', ascending=False, kind='stable').head(k).reset_index(drop=True)
@@ -0,0 +1,174 @@
+# src/data_processing/outliers.py
+"""
+Vektörize aykırı değer tespiti.
+
+Tüm sayısal sütunlar tek bir numpy matrisi üzerinde birlikte değerlendirilir
+ve satır başına tek bir boolean maske (True = korunacak satır) döndürülür.
+
+Yöntemler:
+    - zscore      : |x - ortalama| / std < eşik                 (varsayılan eşik 3.0)
+    - iqr         : Q1 - k*IQR < x < Q3 + k*IQR                  (varsayılan k 1.5)
+    - mad         : 0.6745 * |x - medyan| / MAD < eşik           (varsayılan eşik 3.5)
+    - mahalanobis : Kare Mahalanobis uzaklığı < eşik             (varsayılan ki-kare %99.9 yüzdeliği)
+
+Eksik değer içeren satırlar korunmaz (önce eksik veri doldurma yapılmalıdır).
+Yayılımı sıfır olan sütunlar (ör. sabit veya çoğunlukla tek değerli) filtrelemeye katılmaz.
+"""
+from typing import Iterable, Optional, Tuple
+import numpy as np
+from scipy.stats import chi2
+
+from .stats import RunningCovariance, RunningStats
+
+OUTLIER_METHODS = ('zscore', 'iqr', 'mad', 'mahalanobis')
+DEFAULT_THRESHOLDS = {'zscore': 3.0, 'iqr': 1.5, 'mad': 3.5}
+MAHALANOBIS_QUANTILE = 0.999
+# Mahalanobis uzaklıkları bu kadar satırlık bloklar halinde hesaplanır (ara bellek sınırı)
+_DISTANCE_BLOCK_ROWS = 65536
+
+# Normal dağılımda MAD'i standart sapmaya çeviren katsayı
+_MAD_SCALE = 0.6745
+
+
+def univariate_bounds(values: np.ndarray, method: str = 'zscore',
+                      threshold: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Her sütun için (alt, üst) sınır dizilerini hesaplar.
+
+    Args:
+        values (np.ndarray): (satır, sütun) biçiminde dizi
+        method (str): 'zscore', 'iqr' veya 'mad'
+        threshold (float): Yönteme özgü eşik (None ise DEFAULT_THRESHOLDS)
+
+    Returns:
+        tuple: (alt sınırlar, üst sınırlar)
+    """
+    if method not in DEFAULT_THRESHOLDS:
+        raise ValueError(f"Tek değişkenli aykırı değer yöntemi değil: {method} "
+                         f"(seçenekler: {', '.join(DEFAULT_THRESHOLDS)})")
+    threshold = DEFAULT_THRESHOLDS[method] if threshold is None else threshold
+    values = np.asarray(values)
+    if values.dtype.kind != 'f':
+        values = values.astype(np.float64)
+
+    if method == 'zscore':
+        stats = RunningStats(list(range(values.shape[1]))).update(values)
+        center, spread = stats.mean, threshold * stats.std(ddof=1)
+        return _finite_bounds(center - spread, center + spread, spread)
+    if method == 'iqr':
+        q1, q3 = np.nanpercentile(values, [25, 75], axis=0)
+        return iqr_bounds(q1, q3, threshold)
+    center = np.nanmedian(values, axis=0)
+    return mad_bounds(center, np.nanmedian(np.abs(values - center), axis=0), threshold)
+
+
+def iqr_bounds(q1, q3, threshold: float = DEFAULT_THRESHOLDS['iqr']) -> Tuple[np.ndarray, np.ndarray]:
+    """Çeyreklerden Q1 - k*IQR, Q3 + k*IQR sınırları"""
+    spread = np.asarray(q3) - np.asarray(q1)
+    return _finite_bounds(q1 - threshold * spread, q3 + threshold * spread, spread)
+
+
+def mad_bounds(center, mad, threshold: float = DEFAULT_THRESHOLDS['mad']) -> Tuple[np.ndarray, np.ndarray]:
+    """Medyan ve MAD'den (değiştirilmiş z-skoru) sınırlar"""
+    spread = np.asarray(mad) / _MAD_SCALE
+    return _finite_bounds(center - threshold * spread, center + threshold * spread, spread)
+
+
+def _finite_bounds(lower, upper, spread) -> Tuple[np.ndarray, np.ndarray]:
+    # Yayılımı sıfır (veya tanımsız) olan sütunlar filtrelenmez
+    degenerate = ~(np.asarray(spread) > 0)
+    return np.where(degenerate, -np.inf, lower), np.where(degenerate, np.inf, upper)
+
+
+def select_columns(numeric_columns, column=None) -> list:
+    """
+    Aykırı değer sütunlarını seçer.
+
+    Args:
+        numeric_columns (list): Sayısal sütunlar
+        column (str veya list): Sütun(lar); None ise tüm sayısal sütunlar
+    """
+    if column is None:
+        return list(numeric_columns)
+    columns = [column] if isinstance(column, str) else list(column)
+    return [col for col in columns if col in numeric_columns]
+
+
+def bounds_mask(values: np.ndarray, lower, upper) -> np.ndarray:
+    """Tüm sütunlarda sınırlar içinde kalan satırlar için True döndürür"""
+    values = np.asarray(values)
+    return ((values > lower) & (values < upper)).all(axis=1)
+
+
+class MahalanobisDetector:
+    """
+    Çok değişkenli aykırı değer tespiti. Ortalama ve kovaryans parça parça
+    (RunningCovariance) güncellenebildiği için belleğe sığmayan verilerde de kullanılabilir.
+
+    Args:
+        threshold (float): Kare uzaklık eşiği (None ise ki-kare dağılımının
+            MAHALANOBIS_QUANTILE yüzdeliği)
+    """
+    def __init__(self, threshold: Optional[float] = None):
+        self.threshold = threshold
+        self.covariance_ = None
+
+    def partial_fit(self, values: np.ndarray) -> 'MahalanobisDetector':
+        """Kovaryansı yeni bir parçayla günceller; kullanmadan önce finalize() çağrılmalıdır"""
+        values = np.asarray(values, dtype=np.float64)
+        if self.covariance_ is None:
+            self.covariance_ = RunningCovariance(list(range(values.shape[1])))
+        self.covariance_.update(values)
+        return self
+
+    def fit(self, values: np.ndarray) -> 'MahalanobisDetector':
+        self.covariance_ = None
+        return self.partial_fit(values).finalize()
+
+    def fit_chunks(self, chunks: Iterable[np.ndarray]) -> 'MahalanobisDetector':
+        self.covariance_ = None
+        for chunk in chunks:
+            self.partial_fit(chunk)
+        return self.finalize()
+
+    def finalize(self) -> 'MahalanobisDetector':
+        """Biriken kovaryanstan ters kovaryans matrisini ve eşiği hesaplar"""
+        if self.covariance_ is None:
+            raise ValueError("Mahalanobis modeli için veri verilmedi")
+        self.mean_ = self.covariance_.mean
+        self.precision_ = np.linalg.pinv(self.covariance_.covariance(ddof=1))
+        n_features = len(self.mean_)
+        self.threshold_ = (chi2.ppf(MAHALANOBIS_QUANTILE, n_features)
+                           if self.threshold is None else self.threshold)
+        return self
+
+    def distances(self, values: np.ndarray) -> np.ndarray:
+        """Kare Mahalanobis uzaklıkları"""
+        values = np.asarray(values)
+        out = np.empty(len(values), dtype=np.float64)
+        for start in range(0, len(values), _DISTANCE_BLOCK_ROWS):
+            centered = values[start:start + _DISTANCE_BLOCK_ROWS] - self.mean_
+            out[start:start + len(centered)] = np.einsum('ij,ij->i', centered @ self.precision_, centered)
+        return out
+
+    def mask(self, values: np.ndarray) -> np.ndarray:
+        return self.distances(values) < self.threshold_
+
+
+def outlier_mask(values: np.ndarray, method: str = 'zscore',
+                 threshold: Optional[float] = None) -> np.ndarray:
+    """
+    Aykırı olmayan satırlar için True içeren tek bir boolean maske döndürür.
+
+    Args:
+        values (np.ndarray): (satır, sütun) biçiminde dizi
+        method (str): OUTLIER_METHODS içinden bir yöntem
+        threshold (float): Yönteme özgü eşik (None ise varsayılan)
+    """
+    if method == 'mahalanobis':
+        return MahalanobisDetector(threshold).fit(values).mask(values)
+    if method not in OUTLIER_METHODS:
+        raise ValueError(f"Bilinmeyen aykırı değer yöntemi: {method} "
+                         f"(seçenekler: {', '.join(OUTLIER_METHODS)})")
+    lower, upper = univariate_bounds(values, method, threshold)
+    return bounds_mask(values, lower, upper)
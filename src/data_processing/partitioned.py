@@ -0,0 +1,285 @@
+# src/data_processing/partitioned.py
+"""
+Bölümlenmiş (out-of-core) temizleme.
+
+Tek makinenin belleğine sığmayan veri, bölümler (ör. bir Parquet veri setinin
+parça dosyaları veya bölge başına CSV'ler) halinde işçi süreçlerine dağıtılır.
+Her işçi kendi bölümünü bellek bütçesiyle sınırlı parçalar halinde okur ve yalnızca
+birleştirilebilir kısmi istatistikler döndürür:
+
+    - RunningStats      : gözlem/eksik sayıları, ortalama, varyans, min/max
+    - ExactQuantiles    : radix seçimiyle tam medyan ve çeyrekler
+    - RunningCovariance : Mahalanobis için ortalama vektörü ve kovaryans
+
+Kısmi sonuçlar ana süreçte birleştirilerek sırasıyla doldurma, aykırı değer ve
+ölçekleme parametreleri elde edilir. Her adım bir öncekinin sonucunu gördüğü için
+(doldurulmuş veride aykırı değer sınırı, filtrelenmiş veride ölçekleyici) sonuç
+tüm verinin tek makinede handle_missing_values → remove_outliers → normalize_data
+ile temizlenmesiyle aynıdır. Son geçişte her bölüm eğitilmiş artefaktla bağımsız
+olarak dönüştürülüp yazılır.
+
+Birleştirilebilir doldurma stratejileri median ve mean'dir; diğer stratejilerde
+(knn, hgb, rf) imputer_factory zorunludur ve doldurucu yalnızca ilk bölümün ilk
+parçası üzerinde (örneklem) eğitilir.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Dict, List, Optional
+import copy
+import logging
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+from .artifacts import CleaningArtifact
+from .imputation import ColumnStatImputer
+from .outliers import (DEFAULT_THRESHOLDS, MahalanobisDetector, iqr_bounds, mad_bounds,
+                       select_columns)
+from .stats import ExactQuantiles, RunningCovariance, RunningStats
+from .storage import (DEFAULT_CHUNK_MEMORY_MB, ChunkWriter, discover_inputs, iter_chunks,
+                      numeric_block, output_path_for)
+
+MERGEABLE_STRATEGIES = ('median', 'mean')
+
+
+class _ColumnSubset:
+    """Bir biriktiriciyi yalnızca seçili sütunlarla besler"""
+    def __init__(self, accumulator, idx: List[int]):
+        self.accumulator = accumulator
+        self.idx = list(idx)
+
+    def update(self, values):
+        self.accumulator.update(values[:, self.idx])
+        return self
+
+    def merge(self, other: '_ColumnSubset'):
+        self.accumulator.merge(other.accumulator)
+        return self
+
+
+def _scan_partition(path: str, read_options: Dict, prepare: CleaningArtifact, accumulators: list) -> list:
+    """
+    Bir bölümü parça parça okuyup biriktiricileri günceller (işçi sürecinde çalışır).
+    prepare, parçalara o ana kadar eğitilmiş adımları (doldurma, filtreleme) uygular.
+    """
+    for chunk in iter_chunks(path, read_options['schema'], read_options['chunk_memory_mb'],
+                             usecols=read_options['columns']):
+        values = numeric_block(prepare.transform(chunk), prepare.numeric_columns, dtype=np.float64)
+        for accumulator in accumulators:
+            accumulator.update(values)
+    return accumulators
+
+
+def _transform_partition(path: str, output_path: str, read_options: Dict,
+                         artifact: CleaningArtifact, compression: Optional[str]) -> Dict:
+    """Bir bölümü dönüştürüp çıktısını atomik olarak yazar (işçi sürecinde çalışır)"""
+    start = time.perf_counter()
+    directory = os.path.dirname(output_path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.splitext(output_path)[1])
+    os.close(fd)
+    rows_in = 0
+    try:
+        with ChunkWriter(tmp_path, compression) as writer:
+            for chunk in iter_chunks(path, read_options['schema'], read_options['chunk_memory_mb'],
+                                     usecols=read_options['columns']):
+                rows_in += len(chunk)
+                writer.write(artifact.transform(chunk))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return {'input': path, 'output': output_path, 'rows_in': rows_in,
+            'rows_out': writer.rows_written, 'seconds': time.perf_counter() - start}
+
+
+class PartitionedCleaner:
+    """
+    Bölümler üzerinde iki aşamalı (istatistik → dönüşüm) paralel temizleme.
+
+    Args:
+        source: Bölümlerin klasörü, glob deseni veya dosya listesi
+        output_dir (str): Temizlenmiş bölümlerin yazılacağı klasör (dosya adları korunur)
+        workers (int): İşçi süreç sayısı (None ise çekirdek sayısı; 1 ise aynı süreçte)
+        schema (dict): CSV için sütun tipleri
+        columns (list): Okunacak sütunlar
+        chunk_memory_mb (float): İşçi başına parça bellek bütçesi (MB)
+        imputation_strategy (str): Doldurma stratejisi
+        imputer_factory (callable): median/mean dışındaki stratejiler için doldurucu üretir
+            (bu stratejilerde zorunludur; doldurucu ilk parçadan örneklemle eğitilir)
+        outlier_column (str veya list): Aykırı değer sütun(lar)ı; None ise tüm sayısal sütunlar
+        outlier_threshold (float): Yönteme özgü eşik (None ise varsayılan)
+        outlier_method (str): 'zscore', 'iqr', 'mad' veya 'mahalanobis'
+        output_format (str): 'csv', 'parquet' veya 'feather' (None ise girdi formatı)
+        compression (str): Çıktı sıkıştırması
+    """
+    def __init__(self, source, output_dir, workers: Optional[int] = None, schema=None, columns=None,
+                 chunk_memory_mb: float = DEFAULT_CHUNK_MEMORY_MB, imputation_strategy: str = 'median',
+                 imputer_factory: Optional[Callable] = None, outlier_column='MEDV',
+                 outlier_threshold: Optional[float] = None, outlier_method: str = 'zscore',
+                 output_format: Optional[str] = None, compression: Optional[str] = None,
+                 logger: Optional[logging.Logger] = None):
+        if imputation_strategy not in MERGEABLE_STRATEGIES and imputer_factory is None:
+            raise ValueError(f"'{imputation_strategy}' doldurma stratejisi birleştirilebilir değil "
+                             f"({', '.join(MERGEABLE_STRATEGIES)} dışında); imputer_factory verilmeli")
+        self.paths = discover_inputs(source)
+        self.output_dir = str(output_dir)
+        self.workers = min(workers or os.cpu_count() or 1, len(self.paths))
+        self.read_options = {'schema': schema, 'columns': columns, 'chunk_memory_mb': chunk_memory_mb}
+        self.imputation_strategy = imputation_strategy
+        self.imputer_factory = imputer_factory
+        self.outlier_column = outlier_column
+        self.outlier_threshold = outlier_threshold
+        self.outlier_method = outlier_method
+        self.output_format = output_format
+        self.compression = compression
+        self.logger = logger or logging.getLogger('BostonHousingCleaner')
+        self.artifact = None
+        self.n_passes = 0
+        self._pool = None
+
+    def _scan(self, prepare: CleaningArtifact, accumulators: list) -> list:
+        """Tüm bölümleri tarar ve bölüm başına kısmi sonuçları birleştirir"""
+        if self._pool is None:
+            # Aynı süreçte her bölüm biriktiricilerin kendi kopyasını günceller
+            partials = (_scan_partition(path, self.read_options, prepare, copy.deepcopy(accumulators))
+                        for path in self.paths)
+        else:
+            partials = self._pool.map(_scan_partition, self.paths, repeat(self.read_options),
+                                      repeat(prepare), repeat(accumulators))
+        merged = None
+        for partial in partials:
+            if merged is None:
+                merged = partial
+            else:
+                for total, part in zip(merged, partial):
+                    total.merge(part)
+        self.n_passes += 1
+        return merged
+
+    def _solve_quantiles(self, prepare: CleaningArtifact, quantiles: ExactQuantiles,
+                         merged=None, counts=None) -> np.ndarray:
+        """Kantiller çözülene kadar tarama geçişleri yapar (ilk geçiş başka bir taramayla birleşik olabilir)"""
+        if merged is None:
+            merged, = self._scan(prepare, [quantiles.sketch()])
+        while not quantiles.advance(merged, counts):
+            merged, = self._scan(prepare, [quantiles.sketch()])
+        return quantiles.result()
+
+    def _sample_chunk(self) -> pd.DataFrame:
+        chunk = next(iter_chunks(self.paths[0], self.read_options['schema'],
+                                 self.read_options['chunk_memory_mb'],
+                                 usecols=self.read_options['columns']), None)
+        if chunk is None:
+            raise ValueError(f"İlk bölüm boş: {self.paths[0]}")
+        return chunk
+
+    def fit(self) -> CleaningArtifact:
+        """
+        Kısmi istatistikleri birleştirerek doldurma, aykırı değer ve ölçekleme
+        parametrelerini sırasıyla eğitir.
+        """
+        sample = self._sample_chunk()
+        numeric_cols = list(sample.select_dtypes(include=np.number).columns)
+        outlier_cols = select_columns(numeric_cols, self.outlier_column)
+        outlier_idx = [numeric_cols.index(col) for col in outlier_cols]
+        method, threshold = self.outlier_method, self.outlier_threshold
+        limit = DEFAULT_THRESHOLDS.get(method) if threshold is None else threshold
+        identity = CleaningArtifact(numeric_cols)
+
+        # 1. Doldurma: gözlenen değerlerin momentleri (mean) veya tam medyanı
+        mergeable = self.imputation_strategy in MERGEABLE_STRATEGIES
+        if mergeable:
+            median = ExactQuantiles(range(len(numeric_cols)), [0.5])
+            accumulators = [RunningStats(numeric_cols)]
+            if self.imputation_strategy == 'median':
+                accumulators.append(median.sketch())
+            merged = self._scan(identity, accumulators)
+            observed = merged[0]
+            imputer = ColumnStatImputer(self.imputation_strategy)
+            if self.imputation_strategy == 'median':
+                statistics = self._solve_quantiles(identity, median, merged[1], observed.count)[0]
+            else:
+                statistics = observed.mean
+            imputer.statistics_ = np.where(observed.count > 0, statistics, 0.0)
+            imputer.n_features_in_ = len(numeric_cols)
+        else:
+            self.logger.warning(f"⚠️ '{self.imputation_strategy}' birleştirilebilir değil; doldurucu "
+                                f"yalnızca ilk parçanın {len(sample)} satırı üzerinde eğitiliyor")
+            imputer = self.imputer_factory().fit(numeric_block(sample, numeric_cols, dtype=np.float64))
+        del sample
+        imputed = CleaningArtifact(numeric_cols, imputer=imputer)
+        self.logger.info(f"✅ Doldurma parametreleri birleştirildi ({self.imputation_strategy})")
+
+        # 2. Aykırı değerler: doldurulmuş veri üzerinde
+        bounds, detector = {}, None
+        if outlier_cols and method == 'zscore':
+            stats, = self._scan(imputed, [RunningStats(numeric_cols)])
+            bounds = stats.zscore_bounds(threshold, outlier_cols)
+        elif outlier_cols and method == 'iqr':
+            q1, q3 = self._solve_quantiles(imputed, ExactQuantiles(outlier_idx, [0.25, 0.75]))
+            bounds = dict(zip(outlier_cols, zip(*iqr_bounds(q1, q3, limit))))
+        elif outlier_cols and method == 'mad':
+            center = self._solve_quantiles(imputed, ExactQuantiles(outlier_idx, [0.5]))[0]
+            full_center = np.zeros(len(numeric_cols))
+            full_center[outlier_idx] = center
+            mad = self._solve_quantiles(imputed, ExactQuantiles(outlier_idx, [0.5], center=full_center))[0]
+            bounds = dict(zip(outlier_cols, zip(*mad_bounds(center, mad, limit))))
+        elif outlier_cols and method == 'mahalanobis':
+            covariance, = self._scan(imputed, [_ColumnSubset(RunningCovariance(outlier_cols), outlier_idx)])
+            detector = MahalanobisDetector(threshold)
+            detector.covariance_ = covariance.accumulator
+            detector.finalize()
+        elif outlier_cols:
+            raise ValueError(f"Bilinmeyen aykırı değer yöntemi: {method}")
+        filtered = CleaningArtifact(numeric_cols, imputer=imputer, outlier_bounds=bounds,
+                                    outlier_detector=detector, outlier_columns=outlier_cols)
+        self.logger.info(f"✅ Aykırı değer parametreleri birleştirildi ({method})")
+
+        # 3. Ölçekleme: doldurulmuş ve filtrelenmiş satırlar üzerinde
+        kept, = self._scan(filtered, [RunningStats(numeric_cols)])
+        self.artifact = CleaningArtifact(
+            numeric_cols, imputer=imputer, scaler=kept.to_scaler(), outlier_bounds=bounds,
+            outlier_detector=detector, outlier_columns=outlier_cols,
+            params={'imputation_strategy': self.imputation_strategy, 'outlier_column': self.outlier_column,
+                    'outlier_threshold': threshold, 'outlier_method': method,
+                    'n_rows': int(observed.n_rows) if mergeable else None,
+                    'n_partitions': len(self.paths)}
+        )
+        self.logger.info(f"✅ Ölçekleyici birleştirildi ({kept.n_rows} satır, toplam {self.n_passes} tarama)")
+        return self.artifact
+
+    def transform(self) -> pd.DataFrame:
+        """Her bölümü eğitilmiş artefaktla bağımsız olarak dönüştürüp yazar"""
+        if self.artifact is None:
+            raise RuntimeError("Önce fit() çağrılmalı")
+        os.makedirs(self.output_dir, exist_ok=True)
+        outputs = [output_path_for(path, self.output_dir, self.output_format) for path in self.paths]
+        args = (self.paths, outputs, repeat(self.read_options), repeat(self.artifact), repeat(self.compression))
+        records = list(map(_transform_partition, *args) if self._pool is None
+                       else self._pool.map(_transform_partition, *args))
+        return pd.DataFrame(records)
+
+    def run(self) -> pd.DataFrame:
+        """fit + transform; bölüm başına sonuç tablosunu döndürür"""
+        self.logger.info(f"🧩 Bölümlenmiş temizleme: {len(self.paths)} bölüm, {self.workers} işçi")
+        start = time.perf_counter()
+        self.n_passes = 0
+        if self.workers > 1:
+            # Paralellik süreçler arasında; işçilerde BLAS/OpenMP tek iş parçacığıyla sınırlanır
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=threadpool_limits,
+                                             initargs=(1,))
+        try:
+            self.fit()
+            table = self.transform()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+        self.logger.info(f"✅ Bölümlenmiş temizleme tamamlandı: {int(table['rows_in'].sum())} → "
+                         f"{int(table['rows_out'].sum())} satır ({time.perf_counter() - start:.1f} sn)")
+        return table
+
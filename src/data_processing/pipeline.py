@@ -0,0 +1,179 @@
+# src/data_processing/pipeline.py
+"""
+Bildirimsel aşama (stage) grafiği.
+
+Her aşama bir ad, çalıştırılacak fonksiyon ve bağımlı olduğu aşamalarla
+tanımlanır. Grafik aşamaları bağımlılık sırasına göre yalnızca bir kez çalıştırır;
+aşamalar yapılandırmadan yeniden sıralanabilir veya atlanabilir. Bir önbellek
+verildiğinde, önbellekte çıktısı bulunan en son aşamadan devam edilir.
+"""
+import logging
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, Iterable, List, Optional, Sequence, Union
+
+from .cache import StageCache, params_key
+
+
+class Stage:
+    """
+    Tek bir işlem aşaması.
+
+    Args:
+        name (str): Aşama adı
+        func (callable): Aşamayı çalıştıran argümansız fonksiyon
+        requires (tuple): Bu aşamadan önce tamamlanması gereken aşamaların adları
+        params (dict veya callable): Aşamanın çıktısını belirleyen parametreler (önbellek anahtarı için)
+        cacheable (bool): Aşama çıktısı önbelleğe alınabilir mi?
+    """
+    def __init__(self, name: str, func: Callable[[], object], requires: Sequence[str] = (),
+                 params: Union[Dict, Callable[[], Dict], None] = None, cacheable: bool = False):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.params = params
+        self.cacheable = cacheable
+        self.done = False
+
+    def resolve_params(self) -> Dict:
+        return self.params() if callable(self.params) else (self.params or {})
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, requires={self.requires}, done={self.done})"
+
+
+class StageGraph:
+    """
+    Aşamaları bağımlılıklarına göre çalıştıran grafik.
+
+    Atlanan aşamalar bağımlılık açısından tamamlanmış sayılır; böylece örneğin
+    normalizasyon atlandığında kayıt aşaması yine çalışır.
+
+    Args:
+        stages (list): Stage nesneleri
+        logger (logging.Logger): Loglayıcı
+        cache (StageCache): Aşama çıktıları için önbellek (None ise kapalı)
+        get_state (callable): Önbelleğe yazılacak güncel çıktıyı döndürür
+        set_state (callable): Önbellekten okunan çıktıyı geri yükler
+        monitor (callable): Aşama adını alıp aşamayı saran bir bağlam yöneticisi döndürür
+            (ör. bellek veya süre ölçümü için; None ise kapalı)
+    """
+    def __init__(self, stages: Iterable[Stage], logger: Optional[logging.Logger] = None,
+                 cache: Optional[StageCache] = None, get_state: Optional[Callable] = None,
+                 set_state: Optional[Callable] = None,
+                 monitor: Optional[Callable[[str], ContextManager]] = None):
+        self.stages = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Aynı adla birden fazla aşama tanımlanamaz: {stage.name}")
+            self.stages[stage.name] = stage
+        if cache is not None and (get_state is None or set_state is None):
+            raise ValueError("Önbellek kullanımı için get_state ve set_state gereklidir")
+        self.logger = logger or logging.getLogger(__name__)
+        self.cache = cache
+        self.get_state = get_state
+        self.set_state = set_state
+        self.monitor = monitor
+        self.executed: List[str] = []
+        self.skipped: List[str] = []
+        self.cached: List[str] = []
+
+    def reset(self):
+        for stage in self.stages.values():
+            stage.done = False
+        self.executed = []
+        self.skipped = []
+        self.cached = []
+
+    def plan(self, order: Optional[Sequence[str]] = None, skip: Sequence[str] = ()) -> List[str]:
+        """
+        Aşamaları çalıştırmadan çalışma sırasını çıkarır.
+
+        Args:
+            order (list): Aşamaların tercih edilen sırası (None ise tanım sırası).
+                Bir aşamanın bağımlılıkları listede daha sonra geliyorsa veya listede hiç
+                yoksa aşamadan önce çalıştırılır.
+            skip (list): Atlanacak aşamalar
+
+        Returns:
+            list: Çalışacak aşamaların adları (çalışma sırasıyla, atlananlar hariç)
+        """
+        order = list(order) if order is not None else list(self.stages)
+        unknown = [name for name in list(order) + list(skip) if name not in self.stages]
+        if unknown:
+            raise ValueError(f"Bilinmeyen aşama(lar): {', '.join(unknown)} "
+                             f"(tanımlı aşamalar: {', '.join(self.stages)})")
+
+        sequence, seen = [], set()
+        for name in order:
+            self._visit(name, set(skip), seen, sequence, visiting=set())
+        return sequence
+
+    def _visit(self, name, skip, seen, sequence, visiting):
+        stage = self.stages[name]
+        if stage.done or name in seen:
+            return
+        if name in skip:
+            seen.add(name)
+            if name not in self.skipped:
+                self.skipped.append(name)
+            return
+        if name in visiting:
+            raise ValueError(f"Aşama bağımlılıklarında döngü var: {name}")
+
+        visiting.add(name)
+        for dependency in stage.requires:
+            if dependency not in self.stages:
+                raise ValueError(f"'{name}' aşamasının bağımlılığı tanımlı değil: {dependency}")
+            self._visit(dependency, skip, seen, sequence, visiting)
+        visiting.discard(name)
+
+        seen.add(name)
+        sequence.append(name)
+
+    def _stage_keys(self, sequence: List[str]) -> List[str]:
+        # Anahtarlar çalışma sırasıyla zincirlenir: bir aşamanın anahtarı kendisinden
+        # önceki tüm aşamaların parametrelerine bağlıdır.
+        keys, previous = [], None
+        for name in sequence:
+            previous = params_key(previous, name, self.stages[name].resolve_params())
+            keys.append(previous)
+        return keys
+
+    def run(self, order: Optional[Sequence[str]] = None, skip: Sequence[str] = ()) -> List[str]:
+        """
+        Aşamaları çalıştırır (argümanlar için bkz. plan).
+
+        Returns:
+            list: Gerçekten çalıştırılan aşamaların adları (çalışma sırasıyla)
+        """
+        sequence = self.plan(order, skip)
+        for name in self.skipped:
+            self.stages[name].done = True
+            self.logger.info(f"⏭ Aşama atlandı: {name}")
+
+        keys = self._stage_keys(sequence) if self.cache is not None else [None] * len(sequence)
+        start = 0
+        if self.cache is not None:
+            # Önbellekte çıktısı bulunan en son aşamadan devam et. Yan etkili
+            # (önbelleğe alınamayan) bir aşamanın ötesine atlanmaz.
+            prefix = next((i for i, name in enumerate(sequence)
+                           if not self.stages[name].cacheable), len(sequence))
+            for i in reversed(range(prefix)):
+                if keys[i] in self.cache:
+                    self.set_state(self.cache.get(keys[i]))
+                    for name in sequence[:i + 1]:
+                        self.stages[name].done = True
+                        self.cached.append(name)
+                    self.logger.info(f"♻ Önbellekten yüklendi: {' → '.join(self.cached)}")
+                    start = i + 1
+                    break
+
+        for name, key in zip(sequence[start:], keys[start:]):
+            stage = self.stages[name]
+            with (self.monitor(name) if self.monitor is not None else nullcontext()):
+                stage.func()
+            stage.done = True
+            self.executed.append(name)
+            if self.cache is not None and stage.cacheable:
+                self.cache.put(key, self.get_state())
+        return list(self.executed)
@@ -0,0 +1,361 @@
+# src/data_processing/stats.py
+"""
+Tek geçişte hesaplanan akan (streaming) istatistikler.
+
+Veri parça parça okunurken her sayısal sütun için gözlem sayısı, ortalama,
+varyans (Welford/Chan birleştirmesi), min/max ve eksik değer sayısı güncellenir.
+Sonuçtan ölçekleyici parametreleri ve z-skoru sınırları üretilir; böylece
+belleğe sığmayan dosyalar da temizlenebilir.
+"""
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from .storage import numeric_block
+
+# RunningStats.update'in tek seferde float64'e çevirip işlediği en fazla satır sayısı
+_UPDATE_BLOCK_ROWS = 65536
+
+
+class RunningStats:
+    """
+    Sütun bazında birleştirilebilir akan istatistikler.
+
+    Args:
+        columns (list): İzlenecek sütunlar (sırasıyla)
+    """
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        n = len(self.columns)
+        self.n_rows = 0
+        self.count = np.zeros(n, dtype=np.int64)
+        self.null_count = np.zeros(n, dtype=np.int64)
+        self.mean = np.zeros(n, dtype=np.float64)
+        self.m2 = np.zeros(n, dtype=np.float64)
+        self.min = np.full(n, np.inf)
+        self.max = np.full(n, -np.inf)
+
+    def update(self, values) -> 'RunningStats':
+        """
+        Yeni bir veri parçasını istatistiklere ekler.
+
+        Args:
+            values: (satır, sütun) biçiminde dizi veya self.columns sütunlarını içeren DataFrame
+        """
+        if isinstance(values, pd.DataFrame):
+            values = numeric_block(values, self.columns, dtype=np.float64)
+        values = np.asarray(values)
+        if values.ndim != 2 or values.shape[1] != len(self.columns):
+            raise ValueError(f"Beklenen sütun sayısı {len(self.columns)}, gelen dizi şekli {values.shape}")
+        # Büyük diziler satır blokları halinde işlenir ve Chan yöntemiyle birleştirilir;
+        # böylece float64 ara kopyalar tüm matris yerine tek blok kadar yer kaplar
+        for start in range(0, len(values), _UPDATE_BLOCK_ROWS):
+            self._update_block(np.asarray(values[start:start + _UPDATE_BLOCK_ROWS], dtype=np.float64))
+        return self
+
+    def _update_block(self, values: np.ndarray) -> None:
+        observed = ~np.isnan(values)
+        batch_count = observed.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            batch_mean = np.where(batch_count > 0, np.nansum(values, axis=0) / batch_count, 0.0)
+        centered = np.where(observed, values - batch_mean, 0.0)
+        batch_m2 = np.einsum('ij,ij->j', centered, centered)
+
+        batch_min = np.where(observed, values, np.inf).min(axis=0)
+        batch_max = np.where(observed, values, -np.inf).max(axis=0)
+
+        self._combine(len(values), batch_count, len(values) - batch_count,
+                      batch_mean, batch_m2, batch_min, batch_max)
+
+    def merge(self, other: 'RunningStats') -> 'RunningStats':
+        """Başka bir parçanın/işçinin istatistiklerini birleştirir (Chan yöntemi)"""
+        if other.columns != self.columns:
+            raise ValueError("Birleştirilen istatistiklerin sütunları aynı olmalıdır")
+        self._combine(other.n_rows, other.count, other.null_count,
+                      other.mean, other.m2, other.min, other.max)
+        return self
+
+    def _combine(self, n_rows, count, null_count, mean, m2, min_, max_):
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(total > 0, count / total, 0.0)
+            self.m2 = self.m2 + m2 + np.where(total > 0, delta ** 2 * self.count * count / total, 0.0)
+        self.mean = self.mean + delta * weight
+        self.count = total
+        self.null_count = self.null_count + null_count
+        self.n_rows += n_rows
+        self.min = np.minimum(self.min, min_)
+        self.max = np.maximum(self.max, max_)
+
+    def variance(self, ddof: int = 1) -> np.ndarray:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        return np.sqrt(self.variance(ddof))
+
+    def zscore_bounds(self, threshold: Optional[float] = 3.0,
+                      columns: Optional[Iterable[str]] = None) -> Dict[str, tuple]:
+        """
+        |z| < threshold koşuluna karşılık gelen (alt, üst) değer sınırları (örneklem std, ddof=1).
+        Standart sapması sıfır veya tanımsız olan sütunlar için sınır konmaz.
+        """
+        columns = self.columns if columns is None else list(columns)
+        threshold = 3.0 if threshold is None else threshold
+        std = self.std(ddof=1)
+        bounds = {}
+        for col in columns:
+            i = self.columns.index(col)
+            if std[i] > 0:
+                bounds[col] = (self.mean[i] - threshold * std[i], self.mean[i] + threshold * std[i])
+            else:
+                bounds[col] = (-np.inf, np.inf)
+        return bounds
+
+    def to_scaler(self) -> StandardScaler:
+        """Ortalama ve varyanstan eğitilmiş bir StandardScaler üretir (sklearn gibi ddof=0)"""
+        scaler = StandardScaler()
+        var = self.variance(ddof=0)
+        scale = np.sqrt(var)
+        scaler.mean_ = self.mean.copy()
+        scaler.var_ = var
+        scaler.scale_ = np.where((scale > 0) & np.isfinite(scale), scale, 1.0)
+        scaler.n_samples_seen_ = self.count.copy()
+        scaler.n_features_in_ = len(self.columns)
+        return scaler
+
+    def summary(self) -> pd.DataFrame:
+        """İstatistikleri sütun başına bir satır olacak şekilde tablo olarak döndürür"""
+        return pd.DataFrame({
+            'count': self.count,
+            'nulls': self.null_count,
+            'mean': self.mean,
+            'std': self.std(ddof=1),
+            'min': np.where(self.count > 0, self.min, np.nan),
+            'max': np.where(self.count > 0, self.max, np.nan),
+        }, index=self.columns)
+
+
+class RunningCovariance:
+    """
+    Tam gözlemli satırlar üzerinden artımlı güncellenen ortalama vektörü ve
+    kovaryans matrisi (Chan birleştirmesinin çok değişkenli hali).
+
+    Args:
+        columns (list): İzlenecek sütunlar (sırasıyla)
+    """
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        n = len(self.columns)
+        self.count = 0
+        self.mean = np.zeros(n, dtype=np.float64)
+        self.comoment = np.zeros((n, n), dtype=np.float64)
+
+    def update(self, values) -> 'RunningCovariance':
+        """Yeni bir parçayı ekler; eksik değer içeren satırlar atlanır"""
+        if isinstance(values, pd.DataFrame):
+            values = numeric_block(values, self.columns, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values).any(axis=1)]
+        if len(values) == 0:
+            return self
+        batch_mean = values.mean(axis=0)
+        centered = values - batch_mean
+        self._combine(len(values), batch_mean, centered.T @ centered)
+        return self
+
+    def merge(self, other: 'RunningCovariance') -> 'RunningCovariance':
+        if other.columns != self.columns:
+            raise ValueError("Birleştirilen kovaryansların sütunları aynı olmalıdır")
+        self._combine(other.count, other.mean, other.comoment)
+        return self
+
+    def _combine(self, count, mean, comoment):
+        total = self.count + count
+        if total == 0:
+            return
+        delta = mean - self.mean
+        self.comoment = self.comoment + comoment + np.outer(delta, delta) * (self.count * count / total)
+        self.mean = self.mean + delta * (count / total)
+        self.count = total
+
+    def covariance(self, ddof: int = 1) -> np.ndarray:
+        if self.count <= ddof:
+            raise ValueError("Kovaryans için yeterli tam gözlemli satır yok")
+        return self.comoment / (self.count - ddof)
+
+
+# Radix seçiminde her geçişte çözülen bit sayısı ve kova sayısı
+_RADIX_BITS = 16
+_RADIX_BUCKETS = 1 << _RADIX_BITS
+# Bir hedefin aday değer sayısı bu sınırı aşmazsa değerler doğrudan sıralanarak seçilir
+_RADIX_CANDIDATE_LIMIT = 1 << 16
+_SIGN_BIT = np.uint64(1 << 63)
+
+
+def _order_keys(values: np.ndarray) -> np.ndarray:
+    """float64 değerleri sıralamayı koruyan uint64 anahtarlara çevirir"""
+    bits = np.ascontiguousarray(values, dtype=np.float64).view(np.uint64)
+    return np.where(bits & _SIGN_BIT, ~bits, bits | _SIGN_BIT)
+
+
+def _key_value(key: int) -> float:
+    key = np.uint64(key)
+    bits = key & ~_SIGN_BIT if key & _SIGN_BIT else ~key
+    return float(np.array([bits], dtype=np.uint64).view(np.float64)[0])
+
+
+class RadixHistogram:
+    """
+    Tam kantil seçiminin (ExactQuantiles) tek bir geçişindeki birleştirilebilir kısmi sonuç.
+
+    Her grup (sütun, önek, kalan bit) için, öneki eşleşen değerlerin sonraki 16 bitine
+    göre histogramı tutulur. Eşleşen değer sayısı küçükse değerlerin kendisi de
+    (aday olarak) saklanır; böylece seçim bir sonraki geçişi beklemeden tamamlanır.
+
+    Args:
+        groups (list): (sütun indeksi, önek, kalan bit sayısı) üçlüleri
+        center (np.ndarray): Verilirse değerler yerine |değer - center| kullanılır (MAD için)
+    """
+    def __init__(self, groups, center: Optional[np.ndarray] = None):
+        self.groups = list(groups)
+        self.center = center
+        self.counts = {group: np.zeros(_RADIX_BUCKETS, dtype=np.int64) for group in self.groups}
+        self.candidates = {group: [] for group in self.groups}
+
+    def update(self, values: np.ndarray) -> 'RadixHistogram':
+        values = np.asarray(values)
+        for group in self.groups:
+            col, prefix, shift = group
+            column = values[:, col]
+            column = column[~np.isnan(column)]
+            if self.center is not None:
+                column = np.abs(column - self.center[col])
+            keys = _order_keys(column)
+            if shift < 64:
+                selected = (keys >> np.uint64(shift)) == np.uint64(prefix)
+                keys, column = keys[selected], column[selected]
+            digits = (keys >> np.uint64(shift - _RADIX_BITS)) & np.uint64(_RADIX_BUCKETS - 1)
+            self.counts[group] += np.bincount(digits.astype(np.intp), minlength=_RADIX_BUCKETS)
+            self._add_candidates(group, [np.asarray(column, dtype=np.float64)])
+        return self
+
+    def merge(self, other: 'RadixHistogram') -> 'RadixHistogram':
+        for group in self.groups:
+            self.counts[group] += other.counts[group]
+            self._add_candidates(group, other.candidates[group])
+        return self
+
+    def _add_candidates(self, group, arrays) -> None:
+        if self.candidates[group] is None:
+            return
+        if arrays is None or self.counts[group].sum() > _RADIX_CANDIDATE_LIMIT:
+            self.candidates[group] = None
+        else:
+            self.candidates[group].extend(arrays)
+
+
+class ExactQuantiles:
+    """
+    Parçalara bölünmüş veride birleştirilebilir, bellek sınırlı tam kantil hesabı.
+
+    Değerler sıralamayı koruyan 64 bitlik anahtarlara çevrilir ve her geçişte
+    16 bit çözülür (radix seçimi). Her geçişte parçalar için sketch() ile alınan
+    RadixHistogram nesneleri güncellenir, birleştirilir ve advance() ile sonraki
+    geçişe ilerlenir. Sonuç numpy.nanpercentile (linear) ile aynıdır.
+
+    Args:
+        columns (list): Kantilleri hesaplanacak sütun indeksleri
+        quantiles (list): 0-1 aralığında kantiller
+        center (np.ndarray): Verilirse |değer - center| dağılımının kantilleri hesaplanır
+    """
+    def __init__(self, columns: List[int], quantiles: Iterable[float], center: Optional[np.ndarray] = None):
+        self.columns = list(columns)
+        self.quantiles = list(quantiles)
+        self.center = center
+        self.targets = None
+        self.counts = {}
+        self.n_passes = 0
+
+    def sketch(self) -> RadixHistogram:
+        """Bir sonraki geçişte parçalar üzerinde güncellenecek boş histogram"""
+        if self.targets is None:
+            groups = [(col, 0, 64) for col in self.columns]
+        else:
+            groups = sorted({(t['col'], t['prefix'], t['shift'])
+                             for t in self.targets.values() if t['value'] is None})
+        return RadixHistogram(groups, self.center)
+
+    def advance(self, merged: RadixHistogram, counts=None) -> bool:
+        """
+        Birleştirilmiş geçiş sonucunu işler.
+
+        Args:
+            merged (RadixHistogram): Tüm parçaların birleştirilmiş histogramı
+            counts: İlk geçişte sütun başına eksik olmayan değer sayıları (verilmezse histogramdan)
+
+        Returns:
+            bool: Tüm kantiller çözüldüyse True
+        """
+        self.n_passes += 1
+        if self.targets is None:
+            self.targets = {}
+            for col in self.columns:
+                n = int(merged.counts[(col, 0, 64)].sum()) if counts is None else int(counts[col])
+                self.counts[col] = n
+                for rank in self._ranks(n):
+                    self.targets[(col, rank)] = {'col': col, 'prefix': 0, 'shift': 64,
+                                                 'rank': rank, 'value': None}
+
+        for target in self.targets.values():
+            if target['value'] is not None:
+                continue
+            group = (target['col'], target['prefix'], target['shift'])
+            candidates = merged.candidates[group]
+            if candidates is not None:
+                target['value'] = float(np.sort(np.concatenate(candidates))[target['rank']])
+                continue
+            cumulative = np.cumsum(merged.counts[group])
+            bucket = int(np.searchsorted(cumulative, target['rank'], side='right'))
+            if bucket:
+                target['rank'] -= int(cumulative[bucket - 1])
+            target['prefix'] = (target['prefix'] << _RADIX_BITS) | bucket
+            target['shift'] -= _RADIX_BITS
+            if target['shift'] == 0:
+                target['value'] = _key_value(target['prefix'])
+        return all(t['value'] is not None for t in self.targets.values())
+
+    def _ranks(self, n: int) -> List[int]:
+        if n == 0:
+            return []
+        positions = [(n - 1) * q for q in self.quantiles]
+        return sorted({int(np.floor(p)) for p in positions} | {int(np.ceil(p)) for p in positions})
+
+    def result(self) -> np.ndarray:
+        """(kantil, sütun) biçiminde sonuçlar (değeri olmayan sütunlar için NaN)"""
+        out = np.full((len(self.quantiles), len(self.columns)), np.nan)
+        for j, col in enumerate(self.columns):
+            if not self.counts.get(col):
+                continue
+            for i, q in enumerate(self.quantiles):
+                position = (self.counts[col] - 1) * q
+                lo, hi = int(np.floor(position)), int(np.ceil(position))
+                low, high = self.targets[(col, lo)]['value'], self.targets[(col, hi)]['value']
+                # numpy'nin doğrusal ara değer formülü (t >= 0.5 için üst uçtan)
+                t = position - lo
+                out[i, j] = high - (high - low) * (1 - t) if t >= 0.5 else low + (high - low) * t
+        return out
+
+def compute_stats(chunks: Iterable[pd.DataFrame], columns: Optional[List[str]] = None) -> RunningStats:
+    """Parçalar üzerinde tek geçişte istatistikleri hesaplar"""
+    stats = None
+    for chunk in chunks:
+        if stats is None:
+            stats = RunningStats(columns if columns is not None
+                                 else list(chunk.select_dtypes(include=np.number).columns))
+        stats.update(chunk)
+    if stats is None:
+        raise ValueError("İstatistik hesaplamak için en az bir veri parçası gereklidir")
+    return stats
@@ -0,0 +1,304 @@
+# src/data_processing/storage.py
+"""
+Veri okuma/yazma yardımcıları.
+
+Büyük dosyaların bellek bütçesiyle sınırlı parçalar (chunk) halinde,
+önceden tanımlanmış bir sütun şemasıyla okunmasını sağlar. CSV'nin yanında
+sütunsal formatları (Parquet, Feather/Arrow IPC) da okur ve yazar; bu formatlar
+metin ayrıştırması gerektirmez ve yalnızca istenen sütunları yükler.
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+import glob
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Boston tipi veri setleri için sütun şeması.
+# Sürekli özellikler float32, kategorik/küçük tamsayı sütunlar nullable int olarak okunur
+# (CHAS gibi sütunlarda eksik değer bulunabildiği için numpy int yerine pandas Int tipleri).
+BOSTON_SCHEMA: Dict[str, str] = {
+    'CRIM': 'float32',
+    'ZN': 'float32',
+    'INDUS': 'float32',
+    'CHAS': 'Int8',
+    'NOX': 'float32',
+    'RM': 'float32',
+    'AGE': 'float32',
+    'DIS': 'float32',
+    'RAD': 'Int8',
+    'TAX': 'Int16',
+    'PTRATIO': 'float32',
+    'B': 'float32',
+    'LSTAT': 'float32',
+    'MEDV': 'float32',
+}
+
+# Ayrıştırıcı tamponları ve ara kopyalar için satır başına bayt tahminine uygulanan çarpan
+DEFAULT_MEMORY_OVERHEAD = 4.0
+DEFAULT_CHUNK_MEMORY_MB = 256
+
+# Dosya uzantısı -> format eşlemesi
+FORMAT_EXTENSIONS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.ipc': 'feather',
+}
+# CSV sıkıştırması uzantıdan çıkarılır (.csv.gz, .csv.zip...), pandas varsayılanı gibi
+DEFAULT_COMPRESSION = {'csv': 'infer', 'parquet': 'zstd', 'feather': 'zstd'}
+# Çıktı formatı -> dosya uzantısı
+OUTPUT_EXTENSIONS = {'csv': '.csv', 'parquet': '.parquet', 'feather': '.feather'}
+
+
+def detect_format(path) -> str:
+    """
+    Dosya uzantısından (veya klasör ise bölümlenmiş Parquet) formatı belirler.
+    Yalnızca Parquet/Feather uzantıları Arrow'a yönlendirilir; diğer tüm yollar
+    (.csv.gz, .txt, uzantısız...) önceki gibi CSV olarak okunur/yazılır.
+    """
+    path = str(path)
+    if os.path.isdir(path):
+        return 'parquet'
+    ext = os.path.splitext(path)[1].lower()
+    return FORMAT_EXTENSIONS.get(ext, 'csv')
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError("Parquet/Feather desteği için pyarrow gereklidir: pip install pyarrow") from e
+
+
+def read_table(path, columns: Optional[List[str]] = None,
+               schema: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+    """
+    Dosyayı formatına göre okur. Sütunsal formatlarda yalnızca istenen sütunlar
+    diskten okunur ve kayıtlı tipler korunur.
+
+    Args:
+        path (str): Dosya (veya bölümlenmiş Parquet klasörü) yolu
+        columns (list): Okunacak sütunlar (None ise tümü)
+        schema (dict): CSV için sütun adı -> dtype eşlemesi
+
+    Returns:
+        pd.DataFrame: Okunan veri
+    """
+    fmt = detect_format(path)
+    if fmt == 'csv':
+        return pd.read_csv(path, dtype=schema, usecols=columns)
+    _require_pyarrow()
+    if fmt == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+
+def write_table(df: pd.DataFrame, path, compression: Optional[str] = None,
+                partition_cols: Optional[List[str]] = None) -> None:
+    """
+    Veriyi uzantısına göre CSV, Parquet veya Feather olarak yazar.
+
+    Args:
+        df (pd.DataFrame): Yazılacak veri
+        path (str): Hedef dosya yolu
+        compression (str): Sıkıştırma algoritması (varsayılan: formata göre)
+        partition_cols (list): Parquet için bölümleme sütunları (hedef bir klasör olur)
+    """
+    fmt = detect_format(path)
+    compression = compression if compression is not None else DEFAULT_COMPRESSION[fmt]
+    if partition_cols and fmt != 'parquet':
+        raise ValueError("Bölümleme (partition_cols) yalnızca Parquet için desteklenir")
+    if fmt == 'csv':
+        df.to_csv(path, index=False, compression=compression)
+        return
+    _require_pyarrow()
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False, compression=compression, partition_cols=partition_cols)
+    else:
+        df.reset_index(drop=True).to_feather(path, compression=compression)
+
+
+def discover_inputs(source: Union[str, Iterable[str]]) -> List[str]:
+    """
+    Temizlenecek dosyaları bulur.
+
+    Args:
+        source: Klasör (desteklenen uzantılı tüm dosyalar), glob deseni veya dosya listesi
+
+    Returns:
+        list: Sıralı dosya yolları
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        paths = [str(path) for path in source]
+    elif os.path.isdir(source):
+        paths = [entry.path for entry in os.scandir(source)
+                 if entry.is_file() and os.path.splitext(entry.name)[1].lower() in FORMAT_EXTENSIONS]
+    else:
+        paths = glob.glob(str(source))
+    if not paths:
+        raise FileNotFoundError(f"Temizlenecek dosya bulunamadı: {source}")
+    return sorted(paths)
+
+
+def output_path_for(input_path: str, output_dir: str, output_format: Optional[str] = None) -> str:
+    """Girdi dosyasının çıktı klasöründeki karşılığı (format verilirse uzantı değişir)"""
+    stem, ext = os.path.splitext(os.path.basename(input_path))
+    if output_format is not None:
+        ext = OUTPUT_EXTENSIONS[output_format]
+    return os.path.join(output_dir, stem + ext)
+
+
+def atomic_write_table(df: pd.DataFrame, path: str, compression: Optional[str] = None) -> None:
+    """Veriyi geçici bir dosyaya yazıp tamamlanınca hedef ada taşır"""
+    directory = os.path.dirname(path) or "."
+    # Geçici dosya aynı uzantıyı taşır ki format doğru seçilsin
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-",
+                                    suffix=os.path.splitext(path)[1])
+    os.close(fd)
+    try:
+        write_table(df, tmp_path, compression)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def bytes_per_row(schema: Dict[str, str]) -> int:
+    """Şemaya göre bir satırın bellekteki yaklaşık boyutu (bayt)"""
+    total = 0
+    for dtype in schema.values():
+        dtype = pd.api.types.pandas_dtype(dtype)
+        # Nullable tamsayılar değer dizisine ek olarak bir maske baytı taşır
+        total += dtype.itemsize + (1 if isinstance(dtype, pd.api.extensions.ExtensionDtype) else 0)
+    return max(total, 1)
+
+
+def _arrow_bytes_per_row(arrow_schema) -> int:
+    total = 0
+    for field in arrow_schema:
+        try:
+            total += field.type.byte_width
+        except ValueError:
+            # Değişken uzunluklu tipler (metin vb.) için kaba tahmin
+            total += 16
+    return max(total, 1)
+
+
+def _rows_for_budget(row_bytes: int, memory_budget_mb: float,
+                     overhead: float = DEFAULT_MEMORY_OVERHEAD) -> int:
+    if memory_budget_mb <= 0:
+        raise ValueError("memory_budget_mb pozitif olmalıdır")
+    budget_bytes = memory_budget_mb * 1024 * 1024
+    return max(int(budget_bytes / (row_bytes * overhead)), 1)
+
+
+def estimate_chunk_rows(schema: Dict[str, str], memory_budget_mb: float,
+                        overhead: float = DEFAULT_MEMORY_OVERHEAD) -> int:
+    """Bellek bütçesine sığacak parça satır sayısını hesaplar"""
+    return _rows_for_budget(bytes_per_row(schema), memory_budget_mb, overhead)
+
+
+def iter_csv_chunks(path, schema: Optional[Dict[str, str]] = None,
+                    memory_budget_mb: float = DEFAULT_CHUNK_MEMORY_MB,
+                    usecols: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    CSV dosyasını şemaya göre tiplenmiş, sınırlı boyutlu parçalar halinde okur.
+
+    Args:
+        path (str): CSV dosya yolu
+        schema (dict): Sütun adı -> dtype eşlemesi (varsayılan: BOSTON_SCHEMA)
+        memory_budget_mb (float): Bir parçanın kullanabileceği yaklaşık bellek (MB)
+        usecols (list): Yalnızca okunacak sütunlar
+
+    Yields:
+        pd.DataFrame: Veri parçası
+    """
+    schema = schema if schema is not None else BOSTON_SCHEMA
+    if usecols is not None:
+        schema = {col: dtype for col, dtype in schema.items() if col in usecols}
+    chunk_rows = estimate_chunk_rows(schema, memory_budget_mb)
+    reader = pd.read_csv(path, dtype=schema, usecols=usecols,
+                         chunksize=chunk_rows, engine='c')
+    with reader:
+        for chunk in reader:
+            yield chunk
+
+
+def iter_chunks(path, schema: Optional[Dict[str, str]] = None,
+                memory_budget_mb: float = DEFAULT_CHUNK_MEMORY_MB,
+                usecols: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Dosyayı formatına göre parçalar halinde okur. Parquet/Feather dosyalarında
+    parçalar kayıt grupları (record batch) olarak okunur; metin ayrıştırması yapılmaz.
+    """
+    fmt = detect_format(path)
+    if fmt == 'csv':
+        yield from iter_csv_chunks(path, schema, memory_budget_mb, usecols)
+        return
+
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+
+    dataset = ds.dataset(str(path), format='parquet' if fmt == 'parquet' else 'ipc',
+                         partitioning='hive' if os.path.isdir(str(path)) else None)
+    batch_rows = _rows_for_budget(_arrow_bytes_per_row(dataset.schema), memory_budget_mb)
+    for batch in dataset.to_batches(columns=usecols, batch_size=batch_rows):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+class ChunkWriter:
+    """
+    Parçaları tek bir çıktı dosyasına sırayla ekleyen yazıcı.
+    CSV'de satırlar eklenir; Parquet'te her parça bir satır grubu,
+    Feather'da bir kayıt grubu olarak yazılır.
+    """
+    def __init__(self, path, compression: Optional[str] = None):
+        self.path = path
+        self.format = detect_format(path)
+        self.compression = compression if compression is not None else DEFAULT_COMPRESSION[self.format]
+        self._writer = None
+        self._schema = None
+        self.rows_written = 0
+
+    def write(self, df: pd.DataFrame) -> None:
+        if self.format == 'csv':
+            df.to_csv(self.path, mode='w' if self._schema is None else 'a',
+                      header=self._schema is None, index=False, compression=self.compression)
+            self._schema = list(df.columns)
+        else:
+            import pyarrow as pa
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            if self._writer is None:
+                self._schema = table.schema
+                if self.format == 'parquet':
+                    import pyarrow.parquet as pq
+                    self._writer = pq.ParquetWriter(self.path, table.schema, compression=self.compression)
+                else:
+                    options = pa.ipc.IpcWriteOptions(compression=self.compression)
+                    self._writer = pa.ipc.new_file(self.path, table.schema, options=options)
+            self._writer.write_table(table)
+        self.rows_written += len(df)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        if self.format != 'csv':
+            _require_pyarrow()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def numeric_block(df: pd.DataFrame, columns, dtype=np.float32) -> np.ndarray:
+    """Sayısal sütunları eksik değerleri NaN olan tek bir numpy dizisine çevirir"""
+    return df[columns].to_numpy(dtype=dtype, na_value=np.nan)
@@ -1,17 +1,364 @@
 # src/data_processing/visualizer.py
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.colors import LogNorm
 import seaborn as sns
 import pandas as pd
+import plotly
 import plotly.express as px
-from typing import Optional, List
+from typing import Callable, Dict, Iterator, Optional, List, Tuple
+import functools
+import inspect
+import json
 import numpy as np
 import os
+import time
+from scipy import stats
+from threadpoolctl import threadpool_limits
+
+from .cache import FigureCache, column_fingerprint, params_key
+from .density import ColumnDensity, draw_boxplot, draw_distribution, summarize_column
+from .missingness import MissingnessMap
+
+# Paralel modda işçi süreçlerinde kullanılan görselleştirici
+_WORKER_VISUALIZER: Optional['BostonVisualizer'] = None
+
+# Grafik işi: (dosya adı, metot adı, argümanlar)
+VisualJob = Tuple[str, str, Dict]
+
+# Bu satır sayısının üzerinde scatter/pairplot noktalar yerine 2B yoğunluk (bin) olarak çizilir
+LARGE_DATA_ROWS = 100_000
+# Yoğunluk grafiklerinde eksen başına bin sayısı (scatter, pairplot panelleri)
+DENSITY_BINS = 200
+PAIRPLOT_DENSITY_BINS = 60
+DIAG_KINDS = ('hist', 'kde')
+# Çıktı kalite ön ayarları: çözünürlük, dosya formatı, yoğun katmanların rasterleştirilmesi
+# (yalnızca vektör formatlarda) ve sıkı kenar (bbox_inches='tight') hesabı
+RENDER_PRESETS = {
+    'draft': {'dpi': 72, 'format': 'webp', 'rasterize': True, 'tight': False},
+    'standard': {'dpi': 150, 'format': 'png', 'rasterize': True, 'tight': True},
+    'publication': {'dpi': 300, 'format': 'png', 'rasterize': False, 'tight': True},
+}
+IMAGE_FORMATS = ('png', 'webp', 'svg', 'pdf')
+VECTOR_FORMATS = ('svg', 'pdf')
+# Vektör çıktıda bu kadar veya daha fazla öğe içeren katmanlar rasterleştirilir
+RASTERIZE_MIN_ARTISTS = 2000
+# Bu satır sayısının üzerinde interaktif grafik WebGL (scattergl) ile çizilir ve
+# yalnızca eksen/renk sütunları hover'da gösterilir
+INTERACTIVE_WEBGL_ROWS = 10_000
+# plotly >= 6 numpy dizilerini HTML'e ikili (base64 typed array) olarak gömer; daha eski
+# sürümler JSON listesi yazar ve float32 dönüşümü yalnızca yuvarlama gürültüsü ekler
+PLOTLY_TYPED_ARRAYS = int(plotly.__version__.split('.')[0]) >= 6
+# Kaydedilen görüntüyü etkilemeyen oturum ayarları grafik önbelleği anahtarına girmez
+# (işçiler Agg'e geçtiğinden backend farkı seri ve paralel kayıtları ayırırdı)
+SESSION_RCPARAMS = ('backend', 'backend_fallback', 'interactive', 'toolbar', 'timezone')
+SESSION_RCPARAM_PREFIXES = ('keymap.', 'webagg.')
+
+
+def _finite_pairs(x, y) -> Tuple[np.ndarray, np.ndarray]:
+    """İki sütunda da sonlu olan değer çiftleri (float64)"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    keep = np.isfinite(x) & np.isfinite(y)
+    return x[keep], y[keep]
+
+
+def _bin_indices(values: np.ndarray, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Eşit genişlikli binlerin kenarları ve her değerin bin indeksi (O(n), sıralama yok)"""
+    low, high = (values.min(), values.max()) if len(values) else (0.0, 1.0)
+    if high <= low:
+        low, high = low - 0.5, high + 0.5
+    edges = np.linspace(low, high, bins + 1)
+    index = ((values - low) * (bins / (high - low))).astype(np.intp)
+    np.clip(index, 0, bins - 1, out=index)
+    return edges, index
+
+
+def binned_counts_2d(x, y, bins: int = DENSITY_BINS) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    İki boyutlu histogram (np.histogram2d ile aynı eşit genişlikli binler, tek bincount ile).
+
+    Returns:
+        tuple: (sayımlar [x_bin, y_bin], x kenarları, y kenarları)
+    """
+    x, y = _finite_pairs(x, y)
+    x_edges, x_index = _bin_indices(x, bins)
+    y_edges, y_index = _bin_indices(y, bins)
+    counts = np.bincount(x_index * bins + y_index, minlength=bins * bins).reshape(bins, bins)
+    return counts, x_edges, y_edges
+
+
+def linear_fit_band(x, y, ci: float = 0.95, points: int = 100) -> Dict[str, np.ndarray]:
+    """
+    En küçük kareler doğrusu ve ortalama tahmin için kapalı formda güven aralığı.
+
+    Bootstrap yerine t dağılımı kullanılır: se(x0) = s * sqrt(1/n + (x0 - x̄)² / Sxx).
+
+    Returns:
+        dict: grid, fit, lower, upper dizileri ile slope ve intercept
+    """
+    x, y = _finite_pairs(x, y)
+    n = len(x)
+    if n < 3:
+        raise ValueError("Regresyon doğrusu için en az 3 geçerli nokta gerekir")
+    x_mean, y_mean = x.mean(), y.mean()
+    dx = x - x_mean
+    sxx = np.dot(dx, dx)
+    slope = np.dot(dx, y - y_mean) / sxx if sxx > 0 else 0.0
+    intercept = y_mean - slope * x_mean
+    residuals = y - (intercept + slope * x)
+    s = np.sqrt(np.dot(residuals, residuals) / (n - 2))
+
+    grid = np.linspace(x.min(), x.max(), points)
+    fit = intercept + slope * grid
+    leverage = 1.0 / n + ((grid - x_mean) ** 2 / sxx if sxx > 0 else 0.0)
+    half_width = stats.t.ppf(0.5 + ci / 2, n - 2) * s * np.sqrt(leverage)
+    return {'grid': grid, 'fit': fit, 'lower': fit - half_width, 'upper': fit + half_width,
+            'slope': slope, 'intercept': intercept}
+
+
+def decimate_points(x, y, max_points: int, random_state: int = 0) -> np.ndarray:
+    """
+    Nokta sayısını max_points'e indirirken seyrek bölgeleri korur.
+
+    Önce yaklaşık max_points / 4 hücrelik bir ızgarada dolu her hücreden bir nokta
+    alınır (aykırı ve seyrek noktalar kaybolmaz), kalan kota geri kalan noktalardan
+    rastgele doldurulur. Eksen değeri eksik olan satırlar atlanır.
+
+    Returns:
+        np.ndarray: Korunan satırların artan sıralı konum indeksleri
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    valid = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+    if len(valid) <= max_points:
+        return valid
+    bins = max(int(np.sqrt(max_points / 4)), 1)
+    _, x_index = _bin_indices(x[valid], bins)
+    _, y_index = _bin_indices(y[valid], bins)
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(len(valid))
+    # Karıştırılmış sırada her hücrenin ilk noktası o hücrenin rastgele temsilcisidir
+    _, first = np.unique((x_index * bins + y_index)[order], return_index=True)
+    keep = np.zeros(len(valid), dtype=bool)
+    keep[order[first[:max_points]]] = True
+    remaining = max_points - int(keep.sum())
+    if remaining > 0:
+        rest = order[~keep[order]]
+        keep[rest[:remaining]] = True
+    return valid[keep]
+
+
+def _draw_density(ax, x, y, bins: int, cmap: str = "viridis"):
+    """Boş binleri şeffaf bırakarak log ölçekli 2B yoğunluk çizer"""
+    counts, x_edges, y_edges = binned_counts_2d(x, y, bins)
+    masked = np.ma.masked_equal(counts.T, 0)
+    norm = LogNorm(vmin=1, vmax=max(int(counts.max()), 2))
+    return ax.pcolormesh(x_edges, y_edges, masked, cmap=cmap, norm=norm, rasterized=True)
+
+
+def _draw_trendline(ax, x, y, ci: float = 0.95):
+    """
+    Regresyon doğrusu ve güven bandı. 3'ten az geçerli noktada bant hesaplanamaz:
+    iki noktada yalnızca doğru çizilir, daha azında hiçbir şey çizilmez.
+    """
+    x, y = _finite_pairs(x, y)
+    if len(x) < 3:
+        if len(x) == 2 and x[0] != x[1]:
+            order = np.argsort(x)
+            ax.plot(x[order], y[order], color="darkred", linewidth=2, linestyle="--")
+        return None
+    band = linear_fit_band(x, y, ci)
+    ax.fill_between(band['grid'], band['lower'], band['upper'], color="darkred", alpha=0.15, linewidth=0)
+    ax.plot(band['grid'], band['fit'], color="darkred", linewidth=2, linestyle="--")
+    return band
+
+
+def _density_panel(x, y, **kwargs):
+    """PairGrid alt üçgen paneli: noktalar yerine 2B yoğunluk"""
+    _draw_density(plt.gca(), x, y, PAIRPLOT_DENSITY_BINS)
+
+
+def _rasterize_dense_layers(fig, min_artists: int = RASTERIZE_MIN_ARTISTS) -> int:
+    """
+    Vektör çıktıda yoğun katmanları (çok noktalı scatter, pcolormesh, uzun çizgiler)
+    tek bir bitmap olarak gömülecek şekilde işaretler; eksenler ve yazılar vektör kalır.
+
+    Returns:
+        int: Rasterleştirilen katman sayısı
+    """
+    count = 0
+    for ax in fig.axes:
+        for artist in list(ax.collections) + list(ax.lines):
+            if hasattr(artist, 'get_offsets'):
+                size = max(len(artist.get_offsets()), len(artist.get_paths()))
+            else:
+                size = len(artist.get_xdata())
+            if size >= min_artists:
+                artist.set_rasterized(True)
+                count += 1
+    return count
+
+
+def _cached_figure(path_arg: str, columns: Callable[['BostonVisualizer', Dict], List[str]]):
+    """
+    plot_* metotları için grafik önbelleği. Anahtar, grafiğin kullandığı sütunların
+    özetinden, çağrı parametrelerinden ve stil ayarlarından türetilir; kayıt varsa
+    dosya çizilmeden önbellekten kopyalanır (bu durumda metot None döndürür).
+
+    Args:
+        path_arg (str): Çıktı yolunu taşıyan parametre adı
+        columns (callable): (görselleştirici, parametreler) -> kullanılan sütunlar
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            self.last_cache_hit = False
+            if self.cache is None:
+                return method(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {name: value for name, value in bound.arguments.items() if name != 'self'}
+            path = params.get(path_arg)
+            if not path:
+                return method(self, *args, **kwargs)
+
+            used = [col for col in dict.fromkeys(columns(self, params)) if col is not None]
+            # Çıktı yolu yerine yalnızca uzantısı anahtara girer; aynı grafik başka bir yola da kopyalanabilir
+            params[path_arg] = os.path.splitext(str(path))[1]
+            key = f"{method.__name__}-{self.figure_key(method.__name__, params, used)}"
+            companions = []
+            if str(path).endswith('.html') and params.get('include_plotlyjs') == 'directory':
+                companions.append(os.path.join(os.path.dirname(str(path)), 'plotly.min.js'))
+            if self.cache.restore(key, path, companions):
+                self.last_cache_hit = True
+                print(f"♻ Grafik önbellekten alındı: {path}")
+                return None
+            result = method(self, *args, **kwargs)
+            self.cache.put_file(key, path)
+            return result
+        return wrapper
+    return decorator
+
+
+def _init_worker(df: pd.DataFrame, options: Dict) -> None:
+    """İşçi sürecini başsız (Agg) çizime hazırlar; veri süreç başına bir kez aktarılır"""
+    global _WORKER_VISUALIZER
+    matplotlib.use('Agg', force=True)
+    # Paralellik süreçler arasında; her işçide BLAS/OpenMP tek iş parçacığıyla sınırlanır
+    threadpool_limits(1)
+    _WORKER_VISUALIZER = BostonVisualizer(df, headless=True, **options)
+
+
+def _render_job(name: str, method: str, kwargs: Dict, visualizer: Optional['BostonVisualizer'] = None) -> Dict:
+    """Tek bir grafiği üretir; hata yükseltmek yerine kayda yazar"""
+    visualizer = visualizer or _WORKER_VISUALIZER
+    path = kwargs.get('save_path') or kwargs.get('output_path')
+    record = {'name': name, 'path': path, 'status': 'ok', 'error': None, 'bytes': None, 'cached': False}
+    start = time.perf_counter()
+    try:
+        getattr(visualizer, method)(**kwargs)
+        record['bytes'] = os.path.getsize(path)
+        record['cached'] = visualizer.last_cache_hit
+    except Exception as e:
+        record.update(status='error', error=f"{type(e).__name__}: {e}")
+        plt.close('all')
+    record['seconds'] = time.perf_counter() - start
+    return record
+
 
 class BostonVisualizer:
-    def __init__(self, df: pd.DataFrame):
+    """
+    Boston Housing veri seti için grafik üretici.
+
+    Args:
+        df (pd.DataFrame): Görselleştirilecek veri
+        headless (bool): True ise kayıt yolu verilmeyen grafikler gösterilmez, yalnızca kapatılır
+        cache_dir (str): Çizilmiş grafiklerin önbellek klasörü (None ise önbellek kapalı)
+        cache_max_mb (float): Önbelleğin kaplayabileceği en fazla disk alanı (MB)
+        preset (str): Çıktı kalite ön ayarı ('draft', 'standard' veya 'publication');
+            varsayılan 'publication' 300 dpi PNG üretir
+        image_format (str): Ön ayarın dosya formatını değiştirir ('png', 'webp', 'svg', 'pdf')
+
+    Not:
+        Sütun özetleri nesne ömrü boyunca saklanır; self.df yerinde değiştirilirse
+        invalidate_cache(fingerprints_only=True) çağrılmalıdır.
+    """
+    def __init__(self, df: pd.DataFrame, headless: bool = False, cache_dir: Optional[str] = None,
+                 cache_max_mb: float = 512, preset: str = 'publication',
+                 image_format: Optional[str] = None):
+        if preset not in RENDER_PRESETS:
+            raise ValueError(f"Bilinmeyen çıktı ön ayarı: {preset} (seçenekler: {', '.join(RENDER_PRESETS)})")
+        if image_format is not None and image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Desteklenmeyen görüntü formatı: {image_format} "
+                             f"(seçenekler: {', '.join(IMAGE_FORMATS)})")
         self.df = df
+        self.headless = headless
+        self.cache_dir = str(cache_dir) if cache_dir else None
+        self.cache_max_mb = cache_max_mb
+        self.preset = preset
+        self.image_format = image_format
+        self.render = dict(RENDER_PRESETS[preset], **({'format': image_format} if image_format else {}))
+        self.cache = FigureCache(cache_dir, cache_max_mb) if cache_dir else None
+        self.last_cache_hit = False
+        self._column_digests: Dict[str, str] = {}
+        self._densities: Dict[str, ColumnDensity] = {}
         self._set_style()
 
+    def _column_digest(self, column: str) -> str:
+        if column not in self._column_digests:
+            self._column_digests[column] = column_fingerprint(self.df[column])
+        return self._column_digests[column]
+
+    def density(self, column: str) -> ColumnDensity:
+        """
+        Sütunun binlenmiş dağılım özeti (histogram, FFT KDE, kutu grafiği istatistikleri).
+        Her sütun bir kez özetlenir; plot_distribution ve plot_pairplot aynı özeti kullanır.
+        """
+        if column not in self._densities:
+            self._densities[column] = summarize_column(self.df[column], name=column)
+        return self._densities[column]
+
+    def _diagonal_panel(self, kind: str):
+        """PairGrid köşegen paneli: önceden hesaplanmış özetten KDE veya histogram"""
+        def panel(x, color=None, **kwargs):
+            summary = self.density(x.name)
+            ax = plt.gca()
+            if kind == 'kde':
+                grid, density = summary.kde()
+                ax.fill_between(grid, density, color=color, alpha=0.7)
+            else:
+                draw_distribution(ax, summary, kde=False, color=color, alpha=0.7)
+        return panel
+
+    def figure_key(self, plot: str, params: Dict, columns: List[str]) -> str:
+        """Grafik önbelleği anahtarı: sütun özetleri + parametreler + stil ve kütüphane sürümleri"""
+        style = sorted((name, repr(value)) for name, value in plt.rcParams.items()
+                       if name not in SESSION_RCPARAMS and not name.startswith(SESSION_RCPARAM_PREFIXES))
+        versions = (matplotlib.__version__, sns.__version__, plotly.__version__)
+        return params_key(plot, params, [(col, self._column_digest(col)) for col in columns],
+                          len(self.df), self.render, style, sns.color_palette().as_hex(), versions)
+
+    def invalidate_cache(self, plot: Optional[str] = None, fingerprints_only: bool = False) -> None:
+        """
+        Grafik önbelleğini temizler.
+
+        Args:
+            plot (str): Yalnızca bu grafik türünün kayıtları (ör. 'plot_scatter'); None ise tümü
+            fingerprints_only (bool): Yalnızca bellekteki sütun özetlerini sıfırla (veri değiştiyse)
+        """
+        self._column_digests.clear()
+        self._densities.clear()
+        if fingerprints_only or self.cache is None:
+            return
+        if plot is None:
+            self.cache.invalidate()
+        else:
+            self.cache.invalidate_plot(plot)
+
     def _set_style(self):
         """Matplotlib stil ayarları"""
         plt.style.use('seaborn-v0_8')
@@ -20,14 +367,33 @@ class BostonVisualizer:
         plt.rcParams['axes.titlesize'] = 14
         plt.rcParams['axes.labelsize'] = 12
 
+    def _worker_options(self) -> Dict:
+        """İşçi süreçlerinde aynı ayarlarla görselleştirici oluşturmak için parametreler"""
+        return {'cache_dir': self.cache_dir, 'cache_max_mb': self.cache_max_mb,
+                'preset': self.preset, 'image_format': self.image_format}
+
+    @property
+    def image_ext(self) -> str:
+        """Ön ayarın dosya uzantısı (ör. '.png')"""
+        return '.' + self.render['format']
+
     def _save_plot(self, fig, save_path: Optional[str] = None):
-        """Güvenli kayıt fonksiyonu"""
+        """
+        Güvenli kayıt fonksiyonu. Çözünürlük ve kenar hesabı ön ayardan alınır; format
+        dosya uzantısından belirlenir (uzantı yoksa ön ayarın formatı kullanılır).
+        """
         try:
             if save_path:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                fig.savefig(save_path, bbox_inches='tight', dpi=300)
+                os.makedirs(os.path.dirname(save_path) or ".", exist_ok=True)
+                image_format = os.path.splitext(str(save_path))[1][1:].lower() or self.render['format']
+                if self.render['rasterize'] and image_format in VECTOR_FORMATS:
+                    _rasterize_dense_layers(fig)
+                fig.savefig(save_path, format=image_format, dpi=self.render['dpi'],
+                            bbox_inches='tight' if self.render['tight'] else None)
                 plt.close(fig)
                 print(f"✅ Grafik kaydedildi: {save_path}")
+            elif self.headless:
+                plt.close(fig)
             else:
                 plt.show()
         except Exception as e:
@@ -36,16 +402,32 @@ class BostonVisualizer:
             raise
 
     # 1. Eksik Veri Görselleştirme
-    def plot_missing_data(self, save_path: Optional[str] = None, figsize: tuple = (12, 6)) -> None:
-        """Eksik verileri interaktif heatmap ve çubuk grafikle gösterir."""
+    @_cached_figure('save_path', lambda self, p: list(self.df.columns))
+    def plot_missing_data(self, save_path: Optional[str] = None, figsize: tuple = (12, 6),
+                          blocks: int = 500) -> None:
+        """
+        Eksik verileri blok haritası ve çubuk grafikle gösterir.
+
+        Maskeler bit olarak paketlenir (MissingnessMap); satırlar en fazla `blocks`
+        bloğa toplanır ve harita hücre başına bir nesne yerine tek bir görüntü olarak çizilir.
+        """
+        nulls = MissingnessMap.from_frame(self.df)
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
 
-        # Heatmap
-        sns.heatmap(self.df.isnull(), cbar=False, cmap='magma', ax=ax1)
-        ax1.set_title("Eksik Veri Heatmap", pad=20)
+        # Blok haritası (satır sayısı blok sayısından azsa satır başına bir hücre)
+        fractions, block_rows = nulls.block_fractions(blocks)
+        image = ax1.imshow(fractions, aspect='auto', cmap='magma', vmin=0, vmax=1,
+                           interpolation='nearest', extent=(-0.5, len(nulls.columns) - 0.5, nulls.n_rows, 0))
+        ax1.set_xticks(range(len(nulls.columns)))
+        ax1.set_xticklabels(nulls.columns, rotation=90)
+        ax1.set_ylabel("Satır")
+        ax1.grid(False)
+        if block_rows > 1:
+            fig.colorbar(image, ax=ax1, label=f"Eksik oranı ({block_rows} satırlık bloklar)")
+        ax1.set_title("Eksik Veri Haritası", pad=20)
 
         # Çubuk Grafik
-        missing = self.df.isnull().sum().sort_values(ascending=False)
+        missing = nulls.counts().sort_values(ascending=False)
         missing = missing[missing > 0]
         sns.barplot(x=missing.values, y=missing.index, ax=ax2, palette="rocket")
         ax2.set_title("Eksik Veri Sayısı", pad=20)
@@ -55,6 +437,7 @@ class BostonVisualizer:
         self._save_plot(fig, save_path)
 
     # 2. Korelasyon Matrisi
+    @_cached_figure('save_path', lambda self, p: list(self.df.select_dtypes(include=np.number).columns))
     def plot_correlation_matrix(self, save_path: Optional[str] = None, 
                              annot_kws: dict = {"size": 8}) -> None:
         """Dinamik thresholdlu korelasyon matrisi"""
@@ -76,112 +459,246 @@ class BostonVisualizer:
         self._save_plot(heatmap.figure, save_path)
 
     # 3. Dağılım Grafikleri
+    @_cached_figure('save_path', lambda self, p: [p['column'], p['hue']])
     def plot_distribution(self, column: str, save_path: Optional[str] = None, 
                          hue: Optional[str] = None, kde: bool = True) -> None:
-        """Dağılım grafiği + Boxplot kombinasyonu"""
+        """
+        Dağılım grafiği + Boxplot kombinasyonu.
+
+        hue verilmezse histogram, KDE (FFT) ve kutu grafiği sütunun tek seferlik
+        binlenmiş özetinden (density) çizilir; hue ile gruplu çizimde seaborn kullanılır.
+        """
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6),
             gridspec_kw={'width_ratios': [3, 1]})
 
-        # Histogram + KDE
-        sns.histplot(
-            data=self.df, x=column, hue=hue,
-            kde=kde, ax=ax1, palette="viridis",
-            edgecolor="black", linewidth=0.5
-        )
+        if hue is None:
+            summary = self.density(column)
+            draw_distribution(ax1, summary, kde=kde, color=sns.color_palette("viridis", 1)[0],
+                              kde_color="black", edgecolor="black", linewidth=0.5)
+            draw_boxplot(ax2, summary, color="skyblue", width=0.3)
+        else:
+            # Histogram + KDE
+            sns.histplot(
+                data=self.df, x=column, hue=hue,
+                kde=kde, ax=ax1, palette="viridis",
+                edgecolor="black", linewidth=0.5
+            )
+            # Boxplot
+            sns.boxplot(
+                data=self.df, y=column, ax=ax2,
+                color="skyblue", width=0.3,
+                showfliers=True
+            )
         ax1.set_title(f"{column} Dağılımı", pad=15)
-
-        # Boxplot
-        sns.boxplot(
-            data=self.df, y=column, ax=ax2,
-            color="skyblue", width=0.3,
-            showfliers=True
-        )
         ax2.set_title("Boxplot", pad=15)
 
         plt.tight_layout()
         self._save_plot(fig, save_path)
 
+    def _is_large(self, large_data: Optional[bool]) -> bool:
+        """large_data None ise satır sayısına göre (LARGE_DATA_ROWS) karar verir"""
+        return len(self.df) > LARGE_DATA_ROWS if large_data is None else large_data
+
     # 4. Scatter Plot
+    @_cached_figure('save_path', lambda self, p: [p['x_col'], p['y_col'], p['hue'], p['size']])
     def plot_scatter(self, x_col: str, y_col: str,
                save_path: Optional[str] = None,
                hue: Optional[str] = None,
                size: Optional[str] = None,
-               trendline: bool = True) -> None:
-        """Regresyon çizgili ve boyutlandırmalı scatter plot"""
-        plt.figure(figsize=(10, 8))
-        
-        sns.scatterplot(
-            data=self.df,
-            x=x_col, y=y_col,
-            hue=hue, size=size,
-            palette="Set2",
-            alpha=0.7,
-            edgecolor="black"
-        )
+               trendline: bool = True,
+               large_data: Optional[bool] = None,
+               bins: int = DENSITY_BINS) -> None:
+        """
+        Regresyon çizgili ve boyutlandırmalı scatter plot.
 
-        if trendline:
-            sns.regplot(
-                data=self.df, x=x_col, y=y_col,
-                scatter=False, ci=95,
-                line_kws={"color": "darkred", "linewidth": 2, "linestyle": "--"}
+        Büyük veride (large_data=True veya None iken LARGE_DATA_ROWS üzerinde) noktalar
+        yerine 2B yoğunluk çizilir; bu modda hue/size kullanılmaz. Regresyon doğrusu ve
+        %95 güven aralığı her iki modda da kapalı formda hesaplanır.
+        """
+        fig, ax = plt.subplots(figsize=(10, 8))
+
+        if self._is_large(large_data):
+            if hue is not None or size is not None:
+                print("⚠️ Büyük veri modunda hue/size yok sayılıyor")
+            mesh = _draw_density(ax, self.df[x_col], self.df[y_col], bins)
+            fig.colorbar(mesh, ax=ax, label="Gözlem sayısı")
+            ax.set_xlabel(x_col)
+            ax.set_ylabel(y_col)
+            hue = None
+        else:
+            sns.scatterplot(
+                data=self.df,
+                x=x_col, y=y_col,
+                hue=hue, size=size,
+                palette="Set2",
+                alpha=0.7,
+                edgecolor="black",
+                ax=ax
             )
 
-        plt.title(f"{x_col} vs {y_col} İlişkisi", pad=20)
+        if trendline:
+            _draw_trendline(ax, self.df[x_col], self.df[y_col])
+
+        ax.set_title(f"{x_col} vs {y_col} İlişkisi", pad=20)
         
         if hue is not None:
-            plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+            ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
             
-        self._save_plot(plt.gcf(), save_path)
+        self._save_plot(fig, save_path)
 
     # 5. Çoklu Pairplot
+    @_cached_figure('save_path', lambda self, p: list(p['columns']))
     def plot_pairplot(self, columns: List[str],
                      save_path: Optional[str] = None,
-                     diag_kind: str = "kde") -> None:
-        """Özelleştirilmiş pairplot"""
-        pairplot = sns.pairplot(
-            self.df[columns],
-            diag_kind=diag_kind,
-            plot_kws={"alpha": 0.8, "edgecolor": "black"},
-            diag_kws={"fill": True, "alpha": 0.7},
-            corner=True
-        )
+                     diag_kind: str = "kde",
+                     large_data: Optional[bool] = None) -> None:
+        """
+        Özelleştirilmiş pairplot.
+
+        Köşegen panelleri (KDE veya histogram) sütunların önceden hesaplanmış binlenmiş
+        özetlerinden çizilir. Büyük veride paneller nokta yerine 2B yoğunluk, köşegen
+        ise KDE yerine histogram olarak çizilir.
+
+        Raises:
+            ValueError: diag_kind 'hist' veya 'kde' değilse
+        """
+        if diag_kind not in DIAG_KINDS:
+            raise ValueError(f"Bilinmeyen diag_kind: {diag_kind} (seçenekler: {', '.join(DIAG_KINDS)})")
+        pairplot = sns.PairGrid(self.df[columns], corner=True, diag_sharey=False)
+        if self._is_large(large_data):
+            pairplot.map_lower(_density_panel)
+            pairplot.map_diag(self._diagonal_panel('hist'))
+        else:
+            pairplot.map_lower(sns.scatterplot, alpha=0.8, edgecolor="black")
+            pairplot.map_diag(self._diagonal_panel(diag_kind))
         pairplot.fig.suptitle("Özellikler Arası İlişkiler", y=1.02)
         self._save_plot(pairplot.figure, save_path)
 
     # 6. Interaktif Plotly Grafiği
+    @_cached_figure('output_path', lambda self, p: [p['x_col'], p['y_col'], p['color_col']]
+                    + list(self.df.columns if p['hover_cols'] is None else p['hover_cols']))
     def plot_interactive_scatter(self, x_col: str, y_col: str,
                               color_col: Optional[str] = None,
-                              output_path: str = "visuals/interactive_plot.html"):
-        """HTML olarak kaydedilebilen interaktif grafik"""
+                              output_path: str = "visuals/interactive_plot.html",
+                              hover_cols: Optional[List[str]] = None,
+                              max_points: Optional[int] = None,
+                              webgl: Optional[bool] = None,
+                              include_plotlyjs='directory'):
+        """
+        HTML olarak kaydedilebilen interaktif grafik.
+
+        Büyük veride (webgl=None iken INTERACTIVE_WEBGL_ROWS üzerinde) WebGL izleri
+        kullanılır. plotly >= 6 ile ondalıklı sütunlar float32 olarak aktarılır ve HTML'e
+        ikili (base64 typed array) olarak gömülür; daha eski sürümlerde veri değiştirilmez.
+
+        Args:
+            hover_cols (list): Hover'da gösterilecek ek sütunlar (None ise küçük veride
+                tüm sütunlar, büyük veride yalnızca eksen/renk sütunları)
+            max_points (int): Nokta sayısı bunu aşarsa seyrekleştirilir (decimate_points)
+            webgl (bool): WebGL (scattergl) kullanımı (None ise satır sayısına göre)
+            include_plotlyjs: plotly.js'in eklenme şekli; 'directory' ise HTML'in yanına bir
+                kez plotly.min.js yazılır ve aynı klasördeki tüm grafikler onu paylaşır
+                (HTML dosyası plotly.min.js olmadan başka yere taşınırsa açılmaz; tek
+                başına dağıtılacak dosyalar için True veya 'cdn' kullanın), True ise her
+                dosyaya gömülür, 'cdn' ise CDN'den yüklenir
+        """
+        large = len(self.df) > INTERACTIVE_WEBGL_ROWS
+        webgl = large if webgl is None else webgl
+        if hover_cols is None:
+            hover_cols = [] if large else list(self.df.columns)
+        columns = list(dict.fromkeys([x_col, y_col] + ([color_col] if color_col else []) + list(hover_cols)))
+
+        data = self.df[columns]
+        if max_points is not None and len(data) > max_points:
+            keep = decimate_points(data[x_col], data[y_col], max_points)
+            print(f"⚠️ Interaktif grafik için {len(data)} noktadan {len(keep)} tanesi gösteriliyor")
+            data = data.iloc[keep]
+        if PLOTLY_TYPED_ARRAYS:
+            float_cols = data.select_dtypes(include=np.floating).columns
+            data = data.astype({col: np.float32 for col in float_cols})
+
         fig = px.scatter(
-            self.df, x=x_col, y=y_col, color=color_col,
-            hover_data=self.df.columns,
+            data, x=x_col, y=y_col, color=color_col,
+            hover_data=hover_cols,
             title=f"{x_col} vs {y_col} - Interaktif Grafik",
-            width=1000, height=600
+            width=1000, height=600,
+            render_mode='webgl' if webgl else 'svg'
         )
-        fig.write_html(output_path)
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        fig.write_html(output_path, include_plotlyjs=include_plotlyjs)
         print(f"✅ Interaktif grafik kaydedildi: {output_path}")
         return fig
 
     # 7. Tüm Grafikleri Otomatik Oluşturma
-    def generate_all_visuals(self, output_dir: str = "visuals"):
-        """Tüm temel grafikleri otomatik oluşturur ve kaydeder"""
-        visuals = {
-            "missing_data.png": lambda: self.plot_missing_data(f"{output_dir}/missing_data.png"),
-            "correlation_matrix.png": lambda: self.plot_correlation_matrix(f"{output_dir}/correlation_matrix.png"),
-            "medv_distribution.png": lambda: self.plot_distribution("MEDV", f"{output_dir}/medv_distribution.png"),
-            "rm_medv_scatter.png": lambda: self.plot_scatter("RM", "MEDV", f"{output_dir}/rm_medv_scatter.png"),
-            "interactive_plot.html": lambda: self.plot_interactive_scatter("RM", "MEDV", output_path=f"{output_dir}/interactive_plot.html")
-        }
+    def visual_jobs(self, output_dir: str = "visuals") -> List[VisualJob]:
+        """generate_all_visuals tarafından üretilen grafik işleri (dosya adı, metot, argümanlar)"""
+        ext = self.image_ext
+        return [
+            (f"missing_data{ext}", "plot_missing_data", {"save_path": f"{output_dir}/missing_data{ext}"}),
+            (f"correlation_matrix{ext}", "plot_correlation_matrix",
+             {"save_path": f"{output_dir}/correlation_matrix{ext}"}),
+            (f"medv_distribution{ext}", "plot_distribution",
+             {"column": "MEDV", "save_path": f"{output_dir}/medv_distribution{ext}"}),
+            (f"rm_medv_scatter{ext}", "plot_scatter",
+             {"x_col": "RM", "y_col": "MEDV", "save_path": f"{output_dir}/rm_medv_scatter{ext}"}),
+            ("interactive_plot.html", "plot_interactive_scatter",
+             {"x_col": "RM", "y_col": "MEDV", "output_path": f"{output_dir}/interactive_plot.html"}),
+        ]
+
+    def _run_jobs(self, jobs: List[VisualJob], workers: int) -> Iterator[Dict]:
+        """İşleri sırayla veya süreç havuzunda çalıştırır; kayıtları tamamlandıkça döndürür"""
+        if workers == 1:
+            for name, method, kwargs in jobs:
+                yield _render_job(name, method, kwargs, visualizer=self)
+            return
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(self.df, self._worker_options())) as pool:
+            futures = [pool.submit(_render_job, name, method, kwargs) for name, method, kwargs in jobs]
+            for future in as_completed(futures):
+                yield future.result()
 
+    def generate_all_visuals(self, output_dir: str = "visuals", workers: Optional[int] = 1,
+                             jobs: Optional[List[VisualJob]] = None) -> pd.DataFrame:
+        """
+        Tüm temel grafikleri otomatik oluşturur ve kaydeder.
+
+        workers > 1 ise grafikler bir süreç havuzunda paralel çizilir; işçiler Agg
+        arka ucunu kullanır ve veri her işçiye bir kez aktarılır. Üretilen dosyalar
+        output_dir/manifest.json dosyasına da yazılır.
+
+        Args:
+            output_dir (str): Grafiklerin kaydedileceği klasör
+            workers (int): Süreç sayısı (None ise çekirdek sayısı; 1 ise aynı süreçte sırayla)
+            jobs (list): Üretilecek grafik işleri (None ise visual_jobs(output_dir))
+
+        Returns:
+            pd.DataFrame: Grafik başına manifesto (name, path, status, error, seconds, bytes, cached)
+        """
+        jobs = self.visual_jobs(output_dir) if jobs is None else jobs
         os.makedirs(output_dir, exist_ok=True)
-        for name, func in visuals.items():
-            try:
-                func()
-            except Exception as e:
-                print(f"❌ {name} oluşturulurken hata: {str(e)}")
+        workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        start = time.perf_counter()
+
+        records = []
+        for record in self._run_jobs(jobs, workers):
+            records.append(record)
+            if record['status'] != 'ok':
+                print(f"❌ {record['name']} oluşturulurken hata: {record['error']}")
+
+        order = {name: i for i, (name, _, _) in enumerate(jobs)}
+        records.sort(key=lambda record: order[record['name']])
+        manifest = pd.DataFrame(records, columns=['name', 'path', 'status', 'error', 'seconds', 'bytes',
+                                                  'cached'])
+        with open(os.path.join(output_dir, "manifest.json"), 'w', encoding='utf-8') as f:
+            json.dump({'workers': workers, 'wall_s': time.perf_counter() - start, 'visuals': records},
+                      f, ensure_ascii=False, indent=2)
+        failed = int((manifest['status'] != 'ok').sum())
+        print(f"📊 {len(manifest) - failed}/{len(manifest)} grafik üretildi "
+              f"({workers} işçi, {time.perf_counter() - start:.1f} sn)")
+        return manifest
 
     # visualizer.py'ye eklenmesi gereken yeni fonksiyon
+    @_cached_figure('save_path', lambda self, p: [p['column']])
     def plot_boxplot(self, column: str, save_path: Optional[str] = None):
         """Tek bir sütun için boxplot çizer"""
         plt.figure(figsize=(10, 6))
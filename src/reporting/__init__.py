@@ -6,11 +6,13 @@ modüler bir altyapı sunar.
 """
 from .report_generator import ReportGenerator
 from .core import PdfReport
+from .statistics import ReportStatistics
 from .templates import DataAnalysisReport, BaseReport, CustomReport
 
 __all__ = [
     'ReportGenerator',
     'PdfReport',
+    'ReportStatistics',
     'DataAnalysisReport',
     'BaseReport',
     'CustomReport'
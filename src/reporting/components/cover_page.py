@@ -3,9 +3,11 @@ from datetime import datetime
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
-from ..core import ReportComponent
+from ..core import Page, ReportComponent
 
 class CoverPage(ReportComponent):
+    numbered = False
+
     def __init__(self, title="BOSTON KONUT ANALİZ RAPORU", 
                  subtitle=None, 
                  author="HAREZMİ INTELLIGENCE", 
@@ -17,6 +19,8 @@ class CoverPage(ReportComponent):
         self.author = author
         self.logo_path = logo_path
         self.date_format = date_format
+        # Tarih bileşen oluşturulurken sabitlenir; sayfa önbelleği aynı dakika içinde geçerlidir
+        self.created_at = datetime.now().strftime(date_format)
         self.theme = theme_config or {
             "primary": "#2E86AB",
             "secondary": "#F18F01",
@@ -25,7 +29,7 @@ class CoverPage(ReportComponent):
             "accent": "#00E5E0"  # Logo'daki turkuaz renk
         }
 
-    def render(self, pdf):
+    def iter_pages(self):
         # Koyu arka planlı tam sayfa figür oluştur
         fig, ax = plt.subplots(figsize=self.figsize)
         fig.patch.set_facecolor(self.theme["background"])
@@ -63,11 +67,10 @@ class CoverPage(ReportComponent):
                 fontsize=14, color=self.theme["text_color"],
                 transform=ax.transAxes)
         
-        plt.text(0.5, 0.12, f"Oluşturulma Tarihi: {datetime.now().strftime(self.date_format)}", 
+        plt.text(0.5, 0.12, f"Oluşturulma Tarihi: {self.created_at}", 
                 ha='center', va='center', 
                 fontsize=12, color=self.theme["text_color"],
                 alpha=0.7, transform=ax.transAxes)
         
         plt.axis('off')
-        pdf.savefig(bbox_inches='tight', dpi=300, facecolor=self.theme["background"])
-        plt.close()
\ No newline at end of file
+        yield Page(fig, bbox_inches='tight', dpi=300, facecolor=self.theme["background"])
\ No newline at end of file
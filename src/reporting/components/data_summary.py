@@ -1,43 +1,47 @@
 """
 Veri özeti rapor bileşeni
 """
-import matplotlib.pyplot as plt
 import pandas as pd
 from ..core import ReportComponent
-from ..utils import format_dataframe_summary
+from ..text_layout import TextFlow
+from ..utils import format_dataframe_summary, format_describe_table
 
 class DataSummary(ReportComponent):
     """
     Veri özeti rapor bileşeni
     """
-    def __init__(self, df, title="VERİ ÖZETİ"):
+    def __init__(self, df, title="VERİ ÖZETİ", stats=None):
         """
         Args:
             df (pd.DataFrame): Özeti oluşturulacak veri çerçevesi
             title (str): Başlık
+            stats (ReportStatistics): Raporun ortak istatistikleri (None ise df'ten hesaplanır)
         """
         super().__init__(title, figsize=(11, 8.5))
         self.df = df
+        self.stats = stats
         
-    def render(self, pdf):
-        """
-        Veri özeti sayfasını oluşturur ve PDF'e ekler
-        
-        Args:
-            pdf (PdfPages): PDF sayfaları
-        """
-        plt.figure(figsize=self.figsize)
-        
-        # Başlık
-        plt.text(0.5, 0.95, self.title, 
-                ha='center', va='center', fontsize=16, fontweight='bold')
-        
+    def _layout(self):
         # İstatistiksel özet için bir tablo hazırla
-        stats_text = format_dataframe_summary(self.df)
+        if self.stats is not None:
+            stats_text = format_describe_table(self.stats.describe())
+        else:
+            stats_text = format_dataframe_summary(self.df)
         
-        plt.text(0.1, 0.8, stats_text, 
-                ha='left', va='top', fontsize=9, family='monospace')
+        flow = TextFlow(self.title, size=self.figsize)
+        # Her özellik bloğu ayrı paragraf; uzun tablolar sonraki sayfalara taşar
+        for block in stats_text.strip().split('\n\n'):
+            flow.paragraph(block, size=9, monospace=True)
+        return flow.pages()
+
+    def iter_pages(self):
+        """
+        Veri özeti sayfalarını üretir
         
-        plt.axis('off')
-        pdf.savefig(bbox_inches='tight')
-        plt.close()
\ No newline at end of file
+        Yields:
+            TextPage: Metin sayfası
+        """
+        yield from self._take_layout()
+
+    def estimate_pages(self):
+        return self._estimate_layout()
\ No newline at end of file
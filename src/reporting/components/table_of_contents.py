@@ -1,18 +1,21 @@
 """
 Rapor içindekiler sayfası bileşeni
 """
-from matplotlib.patches import Rectangle
-import matplotlib.pyplot as plt
 from ..core import ReportComponent
+from ..text_layout import TextPage
 
 class TableOfContents(ReportComponent):
     """
-    Rapor içindekiler sayfası bileşeni
+    Rapor içindekiler sayfası bileşeni. Sayfa referansları, bölümlerle aynı
+    toc_label'a sahip bileşenlerden rapor yazıcısı tarafından doldurulur.
     """
+    numbered = False
+
     def __init__(self, sections, theme_config=None):
         """
         Args:
             sections (list): Bölüm başlıklarının listesi
+            theme_config (dict): Renk teması
         """
         super().__init__("İÇİNDEKİLER", figsize=(11, 8.5))
         self.sections = sections
@@ -23,33 +26,38 @@ class TableOfContents(ReportComponent):
             "text_color": "#212121",
             "accent": "#00E5E0"
         }
+        self.page_refs = {}
+
+    def set_page_refs(self, refs):
+        self.page_refs = dict(refs)
         
-    def render(self, pdf):
+    def iter_pages(self):
         """
-        İçindekiler sayfasını oluşturur ve PDF'e ekler
+        İçindekiler sayfasını üretir
         
-        Args:
-            pdf (PdfPages): PDF sayfaları
+        Yields:
+            TextPage: Metin sayfası
         """
-        fig, ax = plt.subplots(figsize=self.figsize)
-        fig.patch.set_facecolor(self.theme["background"])
+        page = TextPage(self.figsize, background=self.theme["background"])
+        w, h = page.width, page.height
         
         # İnce turkuaz bir başlık çizgisi ekle
-        ax.add_patch(Rectangle((0.1, 0.87), 0.8, 0.01, 
-                             color=self.theme["accent"], 
-                             alpha=0.7))
+        page.rect(0.1 * w, 0.87 * h, 0.8 * w, 0.01 * h, self.theme["accent"], alpha=0.7)
         
         # Başlık
-        plt.text(0.5, 0.9, self.title, 
-                ha='center', va='center', fontsize=18, fontweight='bold',
-                color=self.theme["primary"])
+        page.text(0.5 * w, 0.9 * h, self.title, size=18, weight='bold',
+                  color=self.theme["primary"], ha='center')
         
-        # Bölümler
+        # Bölümler (taban çizgisi, satır ortası hizası için font boyutunun ~üçte biri aşağıda)
         for i, section in enumerate(self.sections):
-            plt.text(0.2, 0.8 - i*0.1, section, 
-                    ha='left', va='center', fontsize=12, 
-                    color=self.theme["text_color"])
+            y = (0.8 - i*0.1) * h
+            page.text(0.2 * w, y - 4, section, size=12, color=self.theme["text_color"])
+            
+            # Sayfa referansı (noktalı çizgiyle)
+            number = self.page_refs.get(section)
+            if number is not None:
+                page.line(0.6 * w, y - 4, 0.76 * w, y - 4, color=self.theme["text_color"],
+                          dashes=[1, 3], alpha=0.5)
+                page.text(0.8 * w, y - 4, number, size=12, color=self.theme["text_color"], ha='right')
         
-        plt.axis('off')
-        pdf.savefig(bbox_inches='tight')
-        plt.close()
\ No newline at end of file
+        yield page
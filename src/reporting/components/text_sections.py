@@ -1,8 +1,11 @@
 """
 Metin ve başlık bileşenleri
+
+Sayfalar matplotlib figürü yerine yerel PDF metin sayfaları (TextPage) olarak
+üretilir; uzun metinler satırlara bölünür ve gerekirse sonraki sayfalara taşar.
 """
-import matplotlib.pyplot as plt
 from ..core import ReportComponent
+from ..text_layout import TextFlow, TextPage
 
 class TitlePage(ReportComponent):
     """
@@ -15,19 +18,16 @@ class TitlePage(ReportComponent):
         """
         super().__init__(title, figsize=(11, 8.5))
         
-    def render(self, pdf):
+    def iter_pages(self):
         """
-        Başlık sayfasını oluşturur ve PDF'e ekler
+        Başlık sayfasını üretir
         
-        Args:
-            pdf (PdfPages): PDF sayfaları
+        Yields:
+            TextPage: Metin sayfası
         """
-        plt.figure(figsize=self.figsize)
-        plt.text(0.5, 0.5, self.title, 
-                ha='center', va='center', fontsize=16, fontweight='bold')
-        plt.axis('off')
-        pdf.savefig(bbox_inches='tight')
-        plt.close()
+        page = TextPage(self.figsize)
+        page.text(page.width / 2, page.height / 2, self.title, size=16, weight='bold', ha='center')
+        yield page
 
 class TextSection(ReportComponent):
     """
@@ -43,28 +43,21 @@ class TextSection(ReportComponent):
         super().__init__(title, figsize=(11, 8.5))
         self.text = text
         self.fontsize = fontsize
+
+    def _layout(self):
+        return TextFlow(self.title, size=self.figsize).paragraph(self.text, size=self.fontsize).pages()
         
-    def render(self, pdf):
+    def iter_pages(self):
         """
-        Metin bölümünü oluşturur ve PDF'e ekler
+        Metin bölümünü üretir (uzun metin birden fazla sayfaya taşar)
         
-        Args:
-            pdf (PdfPages): PDF sayfaları
+        Yields:
+            TextPage: Metin sayfası
         """
-        plt.figure(figsize=self.figsize)
-        
-        # Başlık
-        plt.text(0.5, 0.95, self.title, 
-                ha='center', va='center', fontsize=16, fontweight='bold')
-        
-        # Metin
-        plt.text(0.1, 0.8, self.text, 
-                ha='left', va='top', fontsize=self.fontsize, 
-                wrap=True)
-        
-        plt.axis('off')
-        pdf.savefig(bbox_inches='tight')
-        plt.close()
+        yield from self._take_layout()
+
+    def estimate_pages(self):
+        return self._estimate_layout()
 
 
 # text_sections.py'a eklenecek yeni FindingsSummary sınıfı
@@ -81,26 +74,21 @@ class FindingsSummary(ReportComponent):
         """
         super().__init__(title, figsize=(11, 8.5))
         self.findings = findings if isinstance(findings, list) else [findings]
+
+    def _layout(self):
+        flow = TextFlow(self.title, size=self.figsize)
+        for i, finding in enumerate(self.findings):
+            flow.paragraph(f"{i+1}. {finding}", size=12, box='#f8f9fa', space_after=12)
+        return flow.pages()
         
-    def render(self, pdf):
+    def iter_pages(self):
         """
-        Bulgular özeti sayfasını oluşturur ve PDF'e ekler
+        Bulgular özeti sayfalarını üretir
         
-        Args:
-            pdf (PdfPages): PDF sayfaları
+        Yields:
+            TextPage: Metin sayfası
         """
-        plt.figure(figsize=self.figsize)
-        
-        # Başlık
-        plt.text(0.5, 0.95, self.title, 
-                ha='center', va='center', fontsize=16, fontweight='bold')
-        
-        # Bulgular listesi
-        for i, finding in enumerate(self.findings):
-            plt.text(0.1, 0.85 - i*0.1, f"{i+1}. {finding}", 
-                    ha='left', va='top', fontsize=12, 
-                    wrap=True, bbox=dict(facecolor='#f8f9fa', alpha=0.5))
-        
-        plt.axis('off')
-        pdf.savefig(bbox_inches='tight')
-        plt.close()
\ No newline at end of file
+        yield from self._take_layout()
+
+    def estimate_pages(self):
+        return self._estimate_layout()
@@ -6,8 +6,11 @@ import seaborn as sns
 import numpy as np
 import pandas as pd
 import os
-from ..core import ReportComponent
-from ..utils import get_image_files, load_image
+from ..core import Page, ReportComponent
+from ..image_pages import ImagePage, encode_image
+from ..text_layout import LINE_SPACING, POINTS_PER_INCH, wrap_text
+from ..utils import iter_image_files
+from ...data_processing.density import draw_distribution, summarize_frame
 
 # visualizations.py içindeki CommentedGraph sınıfını kullanıma hazır hale getirelim
 
@@ -15,23 +18,25 @@ class CorrelationMatrix(ReportComponent):
     """
     Korelasyon matrisi rapor bileşeni
     """
-    def __init__(self, df, title="KORELASYON ANALİZİ", add_comments=True):
+    def __init__(self, df, title="KORELASYON ANALİZİ", add_comments=True, stats=None):
         """
         Args:
             df (pd.DataFrame): Korelasyon hesaplanacak veri çerçevesi
             title (str): Başlık
             add_comments (bool): Otomatik yorum eklensin mi?
+            stats (ReportStatistics): Raporun ortak istatistikleri (None ise df'ten hesaplanır)
         """
         super().__init__(title, figsize=(11, 8))
         self.df = df
         self.add_comments = add_comments
+        self.stats = stats
         
-    def render(self, pdf):
+    def iter_pages(self):
         """
-        Korelasyon matrisi sayfasını oluşturur ve PDF'e ekler
+        Korelasyon matrisi sayfasını üretir
         
-        Args:
-            pdf (PdfPages): PDF sayfaları
+        Yields:
+            Page: Sayfa figürü
         """
         fig = plt.figure(figsize=self.figsize)
         
@@ -45,7 +50,7 @@ class CorrelationMatrix(ReportComponent):
         plt.suptitle(self.title, fontsize=16, y=0.98)
         
         # Korelasyon matrisi
-        corr = self.df.corr(numeric_only=True)
+        corr = self.stats.correlation if self.stats is not None else self.df.corr(numeric_only=True)
         mask = np.triu(np.ones_like(corr, dtype=bool))
         sns.heatmap(corr, mask=mask, annot=True, fmt=".2f", cmap="coolwarm",
                    cbar_kws={"shrink": 0.8}, annot_kws={"size": 8}, ax=plot_area)
@@ -56,8 +61,10 @@ class CorrelationMatrix(ReportComponent):
             comment_area.axis('off')
             
             # En yüksek korelasyonları bul
-            corr_no_diag = corr.copy()
-            np.fill_diagonal(corr_no_diag.values, 0)
+            # pandas copy-on-write'ta .values salt okunur olabilir; köşegen numpy kopyasında sıfırlanır
+            values = corr.to_numpy(copy=True)
+            np.fill_diagonal(values, 0)
+            corr_no_diag = pd.DataFrame(values, index=corr.index, columns=corr.columns)
             max_corr = corr_no_diag.abs().unstack().sort_values(ascending=False)[:3]
             
             comment = f"En yüksek korelasyonlar: "
@@ -71,37 +78,39 @@ class CorrelationMatrix(ReportComponent):
                                               alpha=0.8, boxstyle='round,pad=0.5'))
         
         plt.tight_layout(rect=[0, 0, 1, 0.95])
-        pdf.savefig(bbox_inches='tight')
-        plt.close()
+        yield Page(fig, bbox_inches='tight')
 
 class DistributionPlots(ReportComponent):
     """
     Dağılım grafikleri rapor bileşeni
     """
-    def __init__(self, df, title="DAĞILIM ANALİZİ", max_cols=4):
+    def __init__(self, df, title="DAĞILIM ANALİZİ", max_cols=4, stats=None):
         """
         Args:
             df (pd.DataFrame): Dağılımları çizilecek veri çerçevesi
             title (str): Başlık
             max_cols (int): Bir sayfada gösterilecek maksimum sütun sayısı
+            stats (ReportStatistics): Raporun ortak istatistikleri (None ise df'ten hesaplanır)
         """
         super().__init__(title, figsize=(11, 8))
         self.df = df
         self.max_cols = max_cols
+        self.stats = stats
         
-    def render(self, pdf):
+    def iter_pages(self):
         """
-        Dağılım grafikleri sayfasını oluşturur ve PDF'e ekler
+        Dağılım grafikleri sayfalarını üretir
         
-        Args:
-            pdf (PdfPages): PDF sayfaları
+        Yields:
+            Page: Sayfa figürü
         """
-        # Sayısal sütunları seç
-        num_cols = self.df.select_dtypes(include=np.number).columns
+        # Sayısal sütunlar bir kez binlenir; histogram ve KDE (FFT) aynı özetten çizilir
+        summaries = self.stats.densities if self.stats is not None else summarize_frame(self.df)
+        num_cols = list(summaries)
         
         # Her sayfada en fazla max_cols sütun göster
         for i in range(0, len(num_cols), self.max_cols):
-            plt.figure(figsize=self.figsize)
+            fig = plt.figure(figsize=self.figsize)
             
             # Başlık
             if i == 0:
@@ -116,66 +125,98 @@ class DistributionPlots(ReportComponent):
             
             # Grafikleri çiz
             for j, col in enumerate(cols_subset):
-                plt.subplot(n_rows, 2, j+1)
-                sns.histplot(self.df[col], kde=True)
+                ax = plt.subplot(n_rows, 2, j+1)
+                draw_distribution(ax, summaries[col], color=sns.color_palette()[0])
                 plt.title(col)
             
             plt.tight_layout(rect=[0, 0, 1, 0.95]) # Başlık için üstte boşluk bırak
-            pdf.savefig(bbox_inches='tight')
-            plt.close()
+            yield Page(fig, bbox_inches='tight')
+
+    def estimate_pages(self):
+        if self.stats is not None:
+            return -(-len(self.stats.densities) // self.max_cols)
+        # summarize_frame ile aynı seçim: sonlu değeri olan sayısal sütunlar
+        numeric = self.df.select_dtypes(include=np.number)
+        n_cols = sum(bool(np.isfinite(numeric[col].to_numpy(dtype=np.float64, na_value=np.nan)).any())
+                     for col in numeric.columns)
+        return -(-n_cols // self.max_cols)
 
 class ImageGallery(ReportComponent):
     """
-    Resim galerisi rapor bileşeni
+    Resim galerisi rapor bileşeni. Resimler çözülüp yeniden çizilmeden PDF görüntü
+    nesnesi olarak gömülür (bkz. image_pages); aynı resim dosyaya bir kez yazılır.
     """
-    def __init__(self, image_directory, title=None, descriptions=None):
+    def __init__(self, image_directory, title=None, descriptions=None, max_dpi=None):
         """
         Args:
             image_directory (str): Resimlerin bulunduğu dizin
             title (str): Başlık
             descriptions (dict): Resim dosya adı -> açıklama eşlemesi
+            max_dpi (float): Sayfadaki hedef çözünürlük; daha yoğun resimler bu
+                çözünürlüğe küçültülür (None ise özgün boyutla gömülür)
         """
         super().__init__(title, figsize=(11, 8.5))
         self.image_directory = image_directory
         self.descriptions = descriptions if descriptions else {}
+        self.max_dpi = max_dpi
         
-    def render(self, pdf):
+    def iter_pages(self):
         """
-        Resim galerisi sayfalarını oluşturur ve PDF'e ekler
+        Resim galerisi sayfalarını üretir; dizin taranırken resimler tek tek işlenir
         
-        Args:
-            pdf (PdfPages): PDF sayfaları
+        Yields:
+            ImagePage: Resim sayfası
         """
-        image_files = get_image_files(self.image_directory)
-        
-        if not image_files:
-            print(f"⚠️ Uyarı: Resim dizininde resim bulunamadı: {self.image_directory}")
-            return
-            
-        for img_path in image_files:
-            plt.figure(figsize=self.figsize)
-            
+        found = False
+        for img_path in iter_image_files(self.image_directory):
+            found = True
             try:
-                img = load_image(img_path)
-                plt.imshow(img)
-                plt.axis('off')
-                
-                img_filename = os.path.basename(img_path)
-                
-                # Görselin başlığı
-                clean_title = img_filename.replace('_', ' ').replace('.png', '').replace('.jpg', '')
-                plt.title(f"Görsel: {clean_title}", pad=20)
-                
-                # Eğer bu resim için bir açıklama varsa, ekle
-                if img_filename in self.descriptions:
-                    plt.figtext(0.5, 0.01, self.descriptions[img_filename], 
-                            ha='center', va='bottom', fontsize=10, 
-                            bbox=dict(facecolor='white', alpha=0.8))
-                
-                pdf.savefig(bbox_inches='tight')
-                
+                page = self._image_page(img_path)
             except Exception as e:
                 print(f"⚠️ Uyarı: {img_path} dosyası yüklenemedi: {str(e)}")
-                
-            plt.close()
+                continue
+            yield page
+            
+        if not found:
+            print(f"⚠️ Uyarı: Resim dizininde resim bulunamadı: {self.image_directory}")
+
+    def _image_page(self, img_path):
+        page = ImagePage(self.figsize)
+        margin = 0.5 * POINTS_PER_INCH
+        img_filename = os.path.basename(img_path)
+        
+        # Görselin başlığı
+        clean_title = img_filename.replace('_', ' ').replace('.png', '').replace('.jpg', '')
+        title_y = page.height - margin - 14
+        page.text(page.width / 2, title_y, f"Görsel: {clean_title}", size=14, ha='center')
+        
+        # Eğer bu resim için bir açıklama varsa, resmin altına ekle
+        bottom = margin
+        if img_filename in self.descriptions:
+            lines = wrap_text(self.descriptions[img_filename], page.width - 2 * margin, size=10)
+            for line in reversed(lines):
+                page.text(page.width / 2, bottom, line, size=10, ha='center')
+                bottom += 10 * LINE_SPACING
+            bottom += 10
+            
+        # Resim kalan alana en-boy oranı korunarak ortalanır
+        box_width, box_height = page.width - 2 * margin, title_y - 14 - bottom
+        max_size = None
+        if self.max_dpi:
+            max_size = (int(box_width / POINTS_PER_INCH * self.max_dpi),
+                        int(box_height / POINTS_PER_INCH * self.max_dpi))
+        image = encode_image(img_path, max_size)
+        scale = min(box_width / image.width, box_height / image.height)
+        width, height = image.width * scale, image.height * scale
+        page.image(margin + (box_width - width) / 2, bottom + (box_height - height) / 2, width, height, image)
+        return page
+
+    def estimate_pages(self):
+        return sum(1 for _ in iter_image_files(self.image_directory))
 
+    def cache_params(self):
+        # Resimler diskten okunur; dosya boyutu ve değişiklik zamanı anahtara eklenir
+        params = super().cache_params()
+        params['images'] = [(os.path.basename(path), os.stat(path).st_size, os.stat(path).st_mtime_ns)
+                            for path in sorted(iter_image_files(self.image_directory))]
+        return params
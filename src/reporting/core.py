@@ -1,13 +1,217 @@
 """
 Rapor oluşturma sisteminin temel sınıflarını içerir.
+
+Bileşenler sayfalarını iter_pages() ile tek tek üretir (Page: figür + savefig
+argümanları) ve estimate_pages() ile kaç sayfa üreteceklerini önceden bildirir.
+PdfReport sayfaları üretildikçe diske yazar ve kapatır; sayfa numaraları gerçek
+sayfalara basılır ve içindekiler sayfasının sayfa referansları tahminlerden tek
+geçişte doldurulur.
+
+Paralel modda (workers > 1) bileşenler işçi süreçlerde bir PageCollector'a çizilir;
+sayfalar (pickle ile serileştirilmiş figürler) ana süreçte bileşen sırasıyla PDF'e
+yazılır. parallel_safe = False olan veya serileştirilemeyen bileşenler ana süreçte
+sırasında çizilir.
+
+cache_dir verilirse her bileşenin sayfaları, bileşenin girdilerinden (veri özeti,
+parametreler, tema) türetilen bir anahtarla diskte saklanır (PageCache). Sonraki
+derlemelerde girdisi değişmeyen bölümler önbellekten okunur; yalnızca değişen
+bölümler yeniden çizilir ve PDF önbellekteki ve yeni sayfalardan birleştirilir.
 """
+import hashlib
+import io
 import os
+import pickle
+import sys
 import numpy as np
+import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.transforms import Bbox
 from datetime import datetime
-from abc import ABC, abstractmethod
+
+from ..data_processing.cache import PageCache, frame_fingerprint, params_key
+
+# PDF'e oluşturulma tarihi yazılmaz; aynı içerik her çalıştırmada aynı baytları üretir
+PDF_METADATA = {'CreationDate': None}
+# Fontlar TrueType (Type 42) olarak alt kümelenip gömülür: metin aranabilir, Türkçe karakterler korunur
+PDF_RC = {'pdf.fonttype': 42}
+# Önbellekteki sayfaların serileştirme biçimi; değişince eski kayıtlar kullanılmaz
+PAGE_FORMAT = 3
+
+
+class Page:
+    """
+    Tek bir rapor sayfası (matplotlib figürü).
+
+    Yazıcı sayfaları prepare -> stamp -> write -> close sırasıyla işler; aynı arayüzü
+    uygulayan TextPage (text_layout) figürsüz, yerel PDF metin sayfalarıdır.
+
+    Args:
+        figure (Figure): Sayfanın figürü
+        **options: PdfPages.savefig argümanları (bbox_inches, dpi, facecolor...)
+    """
+    def __init__(self, figure, **options):
+        self.figure = figure
+        self.options = options
+
+    def prepare(self):
+        """
+        bbox_inches='tight' ise sınır kutusunu (inç) bir kez hesaplar ve savefig
+        argümanlarına yazar. Kutu sayfayla birlikte önbelleğe alındığı için önbellekten
+        gelen sayfa yazılırken yeniden ölçülmez (tek çizim).
+        """
+        if isinstance(self.options.get('bbox_inches'), str) and self.options['bbox_inches'] == 'tight':
+            fig = self.figure
+            canvas = fig.canvas if hasattr(fig.canvas, 'get_renderer') else FigureCanvasAgg(fig)
+            pad = self.options.pop('pad_inches', None)
+            pad = plt.rcParams['savefig.pad_inches'] if pad in (None, 'layout') else pad
+            self.options['bbox_inches'] = fig.get_tightbbox(canvas.get_renderer()).padded(pad)
+        return self
+
+    def stamp(self, text):
+        """Sayfa numarası; kırpılan sayfalarda kırpma kutusunun sağ alt köşesine"""
+        x, y = 0.98, 0.01
+        bbox = self.options.get('bbox_inches')
+        if isinstance(bbox, Bbox):
+            width, height = self.figure.get_size_inches()
+            x, y = (bbox.x1 - 0.1) / width, (bbox.y0 + 0.05) / height
+        self.figure.text(x, y, text, ha='right', va='bottom', fontsize=8)
+
+    def write(self, pdf):
+        pdf.savefig(self.figure, **self.options)
+
+    def close(self):
+        plt.close(self.figure)
+
+    def __getstate__(self):
+        # Figür ayrı pickle edilir; yüklenen sayfa pyplot'a bağlı olmaz
+        return {'figure': pickle.dumps(self.figure, protocol=pickle.HIGHEST_PROTOCOL),
+                'options': self.options}
+
+    def __setstate__(self, state):
+        self.figure = pickle.loads(state['figure'])
+        self.options = state['options']
+
+
+class PageCollector:
+    """
+    PdfPages yerine geçen sayfa toplayıcı. Yalnızca render(pdf) uygulayan eski
+    bileşenlerin savefig ile verdiği figürleri Page nesneleri olarak saklar.
+    """
+    def __init__(self):
+        self.pages = []
+
+    def savefig(self, figure=None, **kwargs):
+        figure = plt.gcf() if figure is None else figure
+        if not isinstance(figure, matplotlib.figure.Figure):
+            figure = plt.figure(figure)
+        self.pages.append(Page(figure, **kwargs))
+
+    def get_pagecount(self):
+        return len(self.pages)
+
+
+def _as_page(page):
+    return page if hasattr(page, 'write') else Page(page)
+
+
+# İşçi sürecinde bileşenlerin ortak girdileri (belirteç -> nesne); başlatıcıyla bir kez doldurulur
+_shared_inputs = {}
+
+
+class _SharedPickler(pickle.Pickler):
+    """Ortak girdileri (ör. bileşenlerin paylaştığı df) kopyalamadan belirteçle yazar"""
+    def __init__(self, file, tokens):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.tokens = tokens  # id(nesne) -> belirteç
+
+    def persistent_id(self, obj):
+        return self.tokens.get(id(obj))
+
+
+class _SharedUnpickler(pickle.Unpickler):
+    def persistent_load(self, token):
+        return _shared_inputs[token]
+
+
+def _shared_tokens(components):
+    """
+    Birden fazla bileşenin özniteliği olan nesnelere belirteç atar. Bunlar işçilere
+    her bileşenle ayrı ayrı değil, havuz başlatıcısıyla bir kez gönderilir.
+    """
+    owners, objects = {}, {}
+    for component in components:
+        for value in {id(v): v for v in vars(component).values()}.values():
+            if value is None or isinstance(value, (str, bytes, int, float, bool, tuple)):
+                continue
+            owners[id(value)] = owners.get(id(value), 0) + 1
+            objects[id(value)] = value
+    shared = {f"shared-{i}": objects[key]
+              for i, key in enumerate(key for key, count in owners.items() if count > 1)}
+    return {id(value): token for token, value in shared.items()}, shared
+
+
+def _dump_component(component, tokens):
+    """Bileşeni ortak girdileri belirteçle değiştirerek serileştirir; serileştirilemezse None"""
+    buffer = io.BytesIO()
+    try:
+        _SharedPickler(buffer, tokens).dump(component)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+    return buffer.getvalue()
+
+
+def _init_render_worker(style, config, shared=None):
+    """İşçi sürecini başsız çizime ve ana süreçle aynı stile hazırlar, ortak girdileri alır"""
+    matplotlib.use('Agg', force=True)
+    plt.style.use(style)
+    sns.set_palette("husl")
+    plt.rcParams.update(config)
+    _shared_inputs.clear()
+    _shared_inputs.update(shared or {})
+
+
+def _render_pages(payload):
+    """
+    _dump_component ile serileştirilmiş bileşenin sayfalarını çizer ve pickle ile
+    serileştirilmiş sayfa listesi döndürür (işçide çalışır)
+    """
+    component = _SharedUnpickler(io.BytesIO(payload)).load()
+    pages = []
+    try:
+        for page in component.iter_pages():
+            page = _as_page(page).prepare()
+            pages.append(pickle.dumps(page, protocol=pickle.HIGHEST_PROTOCOL))
+            page.close()
+    finally:
+        plt.close('all')
+    return pages
+
+
+def _unpickle_pages(payload):
+    for data in payload:
+        yield pickle.loads(data)
+
+
+def _value_digest(value, memo):
+    """
+    Önbellek anahtarı için bir girdinin özeti. Veri çerçeveleri sütun özetleriyle,
+    diğer değerler pickle çıktısıyla özetlenir; aynı nesne (ör. bileşenlerin paylaştığı
+    df veya istatistikler) bir derlemede yalnızca bir kez özetlenir.
+    """
+    if id(value) not in memo:
+        if isinstance(value, pd.DataFrame):
+            digest = frame_fingerprint(value)
+        else:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            digest = hashlib.blake2b(data, digest_size=20).hexdigest()
+        memo[id(value)] = (value, digest)  # nesne tutulur; id yeniden kullanılmaz
+    return memo[id(value)][1]
+
 
 # core.py içinde PdfReport sınıfı güncelleniyor
 
@@ -15,14 +219,26 @@ class PdfReport:
     """
     PDF raporu oluşturmak için temel sınıf.
     """
-    def __init__(self, output_path=None, style='ggplot', config=None):
+    def __init__(self, output_path=None, style='ggplot', config=None, workers=1,
+                 max_tasks_per_child=None, cache_dir=None, cache_max_mb=256):
         """
         Args:
             output_path (str): PDF çıktı dosyasının yolu
             style (str): Matplotlib stil adı
             config (dict): Matplotlib konfigürasyon ayarları
+            workers (int): Sayfaları çizen süreç sayısı (1 ise sırayla; None ise çekirdek sayısı)
+            max_tasks_per_child (int): İşçi süreç bu kadar bileşenden sonra yenilenir
+                (bellek birikimini sınırlar; Python >= 3.11). None ise işçiler yenilenmez.
+                Verilirse havuz 'spawn' başlatma yöntemine geçer: çağıran betik
+                `if __name__ == "__main__":` koruması içermelidir ve her yenilemede
+                pandas/matplotlib/seaborn yeniden içe aktarılır
+            cache_dir (str): Bileşen sayfa önbelleği klasörü (None ise önbellek kullanılmaz)
+            cache_max_mb (float): Sayfa önbelleğinin en fazla disk alanı (MB)
         """
         self.output_path = output_path
+        self.cache = PageCache(cache_dir, max_mb=cache_max_mb) if cache_dir else None
+        self.workers = workers
+        self.max_tasks_per_child = max_tasks_per_child
         self.style = style
         self.default_config = {
             'figure.figsize': (11, 8),
@@ -40,47 +256,249 @@ class PdfReport:
         sns.set_palette("husl")
         plt.rcParams.update(self.config)
     
-    def create_report(self, components):
+    def create_report(self, components, workers=None):
         """
         Raporun bileşenlerini kullanarak PDF oluşturur
         
         Args:
             components (list): ReportComponent sınıfından türeyen nesnelerin listesi
+            workers (int): Süreç sayısı (None ise self.workers). max_tasks_per_child
+                verildiyse işçiler 'spawn' ile başlar; çağıran betikte
+                `if __name__ == "__main__":` koruması gerekir
         """
         if not self.output_path:
             raise ValueError("Output path is not specified")
             
         # Output klasörünün varlığını kontrol et
         output_dir = os.path.dirname(self.output_path)
-        if not os.path.exists(output_dir):
+        if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
             print(f"ℹ Bilgi: Çıktı klasörü oluşturuldu: {output_dir}")
-            
-        with PdfPages(self.output_path) as pdf:
-            total_pages = len(components)
-            for i, component in enumerate(components):
-                # Bileşeni render et
-                component.render(pdf)
-                
-                # Sayfa numarası ekle (Son sayfalar hariç - örneğin kapak ve içindekiler)
-                if self.page_numbers and i >= 2:  # İlk iki sayfaya sayfa numarası koymuyoruz (kapak ve içindekiler)
-                    fig = plt.figure(figsize=(8.5, 11))
-                    plt.figtext(0.5, 0.02, f"{i-1}/{total_pages-2}", ha='center', fontsize=8)
-                    plt.close()
+
+        workers = self.workers if workers is None else workers
+        workers = min(workers or os.cpu_count() or 1, len(components))
+        self._prepare_layout(components)
+        keys = self._cache_keys(components)
+        self.cache_hits = []
+        with plt.rc_context(PDF_RC), PdfPages(self.output_path, metadata=PDF_METADATA) as pdf:
+            if workers > 1:
+                self._render_parallel(pdf, components, workers, keys)
+            else:
+                for component, key in zip(components, keys):
+                    self._write_component(pdf, component, self._component_pages(component, key))
+        if self.cache is not None:
+            print(f"ℹ Bilgi: {len(self.cache_hits)}/{len(components)} bölüm önbellekten okundu")
                 
         print(f"✓ Rapor başarıyla oluşturuldu:\n{os.path.abspath(self.output_path)}")
         return True
 
-class ReportComponent(ABC):
+    def _prepare_layout(self, components):
+        """
+        Sayfa tahminlerinden numaralı sayfa toplamını ve içindekiler referanslarını
+        (toc_label -> bileşenin ilk sayfa numarası) hesaplar ve bileşenlere iletir.
+        """
+        refs = {}
+        page = 1
+        self._estimates = {}
+        for component in components:
+            estimate = component.estimate_pages()
+            self._estimates[id(component)] = estimate
+            if component.toc_label:
+                refs[component.toc_label] = page if component.numbered else None
+            if component.numbered:
+                page += estimate
+        self._total_pages = page - 1
+        self._next_page = 1
+        for component in components:
+            component.set_page_refs(refs)
+
+    def _cache_keys(self, components):
+        """
+        Bileşen başına önbellek anahtarı (önbellek kapalıysa veya bileşen önbelleğe
+        alınamıyorsa None). Sayfa referansları anahtara dahildir; içindekiler sayfası
+        referanslar değişince yeniden çizilir.
+        """
+        if self.cache is None:
+            return [None] * len(components)
+        theme = params_key(self.style, self.config, sns.color_palette().as_hex(), matplotlib.__version__,
+                           PAGE_FORMAT)
+        memo = {}
+        keys = []
+        for component in components:
+            key = None
+            if component.cacheable:
+                try:
+                    params = {name: _value_digest(value, memo)
+                              for name, value in sorted(component.cache_params().items())}
+                    name = type(component).__name__
+                    key = f"{name}-{params_key(type(component).__module__, name, theme, params)}"
+                except Exception as e:
+                    print(f"⚠️ Uyarı: {type(component).__name__} önbellek anahtarı üretilemedi: {e}")
+            keys.append(key)
+        return keys
+
+    def _component_pages(self, component, key):
+        """Bileşenin sayfaları: önbellekte varsa oradan, yoksa çizilip önbelleğe kaydedilerek"""
+        if key is None:
+            return component.iter_pages()
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.cache_hits.append(key)
+            return _unpickle_pages(cached)
+        return self._record_pages(component.iter_pages(), key)
+
+    def _record_pages(self, pages, key):
+        # Sayfalar numara basılmadan önce serileştirilir; bileşen tamamlanınca kaydedilir
+        payload = []
+        for page in pages:
+            page = _as_page(page).prepare()
+            payload.append(pickle.dumps(page, protocol=pickle.HIGHEST_PROTOCOL))
+            yield page
+        self.cache.put(key, payload)
+
+    def _write_component(self, pdf, component, pages):
+        """Bileşenin sayfalarını sırayla numaralandırır, yazar ve kapatır"""
+        written = 0
+        for page in pages:
+            page = _as_page(page).prepare()
+            try:
+                if component.numbered:
+                    # Sayfa numarası (kapak ve içindekiler gibi numarasız bileşenler hariç)
+                    if self.page_numbers:
+                        page.stamp(f"{self._next_page}/{self._total_pages}")
+                    self._next_page += 1
+                page.write(pdf)
+            finally:
+                page.close()
+            written += 1
+        estimate = self._estimates.get(id(component))
+        if estimate is not None and written != estimate:
+            print(f"⚠️ Uyarı: {type(component).__name__} ({component.title}) {estimate} sayfa "
+                  f"tahmin etti, {written} sayfa üretti; içindekiler referansları kayabilir")
+
+    def _render_parallel(self, pdf, components, workers, keys):
+        """
+        Paralel bileşenleri süreç havuzunda çizer; sayfaları bileşen sırasıyla yazar.
+        Sıradaki bileşenin sayfaları hazır olunca yazılır ve bellekten atılır.
+        Önbellekte bulunan bileşenler işçilere gönderilmez. Her bileşen bir kez
+        serileştirilir; bileşenlerin paylaştığı girdiler (df, istatistikler) işçilere
+        başlatıcıyla bir kez gönderilir. Serileştirilemeyen bileşenler ana süreçte çizilir.
+        """
+        cached = [key is not None and key in self.cache for key in keys]
+        candidates = [component for component, hit in zip(components, cached)
+                      if not hit and component.parallel_safe]
+        tokens, shared = _shared_tokens(candidates)
+        payloads = [_dump_component(component, tokens) if not hit and component.parallel_safe else None
+                    for component, hit in zip(components, cached)]
+        options = {}
+        if self.max_tasks_per_child and sys.version_info >= (3, 11):
+            # max_tasks_per_child havuzu 'spawn' başlatma yöntemine geçirir (ana modül koruması gerekir)
+            options['max_tasks_per_child'] = self.max_tasks_per_child
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(self.style, self.config, shared), **options) as pool:
+            futures = [pool.submit(_render_pages, payload) if payload is not None else None
+                       for payload in payloads]
+            del payloads
+            for i, (component, future) in enumerate(zip(components, futures)):
+                if future is None:
+                    pages = self._component_pages(component, keys[i])
+                else:
+                    payload = future.result()
+                    futures[i] = None
+                    if keys[i] is not None:
+                        self.cache.put(keys[i], payload)
+                    pages = _unpickle_pages(payload)
+                self._write_component(pdf, component, pages)
+
+class ReportComponent:
     """
-    Raporun her bir bölümü için soyut temel sınıf.
+    Raporun her bir bölümü için temel sınıf.
     Bu sınıftan türetilmiş sınıflar bir rapora eklenebilir.
+
+    Alt sınıflar iter_pages() ile sayfalarını (Page veya Figure) tek tek üretir ve
+    birden fazla sayfa üretiyorsa estimate_pages() metodunu uygular. Yalnızca
+    render(pdf) uygulayan eski bileşenler de desteklenir (sayfaları önce toplanır).
+
+    parallel_safe = False olan bileşenler paralel modda da ana süreçte çizilir
+    (ör. rapor genelindeki durumu okuyan veya pdf nesnesine özel işlem yapan bileşenler).
+    numbered = False olan bileşenlerin sayfalarına numara basılmaz ve numaralandırmada sayılmaz.
+    cacheable = False olan bileşenler sayfa önbelleğine alınmaz; diğerlerinin önbellek
+    anahtarı cache_params() içindeki girdilerden türetilir.
     """
-    def __init__(self, title=None, figsize=(11, 8.5)):
+    parallel_safe = True
+    numbered = True
+    cacheable = True
+
+    def __init__(self, title=None, figsize=(11, 8.5), toc_label=None):
+        """
+        Args:
+            title (str): Bileşen başlığı
+            figsize (tuple): Sayfa boyutu
+            toc_label (str): İçindekilerde bu bileşene karşılık gelen satır
+        """
         self.title = title
         self.figsize = figsize
-    
-    @abstractmethod
+        self.toc_label = toc_label
+
+    def iter_pages(self):
+        """
+        Bileşenin sayfalarını sırayla üretir. Yazıcı her sayfayı kaydedip kapattıktan
+        sonra bir sonrakini ister; bellekte aynı anda tek sayfa bulunur.
+
+        Yields:
+            Page: Figür ve savefig argümanları
+        """
+        if type(self).render is ReportComponent.render:
+            raise NotImplementedError(f"{type(self).__name__} iter_pages veya render uygulamalıdır")
+        collector = PageCollector()
+        self.render(collector)
+        yield from collector.pages
+
+    def estimate_pages(self):
+        """Bileşenin üreteceği sayfa sayısı (içindekiler ve sayfa numaraları için)"""
+        return 1
+
+    def _estimate_layout(self):
+        """
+        _layout() ile sayfaları yerleştirir, sayısını döndürür ve yerleşimi sonraki
+        _take_layout() çağrısı için saklar (estimate_pages uygulamalarında kullanılır).
+        """
+        pages = self._layout()
+        self._pending_layout = (self._layout_inputs(), pages)
+        return len(pages)
+
+    def _take_layout(self):
+        """
+        estimate_pages() sırasında saklanan yerleşimi bir kez kullanır; yoksa veya
+        nitelikler o zamandan beri değiştiyse yeniden yerleştirir. Sayfalar yazılırken
+        damgalandığından saklanan yerleşim tekrar kullanılmaz.
+        """
+        inputs, pages = self.__dict__.pop('_pending_layout', (None, None))
+        if pages is None or inputs != self._layout_inputs():
+            pages = self._layout()
+        return pages
+
+    def _layout_inputs(self):
+        return {name: id(value) for name, value in vars(self).items() if name != '_pending_layout'}
+
+    def cache_params(self):
+        """
+        Sayfa önbelleği anahtarına giren girdiler (varsayılan: bileşenin tüm nitelikleri).
+        Diskteki dosyaları okuyan bileşenler dosya imzalarını eklemelidir.
+        """
+        params = dict(vars(self))
+        params.pop('_pending_layout', None)
+        return params
+
+    def set_page_refs(self, refs):
+        """
+        Yazıcı, çizimden önce içindekiler referanslarını iletir.
+
+        Args:
+            refs (dict): toc_label -> ilk sayfa numarası
+        """
+        pass
+
     def render(self, pdf):
         """
         Bileşeni PDF'e ekle.
@@ -88,4 +506,9 @@ class ReportComponent(ABC):
         Args:
             pdf (PdfPages): Matplotlib PdfPages nesnesi
         """
-        pass
\ No newline at end of file
+        for page in self.iter_pages():
+            page = _as_page(page)
+            try:
+                page.write(pdf)
+            finally:
+                page.close()
@@ -3,6 +3,11 @@
 Boston Housing - Modüler Rapor Üretici
 Kullanım:
   python generate_report.py [--input <path>] [--output <path>] [--visuals-dir <path>] [--logo <path>]
+                            [--columns <col> ...]
+
+Girdi olarak CSV'nin yanında Parquet (.parquet) ve Feather/Arrow (.feather, .arrow)
+dosyaları da kabul edilir; sütunsal formatlarda yalnızca --columns ile seçilen
+sütunlar diskten okunur.
 """
 
 import os
@@ -21,6 +26,7 @@ sys.path.append(PROJECT_ROOT)  # Eğer reporting klasörü proje kök dizininde
 
 # Şimdi import edebilirsiniz
 from src.reporting import ReportGenerator, DataAnalysisReport
+from src.data_processing.storage import read_table
 
 # Varsayılan dosya yolları
 DEFAULT_INPUT = os.path.join(PROJECT_ROOT, "data", "processed", "cleaned_boston.csv")
@@ -51,15 +57,19 @@ REPORT_FINDINGS = [
     "Veri seti özelliklerinin çoğu normal dağılım göstermemekte, sağa çarpık dağılımlar görülmektedir."
 ]
 
-def generate_report(input_path, output_path, visuals_dir, logo_path=None):
+def generate_report(input_path, output_path, visuals_dir, logo_path=None, columns=None, workers=1,
+                    cache_dir=None):
     """
     Modüler rapor sistemini kullanarak Boston Housing verisi için rapor üretir
 
     Args:
-        input_path (str): Girdi CSV dosyasının yolu
+        input_path (str): Girdi dosyasının yolu (CSV, Parquet veya Feather)
         output_path (str): Çıktı PDF dosyasının yolu
         visuals_dir (str): Görselleştirmeler klasörünün yolu
         logo_path (str): Logo dosyasının yolu
+        columns (list): Rapora alınacak sütunlar (None ise tümü)
+        workers (int): Sayfaları çizen süreç sayısı (1 ise sırayla; None ise çekirdek sayısı)
+        cache_dir (str): Bölüm sayfa önbelleği klasörü (None ise her bölüm yeniden çizilir)
 
     Returns:
         bool: Başarılı ise True, değilse False
@@ -87,7 +97,7 @@ def generate_report(input_path, output_path, visuals_dir, logo_path=None):
             logo_path = None
         
         # Veriyi yükle
-        df = pd.read_csv(input_path)
+        df = read_table(input_path, columns=columns)
         print(f"ℹ Bilgi: Veri başarıyla yüklendi: {len(df)} satır, {len(df.columns)} sütun")
         
         # DataAnalysisReport şablonunu kullanarak rapor oluştur
@@ -119,7 +129,9 @@ def generate_report(input_path, output_path, visuals_dir, logo_path=None):
                 'axes.titlesize': 14,
                 'axes.labelsize': 12,
                 'font.family': 'sans-serif'
-            }
+            },
+            workers=workers,
+            cache_dir=cache_dir
         )
         
         result = generator.generate()
@@ -138,13 +150,19 @@ def generate_report(input_path, output_path, visuals_dir, logo_path=None):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Boston Housing Rapor Üretici")
     parser.add_argument("--input", default=DEFAULT_INPUT, 
-                       help=f"Girdi CSV dosya yolu (varsayılan: {DEFAULT_INPUT})")
+                       help=f"Girdi dosya yolu: CSV, Parquet veya Feather (varsayılan: {DEFAULT_INPUT})")
     parser.add_argument("--output", default=DEFAULT_OUTPUT,
                        help=f"Çıktı PDF dosya yolu (varsayılan: {DEFAULT_OUTPUT})")
     parser.add_argument("--visuals-dir", default=VISUALIZATIONS_DIR,
                        help=f"Görselleştirmeler klasörü (varsayılan: {VISUALIZATIONS_DIR})")
     parser.add_argument("--logo", default=DEFAULT_LOGO,
                        help=f"Logo dosyası (varsayılan: {DEFAULT_LOGO})")
+    parser.add_argument("--columns", nargs="+", default=None,
+                       help="Yalnızca okunacak sütunlar (varsayılan: tümü)")
+    parser.add_argument("--workers", type=int, default=1,
+                       help="Sayfaları paralel çizen süreç sayısı (varsayılan: 1, 0: çekirdek sayısı)")
+    parser.add_argument("--cache-dir", default=None,
+                       help="Bölüm sayfa önbelleği klasörü; değişmeyen bölümler yeniden çizilmez")
     args = parser.parse_args()
     
     # Yolları normalize et
@@ -159,4 +177,5 @@ if __name__ == "__main__":
     print(f"Görselleştirmeler klasörü: {visuals_dir}")
     print(f"Logo dosyası: {logo_path}")
     
-    sys.exit(0 if generate_report(input_path, output_path, visuals_dir, logo_path) else 1)
\ No newline at end of file
+    sys.exit(0 if generate_report(input_path, output_path, visuals_dir, logo_path, args.columns,
+                             args.workers or None, args.cache_dir) else 1)
\ No newline at end of file
@@ -0,0 +1,287 @@
+"""
+Resim dosyalarını yeniden rasterleştirmeden PDF görüntü nesnesi olarak gömen sayfalar.
+
+encode_image dosyayı piksel dizisine çözmeden PDF akışına çevirir: JPEG dosyası
+olduğu gibi (DCTDecode), alfa kanalı olmayan PNG dosyasının IDAT verisi ise PNG
+öngörücü parametreleriyle (FlateDecode, Predictor 15) yazılır. Alfa kanalı olan
+(ör. matplotlib'in kaydettiği RGBA) veya hedef çözünürlük için küçültülmesi
+gereken resimler Pillow ile bir kez çözülüp yeniden kodlanır; tamamen opak alfa
+kanalı atılır, gerçek saydamlık gri tonlu maske (SMask) olarak yazılır.
+
+Kodlanmış resimler içerik özetiyle anahtarlanır: aynı resim bir PDF dosyasına
+bir kez yazılır ve sonraki sayfalar aynı nesneye başvurur. Son kodlanan resimler
+yalnızca süreç içinde (_encoded_cache) bellekte tutulur; paralel işçiler kendi
+kopyalarını kodlar, çalıştırmalar arası yeniden kullanım sayfa önbelleğiyle (PageCache) sağlanır.
+
+Görüntü nesneleri matplotlib'in PDF dosyasının açık olmayan arayüzleriyle (kaynak
+sözlüğü, akış yazımı) yazılır; yerel yazım kullanılamıyorsa (bkz. text_layout.native_pdf)
+resimler kaynak dosyadan yeniden okunup figüre imshow ile çizilir.
+
+Örnek:
+    page = ImagePage()
+    page.image(36, 72, 720, 480, encode_image("grafik.png", max_size=(1500, 1000)))
+    page.text(396, 576, "Görsel: grafik", ha='center')
+"""
+from collections import OrderedDict
+import hashlib
+import io
+import struct
+import weakref
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.backends.backend_pdf import Name, Op
+from PIL import Image
+
+from ..data_processing.cache import params_key
+from .text_layout import TextPage, pdf_file
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# Alfa kanalı olmayan PNG renk tipleri -> satırdaki bileşen sayısı (0: gri, 2: RGB, 3: paletli)
+PNG_COLOR_COMPONENTS = {0: 1, 2: 3, 3: 1}
+COLOR_SPACES = {'1': 'DeviceGray', 'L': 'DeviceGray', 'RGB': 'DeviceRGB'}
+# Küçültülen JPEG resimlerin yeniden kodlama kalitesi
+JPEG_QUALITY = 90
+# Süreç içinde bellekte tutulan en fazla kodlanmış resim sayısı
+ENCODED_CACHE_SIZE = 32
+# Sayfaya özel kaynak sözlüğü için gereken PdfFile nitelikleri
+RESOURCE_ATTRIBUTES = ('resourceObject', 'fontObject', '_extGStateObject', 'hatchObject', 'gouraudObject')
+
+_encoded_cache = OrderedDict()              # (dosya özeti, piksel sınırı) -> EncodedImage
+_written_images = weakref.WeakKeyDictionary()  # PdfFile -> {özet: görüntü nesnesi referansı}
+
+
+class EncodedImage:
+    """
+    PDF görüntü nesnesi olarak yazılmaya hazır kodlanmış resim.
+
+    Args:
+        width, height (int): Piksel boyutu
+        data (bytes): Akış verisi (JPEG dosyası veya PNG IDAT verisi)
+        color_space: 'DeviceGray', 'DeviceRGB' veya ('Indexed', 'DeviceRGB', en yüksek indeks, palet)
+        bits (int): Bileşen başına bit sayısı
+        filter (str): 'DCTDecode' veya 'FlateDecode'
+        decode_parms (dict): FlateDecode için PNG öngörücü parametreleri
+        smask (EncodedImage): Gri tonlu saydamlık maskesi (yoksa None)
+        passthrough (bool): Dosya baytları çözülmeden mi kullanıldı
+        source (str): Kaynak resim dosyası (figüre çizim yedeğinde yeniden okunur)
+    """
+    def __init__(self, width, height, data, color_space, bits=8, filter='FlateDecode',
+                 decode_parms=None, smask=None, passthrough=False, source=None):
+        self.width = width
+        self.height = height
+        self.data = data
+        self.color_space = color_space
+        self.bits = bits
+        self.filter = filter
+        self.decode_parms = decode_parms
+        self.smask = smask
+        self.passthrough = passthrough
+        self.source = source
+        self.digest = None
+
+    def pixels(self):
+        """Kaynak dosyadan kodlanmış boyutta RGBA piksel dizisi"""
+        with Image.open(self.source) as image:
+            image.thumbnail((self.width, self.height), Image.LANCZOS)
+            return np.asarray(image.convert('RGBA'))
+
+
+def _png_stream(data):
+    """
+    PNG dosyasının IDAT verisini çözmeden PDF akışına çevirir. Alfa kanalı,
+    saydamlık (tRNS), satır aralama (interlace) veya 16 bit derinlik varsa None döner.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return None
+    header, palette, idat = None, None, []
+    pos = len(PNG_SIGNATURE)
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack_from('>I4s', data, pos)
+        chunk = data[pos + 8:pos + 8 + length]
+        pos += length + 12
+        if kind == b'IHDR':
+            header = struct.unpack('>IIBBBBB', chunk)
+        elif kind == b'PLTE':
+            palette = chunk
+        elif kind == b'IDAT':
+            idat.append(chunk)
+        elif kind == b'tRNS':
+            return None
+        elif kind == b'IEND':
+            break
+    if header is None:
+        return None
+    width, height, bits, color_type, _, _, interlace = header
+    if interlace or bits > 8 or color_type not in PNG_COLOR_COMPONENTS:
+        return None
+    if color_type == 3:
+        if palette is None:
+            return None
+        color_space = ('Indexed', 'DeviceRGB', len(palette) // 3 - 1, palette)
+    else:
+        color_space = 'DeviceGray' if color_type == 0 else 'DeviceRGB'
+    parms = {'Predictor': 15, 'Colors': PNG_COLOR_COMPONENTS[color_type],
+             'BitsPerComponent': bits, 'Columns': width}
+    return EncodedImage(width, height, b''.join(idat), color_space, bits, 'FlateDecode', parms,
+                        passthrough=True)
+
+
+def _save(image, format, **options):
+    buffer = io.BytesIO()
+    image.save(buffer, format, **options)
+    return buffer.getvalue()
+
+
+def _reencode(image, max_size):
+    """Resmi çözer, gerekirse küçültür ve PDF akışı olarak yeniden kodlar"""
+    source_format = image.format
+    if max_size is not None:
+        image.thumbnail(max_size, Image.LANCZOS)
+    alpha = None
+    if image.mode in ('RGBA', 'LA', 'PA', 'RGBa', 'La') or 'transparency' in image.info:
+        image = image.convert('RGBA')
+        alpha = image.getchannel('A')
+        if alpha.getextrema() == (255, 255):
+            alpha = None  # tamamen opak: maske gerekmez
+        image = image.convert('RGB')
+    elif image.mode not in ('1', 'L', 'P', 'RGB'):
+        image = image.convert('RGB')
+
+    if source_format == 'JPEG' and image.mode in ('L', 'RGB'):
+        encoded = EncodedImage(image.width, image.height, _save(image, 'JPEG', quality=JPEG_QUALITY),
+                               COLOR_SPACES[image.mode], filter='DCTDecode')
+    else:
+        encoded = _png_stream(_save(image, 'PNG'))
+    encoded.passthrough = False
+    if alpha is not None:
+        encoded.smask = _png_stream(_save(alpha, 'PNG'))
+    return encoded
+
+
+def encode_image(path, max_size=None):
+    """
+    Resim dosyasını PDF'e gömülecek biçime getirir. Sınırı aşmayan JPEG ve alfa
+    kanalsız PNG dosyaları çözülmeden kullanılır.
+
+    Args:
+        path (str): Resim dosyası
+        max_size (tuple): En fazla (genişlik, yükseklik) piksel; aşan resimler
+            en-boy oranı korunarak küçültülür (None ise özgün boyut)
+
+    Returns:
+        EncodedImage: Kodlanmış resim
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    key = (hashlib.blake2b(data, digest_size=20).hexdigest(), max_size)
+    if key in _encoded_cache:
+        _encoded_cache.move_to_end(key)
+        return _encoded_cache[key]
+
+    with Image.open(io.BytesIO(data)) as image:
+        fits = max_size is None or (image.width <= max_size[0] and image.height <= max_size[1])
+        encoded = None
+        if fits and image.format == 'JPEG' and image.mode in ('L', 'RGB'):
+            encoded = EncodedImage(image.width, image.height, data, COLOR_SPACES[image.mode],
+                                   filter='DCTDecode', passthrough=True)
+        elif fits and image.format == 'PNG':
+            encoded = _png_stream(data)
+        if encoded is None:
+            encoded = _reencode(image, max_size)
+
+    encoded.source = str(path)
+    encoded.digest = params_key(key[0], encoded.width, encoded.height)
+    if encoded.smask is not None:
+        encoded.smask.digest = encoded.digest + '-mask'
+    _encoded_cache[key] = encoded
+    while len(_encoded_cache) > ENCODED_CACHE_SIZE:
+        _encoded_cache.popitem(last=False)
+    return encoded
+
+
+def _pdf_color_space(color_space):
+    if isinstance(color_space, str):
+        return Name(color_space)
+    indexed, base, high, palette = color_space
+    return [Name(indexed), Name(base), high, palette]
+
+
+def write_image(file, image):
+    """
+    Resmi PDF dosyasına görüntü nesnesi (XObject) olarak yazar. Aynı özetli resim
+    dosyaya bir kez yazılır; sonraki çağrılar aynı referansı döndürür.
+
+    Args:
+        file (PdfFile): matplotlib'in açık PDF dosyası (akış dışında olmalı)
+        image (EncodedImage): Kodlanmış resim
+
+    Returns:
+        Reference: Görüntü nesnesinin referansı
+    """
+    written = _written_images.setdefault(file, {})
+    if image.digest in written:
+        return written[image.digest]
+    entries = {'Type': Name('XObject'), 'Subtype': Name('Image'),
+               'Width': image.width, 'Height': image.height,
+               'ColorSpace': _pdf_color_space(image.color_space),
+               'BitsPerComponent': image.bits, 'Filter': Name(image.filter)}
+    if image.decode_parms:
+        entries['DecodeParms'] = image.decode_parms
+    if image.smask is not None:
+        entries['SMask'] = write_image(file, image.smask)
+    reference = file.reserveObject('image')
+    # Veri zaten sıkıştırılmış: akış olduğu gibi yazılır
+    with mpl.rc_context({'pdf.compression': 0}):
+        file.beginStream(reference.id, None, entries)
+        file.currentstream.write(image.data)
+        file.endStream()
+    written[image.digest] = reference
+    return reference
+
+
+class ImagePage(TextPage):
+    """
+    Gömülü resimler ve metin içeren sayfa. Resimler sayfanın kendi kaynak
+    sözlüğüne eklenir; metinler TextPage gibi yerel PDF komutlarıyla yazılır.
+    PdfFile beklenen nitelikleri sunmuyorsa sayfa figür olarak yazılır.
+    """
+    def image(self, x, y, width, height, encoded):
+        """Resmi (x, y) sol alt köşeli, width x height noktalık kutuya çizer"""
+        self.items.append(('image', x, y, width, height, encoded))
+        return self
+
+    def _write_native(self, pdf):
+        file = pdf_file(pdf)
+        if not all(hasattr(file, name) for name in RESOURCE_ATTRIBUTES):
+            self._write_figure(pdf)
+            return
+        file.endStream()
+        xobjects = {}
+        for item in self.items:
+            if item[0] == 'image':
+                xobjects[_xobject_name(item[-1])] = write_image(file, item[-1])
+        resources = file.reserveObject('image page resources')
+        file.writeObject(resources, {
+            'Font': file.fontObject, 'ExtGState': file._extGStateObject,
+            'Pattern': file.hatchObject, 'Shading': file.gouraudObject, 'XObject': xobjects,
+            'ProcSet': [Name(name) for name in ('PDF', 'Text', 'ImageB', 'ImageC', 'ImageI')]})
+        # Sayfa, ortak kaynak sözlüğü yerine resimleri de içeren kendi sözlüğüyle açılır
+        shared, file.resourceObject = file.resourceObject, resources
+        try:
+            super()._write_native(pdf)
+        finally:
+            file.resourceObject = shared
+
+    def _draw_image(self, renderer, x, y, width, height, encoded):
+        renderer.file.output(Op.gsave, width, 0, 0, height, x, y, Op.concat_matrix,
+                             Name(_xobject_name(encoded)), Op.use_xobject, Op.grestore)
+
+    def _figure_image(self, fig, points, x, y, width, height, encoded):
+        ax = fig.add_axes([x / self.width, y / self.height, width / self.width, height / self.height])
+        ax.imshow(encoded.pixels(), aspect='auto', interpolation='none')
+        ax.set_axis_off()
+
+
+def _xobject_name(image):
+    return f"Img{image.digest[:16]}"
@@ -9,13 +9,15 @@ class ReportGenerator:
     """
     Rapor oluşturmak için ana sınıf.
     """
-    def __init__(self, template, output_path=None, style='ggplot', config=None):
+    def __init__(self, template, output_path=None, style='ggplot', config=None, workers=1, cache_dir=None):
         """
         Args:
             template: Kullanılacak rapor şablonu
             output_path (str): PDF çıktı dosyasının yolu
             style (str): Matplotlib stil adı
             config (dict): Matplotlib konfigürasyon ayarları
+            workers (int): Sayfaları çizen süreç sayısı (1 ise sırayla; None ise çekirdek sayısı)
+            cache_dir (str): Bölüm sayfa önbelleği klasörü (None ise her bölüm yeniden çizilir)
         """
         if output_path is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M')
@@ -31,7 +33,7 @@ class ReportGenerator:
         config['font.family'] = 'sans-serif'
         config['font.sans-serif'] = ['Arial', 'DejaVu Sans', 'Liberation Sans', 'FreeSans']
                 
-        self.pdf_report = PdfReport(output_path, style, config)
+        self.pdf_report = PdfReport(output_path, style, config, workers=workers, cache_dir=cache_dir)
         
     def generate(self):
         """
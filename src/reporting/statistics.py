@@ -0,0 +1,92 @@
+"""
+Rapor bileşenlerinin ortak kullandığı, önceden hesaplanmış istatistikler.
+
+ReportStatistics veri çerçevesinden rapor başına bir kez oluşturulur. Sayısal
+sütunlar tek bir float64 matrisine alınır; eksik sayıları ve (ikili tam
+gözlemlerle) korelasyon matrisi bu matris üzerinde vektörize hesaplanır. Her
+sütunun histogram/KDE özeti (ColumnDensity) aynı matristen bir kez üretilir;
+describe() tablosundaki moment ve çeyrekler de bu özetlerden okunur. Bileşenler
+veri çerçevesini yeniden taramak yerine bu nesneyi okur.
+
+Örnek:
+    stats = ReportStatistics(df)
+    stats.describe()      # df.describe() ile aynı tablo
+    stats.correlation     # df.corr(numeric_only=True) ile aynı matris
+    stats.densities['MEDV'].histogram()
+"""
+import numpy as np
+import pandas as pd
+
+from ..data_processing.density import ColumnDensity
+
+DESCRIBE_INDEX = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+
+
+class ReportStatistics:
+    """
+    Bir veri çerçevesinin rapor istatistikleri.
+
+    Args:
+        df (pd.DataFrame): Rapor verisi
+        bw_method: KDE bant genişliği kuralı (bkz. density.bandwidth)
+
+    Attributes:
+        n_rows, n_cols (int): Satır ve sütun sayısı
+        numeric_columns (list): Sayısal sütunlar
+        null_counts (pd.Series): Sütun başına eksik değer sayısı (tüm sütunlar)
+        correlation (pd.DataFrame): Pearson korelasyon matrisi
+        densities (dict): Sonlu değeri olan sayısal sütunların ColumnDensity özetleri
+    """
+    def __init__(self, df, bw_method='scott'):
+        self.n_rows, self.n_cols = df.shape
+        numeric = df.select_dtypes(include=np.number)
+        self.numeric_columns = list(numeric.columns)
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        finite = np.isfinite(values)
+        count = finite.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(finite, values, 0.0).sum(axis=0) / count
+
+        null_counts = pd.Series(0, index=df.columns, dtype=np.int64)
+        null_counts[self.numeric_columns] = len(values) - count
+        for col in df.columns.difference(self.numeric_columns, sort=False):
+            null_counts[col] = int(df[col].isna().sum())
+        self.null_counts = null_counts
+
+        self.densities = {col: ColumnDensity(values[:, i], name=col, bw_method=bw_method)
+                          for i, col in enumerate(self.numeric_columns) if count[i] > 0}
+        self._describe = self._describe_table(count)
+        self.correlation = self._pairwise_correlation(values, finite, mean)
+
+    def _describe_table(self, count):
+        # Momentler ve çeyrekler sütun özetlerinde zaten hesaplandı; veri yeniden sıralanmaz
+        table = pd.DataFrame(np.nan, index=DESCRIBE_INDEX, columns=self.numeric_columns)
+        table.loc['count'] = count.astype(np.float64)
+        for col, summary in self.densities.items():
+            std = summary.std if summary.n > 1 else np.nan
+            table[col] = [summary.n, summary.mean, std, summary.min, *summary.quantiles, summary.max]
+        return table
+
+    def _pairwise_correlation(self, values, finite, mean):
+        """
+        İkili tam gözlemlerle Pearson korelasyonu (pandas DataFrame.corr ile aynı).
+        Toplamlar maske matrisleriyle tek seferde hesaplanır; sütunlar önce kendi
+        ortalamalarına göre merkezlenir (sayısal kararlılık).
+        """
+        mask = finite.astype(np.float64)
+        centered = np.where(finite, values - np.nan_to_num(mean), 0.0)
+        n = mask.T @ mask                      # çift başına ortak gözlem
+        sum_x = centered.T @ mask              # [i, j]: j'nin dolu olduğu satırlarda x_i toplamı
+        sum_xx = (centered ** 2).T @ mask
+        sum_xy = centered.T @ centered
+        with np.errstate(invalid='ignore', divide='ignore'):
+            cov = sum_xy - sum_x * sum_x.T / n
+            var = sum_xx - sum_x ** 2 / n
+            corr = cov / np.sqrt(var * var.T)
+        corr[(n < 2) | ~(var > 0) | ~(var.T > 0)] = np.nan
+        np.clip(corr, -1.0, 1.0, out=corr)
+        return pd.DataFrame(corr, index=self.numeric_columns, columns=self.numeric_columns)
+
+    def describe(self):
+        """df.describe() biçiminde özet tablo (sayısal sütunlar)"""
+        return self._describe.copy()
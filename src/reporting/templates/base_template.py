@@ -17,13 +17,16 @@ class BaseReport(ABC):
         self.author = author
         self.components = []
         
-    def add_component(self, component):
+    def add_component(self, component, toc_label=None):
         """
         Rapora bir bileşen ekler
         
         Args:
             component: ReportComponent sınıfından türeyen bir nesne
+            toc_label (str): İçindekilerde bileşenin ilk sayfasını gösteren satır
         """
+        if toc_label is not None:
+            component.toc_label = toc_label
         self.components.append(component)
         return self
         
@@ -3,6 +3,7 @@ Veri analizi için rapor şablonu
 """
 import pandas as pd
 from .base_template import BaseReport
+from ..statistics import ReportStatistics
 from ..components.cover_page import CoverPage
 from ..components.table_of_contents import TableOfContents
 from ..components.data_summary import DataSummary
@@ -33,6 +34,8 @@ class DataAnalysisReport(BaseReport):
         self.logo_path = logo_path
         self.add_comments = add_comments
         self.findings = findings
+        # Tüm bileşenlerin okuduğu istatistikler rapor başına bir kez hesaplanır
+        self.stats = ReportStatistics(df)
         self.build()
         
     def build(self):
@@ -42,7 +45,7 @@ class DataAnalysisReport(BaseReport):
         # Kapak sayfası
         self.add_component(CoverPage(
             title=self.title,
-            subtitle=f"Gözlem Sayısı: {len(self.df):,} | Özellik Sayısı: {len(self.df.columns)}",
+            subtitle=f"Gözlem Sayısı: {self.stats.n_rows:,} | Özellik Sayısı: {self.stats.n_cols}",
             author=self.author,
             logo_path=self.logo_path
         ))
@@ -60,23 +63,27 @@ class DataAnalysisReport(BaseReport):
         if self.findings:
             toc_items.append("5. Bulgular Özeti")
             
+        # Sayfa numaraları, aynı etiketle eklenen bileşenlerden rapor yazılırken doldurulur
         self.add_component(TableOfContents(toc_items))
         
         # Veri özeti
-        self.add_component(DataSummary(self.df, "1. VERİ ÖZETİ"))
+        self.add_component(DataSummary(self.df, "1. VERİ ÖZETİ", stats=self.stats), toc_label="1. Veri Özeti")
         
         # Korelasyon analizi
         self.add_component(CorrelationMatrix(self.df, "2. KORELASYON ANALİZİ", 
-                                           add_comments=self.add_comments))
+                                           add_comments=self.add_comments, stats=self.stats),
+                           toc_label="2. Korelasyon Analizi")
         
         # Dağılım analizi
-        self.add_component(DistributionPlots(self.df, "3. DAĞILIM ANALİZİ"))
+        self.add_component(DistributionPlots(self.df, "3. DAĞILIM ANALİZİ", stats=self.stats),
+                           toc_label="3. Dağılım Analizi")
         
         # Eğer görsel dizini belirtilmişse, görselleri ekle
         if self.visuals_directory:
-            self.add_component(TitlePage("4. GÖRSEL ANALİZLER"))
+            self.add_component(TitlePage("4. GÖRSEL ANALİZLER"), toc_label="4. Görsel Analizler")
             self.add_component(ImageGallery(self.visuals_directory))
             
         # Eğer bulgular belirtilmişse, bulgular özetini ekle
         if self.findings:
-            self.add_component(FindingsSummary(self.findings, "5. BULGULAR ÖZETİ"))
\ No newline at end of file
+            self.add_component(FindingsSummary(self.findings, "5. BULGULAR ÖZETİ"),
+                               toc_label="5. Bulgular Özeti")
\ No newline at end of file
@@ -0,0 +1,276 @@
+"""
+Yalnızca metin içeren rapor sayfaları için hafif düzen ve doğrudan PDF yazımı.
+
+TextPage sayfadaki metin satırlarını, dikdörtgenleri ve çizgileri (PDF noktası,
+sol alt köşe orijinli) tutar ve bunları matplotlib figürü kurmadan, PdfPages'in
+açık dosyasına matplotlib'in PDF çizicisiyle (RendererPdf) yerel PDF metin
+komutları olarak yazar. Figür çizimi ve bbox_inches='tight' ölçüm geçişi olmadığı
+için sayfalar daha hızlı yazılır, daha küçüktür ve metinleri aranabilir/seçilebilir
+kalır. Fontlar TrueType (pdf.fonttype = 42) olarak alt kümelenip gömülür; Türkçe
+karakterler için matplotlib ile gelen DejaVu ailesi kullanılır.
+
+Yerel yazım matplotlib'in PDF arka ucunun açık olmayan arayüzlerine (PdfPages'in
+açık dosyası, newPage/endStream, RendererPdf) dayanır ve yalnızca denenmiş sürüm
+aralığında (NATIVE_PDF_VERSIONS) kullanılır. Diğer sürümlerde veya PdfPages dışı
+hedeflerde sayfa aynı öğelerle sayfa boyutunda bir figüre çizilip savefig ile yazılır.
+
+TextFlow paragrafları verilen genişlikte sözcük sözcük satırlara böler ve sayfa
+dolunca yeni sayfaya geçer (devam sayfalarında başlık "(Devam)" ekiyle tekrarlanır).
+
+Örnek:
+    flow = TextFlow("SONUÇ")
+    flow.paragraph(uzun_metin, size=12)
+    pages = flow.pages()        # [TextPage, ...]
+"""
+from functools import lru_cache
+import matplotlib as mpl
+from matplotlib.backends.backend_pdf import RendererPdf
+from matplotlib.colors import to_rgba
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+from matplotlib.path import Path
+from matplotlib.textpath import text_to_path
+from matplotlib.transforms import Affine2D
+
+POINTS_PER_INCH = 72
+LINE_SPACING = 1.25
+# matplotlib ile birlikte gelen DejaVu fontları Türkçe karakterlerin tümünü içerir
+TEXT_FONTS = ['DejaVu Sans']
+MONOSPACE_FONTS = ['DejaVu Sans Mono']
+# Yerel PDF yazımının denendiği matplotlib sürüm aralığı: [en düşük, üst sınır)
+NATIVE_PDF_VERSIONS = ((3, 7), (3, 12))
+NATIVE_PDF = (NATIVE_PDF_VERSIONS[0]
+              <= tuple(int(part) for part in mpl.__version__.split('.')[:2])
+              < NATIVE_PDF_VERSIONS[1])
+
+
+def pdf_file(pdf):
+    """PdfPages nesnesinin açık PdfFile'ı"""
+    return pdf._ensure_file() if hasattr(pdf, '_ensure_file') else pdf._file
+
+
+def native_pdf(pdf):
+    """Sayfalar pdf hedefine yerel PDF komutlarıyla yazılabilir mi"""
+    return NATIVE_PDF and (hasattr(pdf, '_ensure_file') or hasattr(pdf, '_file'))
+
+
+def font_properties(size, weight='normal', monospace=False):
+    return FontProperties(family=MONOSPACE_FONTS if monospace else TEXT_FONTS, size=size, weight=weight)
+
+
+@lru_cache(maxsize=65536)
+def text_width(text, size, weight='normal', monospace=False):
+    """Tek satır metnin genişliği (PDF noktası); sözcük genişlikleri süreç boyunca önbelleklenir"""
+    width, _, _ = text_to_path.get_text_width_height_descent(
+        text, font_properties(size, weight, monospace), ismath=False)
+    return width
+
+
+def wrap_text(text, width, size=12, weight='normal', monospace=False):
+    """
+    Metni verilen genişliğe (PDF noktası) sığacak satırlara böler. Açık satır sonları
+    korunur; tek başına sığmayan sözcük kendi satırına yazılır.
+    """
+    def measure(word):
+        return text_width(word, size, weight, monospace)
+
+    space = measure(' ')
+    lines = []
+    for raw in str(text).split('\n'):
+        if not raw.strip():
+            lines.append('')
+            continue
+        indent = raw[:len(raw) - len(raw.lstrip(' '))]
+        words = raw.split()
+        line, line_width = indent + words[0], measure(indent + words[0])
+        for word in words[1:]:
+            word_width = measure(word)
+            if line_width + space + word_width <= width:
+                line += ' ' + word
+                line_width += space + word_width
+            else:
+                lines.append(line)
+                line, line_width = indent + word, measure(indent) + word_width
+        lines.append(line)
+    return lines
+
+
+class TextPage:
+    """
+    Yerel PDF komutlarıyla yazılan metin sayfası.
+
+    Args:
+        size (tuple): Sayfa boyutu (inç)
+        background: Sayfa arka plan rengi (None ise beyaz/boş)
+    """
+    def __init__(self, size=(11, 8.5), background=None):
+        self.width = size[0] * POINTS_PER_INCH
+        self.height = size[1] * POINTS_PER_INCH
+        self.background = background
+        self.items = []
+
+    def text(self, x, y, text, size=12, weight='normal', color='black', ha='left', monospace=False):
+        """Tek satır metin; (x, y) taban çizgisi noktası, ha: 'left', 'center' veya 'right'"""
+        self.items.append(('text', x, y, str(text), size, weight, color, ha, monospace))
+        return self
+
+    def rect(self, x, y, width, height, color, alpha=1.0):
+        self.items.append(('rect', x, y, width, height, color, alpha))
+        return self
+
+    def line(self, x0, y0, x1, y1, color='black', linewidth=1.0, dashes=None, alpha=1.0):
+        self.items.append(('line', x0, y0, x1, y1, color, linewidth, dashes, alpha))
+        return self
+
+    def prepare(self):
+        return self
+
+    def stamp(self, text):
+        """Sayfa numarası (sağ alt köşe)"""
+        self.text(self.width - 0.4 * POINTS_PER_INCH, 0.3 * POINTS_PER_INCH, text, size=8, ha='right')
+
+    def close(self):
+        pass
+
+    def write(self, pdf):
+        """
+        Sayfayı PdfPages'in açık dosyasına yerel PDF komutlarıyla yazar; bu mümkün
+        değilse (bkz. native_pdf) sayfa boyutunda bir figür olarak savefig ile yazar.
+        """
+        if native_pdf(pdf):
+            self._write_native(pdf)
+        else:
+            self._write_figure(pdf)
+
+    def _write_native(self, pdf):
+        file = pdf_file(pdf)
+        width_in, height_in = self.width / POINTS_PER_INCH, self.height / POINTS_PER_INCH
+        file.newPage(width_in, height_in)
+        try:
+            renderer = RendererPdf(file, POINTS_PER_INCH, height_in, width_in)
+            if self.background is not None:
+                self._draw_rect(renderer, 0, 0, self.width, self.height, self.background, 1.0)
+            for item in self.items:
+                getattr(self, f"_draw_{item[0]}")(renderer, *item[1:])
+            renderer.finalize()
+        finally:
+            file.endStream()
+
+    def _draw_text(self, renderer, x, y, text, size, weight, color, ha, monospace):
+        if not text:
+            return
+        prop = font_properties(size, weight, monospace)
+        if ha != 'left':
+            width = text_width(text, size, weight, monospace)
+            x -= width if ha == 'right' else width / 2
+        gc = renderer.new_gc()
+        gc.set_foreground(color)
+        renderer.draw_text(gc, x, y, text, prop, 0)
+        gc.restore()
+
+    def _draw_rect(self, renderer, x, y, width, height, color, alpha):
+        gc = renderer.new_gc()
+        gc.set_linewidth(0)
+        gc.set_alpha(alpha)
+        renderer.draw_path(gc, Path.unit_rectangle(), Affine2D().scale(width, height).translate(x, y),
+                           to_rgba(color, alpha))
+        gc.restore()
+
+    def _draw_line(self, renderer, x0, y0, x1, y1, color, linewidth, dashes, alpha):
+        gc = renderer.new_gc()
+        gc.set_foreground(color)
+        gc.set_alpha(alpha)
+        gc.set_linewidth(linewidth)
+        if dashes:
+            gc.set_dashes(0, dashes)
+        renderer.draw_path(gc, Path([(x0, y0), (x1, y1)]), Affine2D())
+        gc.restore()
+
+    def _write_figure(self, pdf):
+        """Öğeleri PDF noktası koordinatlarıyla sayfa boyutunda bir figüre çizip kaydeder"""
+        fig = Figure(figsize=(self.width / POINTS_PER_INCH, self.height / POINTS_PER_INCH))
+        if self.background is not None:
+            fig.patch.set_facecolor(self.background)
+        points = Affine2D().scale(1 / POINTS_PER_INCH) + fig.dpi_scale_trans
+        for item in self.items:
+            getattr(self, f"_figure_{item[0]}")(fig, points, *item[1:])
+        pdf.savefig(fig)
+
+    def _figure_text(self, fig, points, x, y, text, size, weight, color, ha, monospace):
+        if text:
+            fig.text(x, y, text, fontproperties=font_properties(size, weight, monospace), color=color,
+                     ha=ha, va='baseline', transform=points)
+
+    def _figure_rect(self, fig, points, x, y, width, height, color, alpha):
+        fig.add_artist(Rectangle((x, y), width, height, facecolor=color, alpha=alpha, linewidth=0,
+                                 transform=points))
+
+    def _figure_line(self, fig, points, x0, y0, x1, y1, color, linewidth, dashes, alpha):
+        line = Line2D([x0, x1], [y0, y1], color=color, linewidth=linewidth, alpha=alpha, transform=points)
+        if dashes:
+            line.set_dashes(dashes)
+        fig.add_artist(line)
+
+
+class TextFlow:
+    """
+    Başlık ve paragrafları sayfalara akıtan düzen.
+
+    Args:
+        title (str): Her sayfanın başlığı (devam sayfalarında "(Devam)" ekiyle)
+        size (tuple): Sayfa boyutu (inç)
+        margin (float): Kenar boşluğu (inç)
+        title_size (int): Başlık font boyutu
+        background: Sayfa arka plan rengi
+    """
+    def __init__(self, title=None, size=(11, 8.5), margin=0.75, title_size=16, background=None):
+        self.title = title
+        self.size = size
+        self.margin = margin * POINTS_PER_INCH
+        self.title_size = title_size
+        self.background = background
+        self._pages = []
+        self._new_page()
+
+    @property
+    def text_width(self):
+        return self.size[0] * POINTS_PER_INCH - 2 * self.margin
+
+    def _new_page(self):
+        page = TextPage(self.size, self.background)
+        self.y = page.height - self.margin
+        if self.title:
+            title = self.title if not self._pages else f"{self.title} (Devam)"
+            self.y -= self.title_size
+            page.text(page.width / 2, self.y, title, size=self.title_size, weight='bold', ha='center')
+            self.y -= self.title_size * LINE_SPACING
+        self._pages.append(page)
+
+    def paragraph(self, text, size=12, indent=0.0, monospace=False, color='black', box=None,
+                  space_after=None):
+        """
+        Paragrafı satırlara bölüp akıtır; sayfa dolunca yeni sayfaya geçer.
+
+        Args:
+            indent (float): Sol girinti (inç)
+            box: Paragraf satırlarının arkasına çizilecek kutu rengi (None ise kutu yok)
+            space_after (float): Paragraftan sonraki boşluk (nokta; None ise yarım satır)
+        """
+        x = self.margin + indent * POINTS_PER_INCH
+        leading = size * LINE_SPACING
+        for line in wrap_text(text, self.text_width - indent * POINTS_PER_INCH, size, monospace=monospace):
+            if self.y - leading < self.margin:
+                self._new_page()
+            self.y -= leading
+            page = self._pages[-1]
+            if box is not None:
+                page.rect(x - 4, self.y - size * 0.3, self.text_width - indent * POINTS_PER_INCH + 8,
+                          leading, box)
+            page.text(x, self.y, line, size=size, color=color, monospace=monospace)
+        self.y -= leading / 2 if space_after is None else space_after
+        return self
+
+    def pages(self):
+        return list(self._pages)
@@ -25,6 +25,25 @@ def check_path_exists(path, create_if_not_exists=False):
         return True
     return False
 
+def iter_image_files(directory, extensions=('.png', '.jpg', '.jpeg')):
+    """
+    Belirtilen dizindeki resim dosyalarını, listeyi bellekte toplamadan
+    (os.scandir ile) dizin sırasıyla tek tek üretir
+    
+    Args:
+        directory (str): Resim dosyalarının bulunduğu dizin
+        extensions (tuple): Resim uzantıları
+        
+    Yields:
+        str: Resim dosyasının yolu
+    """
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(extensions) and entry.is_file():
+                yield entry.path
+
 def get_image_files(directory, extensions=('.png', '.jpg', '.jpeg')):
     """
     Belirtilen dizinden resim dosyalarını listeler
@@ -36,14 +55,7 @@ def get_image_files(directory, extensions=('.png', '.jpg', '.jpeg')):
     Returns:
         list: Resim dosyası yollarının listesi
     """
-    if not os.path.exists(directory):
-        return []
-        
-    image_files = []
-    for file in os.listdir(directory):
-        if file.lower().endswith(extensions):
-            image_files.append(os.path.join(directory, file))
-    return image_files
+    return list(iter_image_files(directory, extensions))
 
 def format_dataframe_summary(df):
     """
@@ -55,7 +67,19 @@ def format_dataframe_summary(df):
     Returns:
         str: Biçimlendirilmiş özet metin
     """
-    stats = df.describe().round(2)
+    return format_describe_table(df.describe())
+
+def format_describe_table(stats):
+    """
+    describe() biçimindeki özet tabloyu metne çevirir
+    
+    Args:
+        stats (pd.DataFrame): İstatistik x sütun tablosu (ör. ReportStatistics.describe())
+        
+    Returns:
+        str: Biçimlendirilmiş özet metin
+    """
+    stats = stats.round(2)
     stats_text = ""
     for col in stats.columns:
         stats_text += f"Özellik: {col}\n"
@@ -0,0 +1,59 @@
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from src.data_processing.batch import clean_batch, discover_inputs, fit_global_artifact
+
+RAW_DATA = Path(__file__).parent.parent / "data" / "raw" / "HousingData.csv"
+
+
+@pytest.fixture
+def region_files(tmp_path):
+    raw = pd.read_csv(RAW_DATA)
+    input_dir = tmp_path / "raw"
+    input_dir.mkdir()
+    for i in range(3):
+        raw.iloc[i * 150:(i + 1) * 150].to_csv(input_dir / f"region_{i}.csv", index=False)
+    (input_dir / "notes.txt").write_text("atlanır")
+    return input_dir
+
+
+def test_discover_inputs(region_files):
+    assert [Path(p).name for p in discover_inputs(region_files)] == [f"region_{i}.csv" for i in range(3)]
+    assert len(discover_inputs(str(region_files / "region_[01].csv"))) == 2
+    with pytest.raises(FileNotFoundError):
+        discover_inputs(str(region_files / "*.parquet"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_per_file(region_files, tmp_path, workers):
+    output_dir = tmp_path / "clean"
+    result = clean_batch(region_files, output_dir, workers=workers, imputation_strategy="median")
+    assert (result['status'] == 'ok').all()
+    assert sorted(p.name for p in output_dir.iterdir()) == [f"region_{i}.csv" for i in range(3)]
+    for row in result.itertuples():
+        cleaned = pd.read_csv(row.output)
+        assert len(cleaned) == row.rows_out
+        assert not cleaned.isnull().any().any()
+
+
+def test_batch_global_statistics(region_files, tmp_path):
+    output_dir = tmp_path / "clean"
+    result = clean_batch(region_files, output_dir, workers=2, statistics='global',
+                         output_format='parquet', imputation_strategy="median")
+    assert (result['status'] == 'ok').all()
+
+    paths = discover_inputs(region_files)
+    artifact = fit_global_artifact(paths, {'imputation_strategy': 'median'})
+    for path, output in zip(paths, result['output']):
+        expected = artifact.transform(pd.read_csv(path))
+        np.testing.assert_allclose(pd.read_parquet(output).to_numpy(), expected.to_numpy())
+
+
+def test_batch_reports_failures(region_files, tmp_path):
+    (region_files / "broken.csv").write_text("")
+    result = clean_batch(region_files, tmp_path / "clean", workers=1, imputation_strategy="median")
+    broken = result[result['input'].str.endswith("broken.csv")].iloc[0]
+    assert broken['status'] == 'error'
+    assert (result['status'] == 'ok').sum() == 3
+    assert not Path(broken['output']).exists()
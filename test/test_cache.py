@@ -0,0 +1,78 @@
+import time
+import pytest
+import pandas as pd
+import numpy as np
+from src.data_processing.cache import StageCache, params_key
+from src.data_processing.cleaner import BostonHousingCleaner
+
+
+@pytest.fixture
+def raw_file(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(50, 3)), columns=['CRIM', 'RM', 'MEDV'])
+    df.loc[::7, 'CRIM'] = np.nan
+    path = tmp_path / "raw.csv"
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_lru_eviction(tmp_path):
+    frame = pd.DataFrame({'a': np.arange(1000, dtype=np.float64)})
+    cache = StageCache(tmp_path, max_mb=0.02)  # yaklaşık iki kayıt sığar
+    for key in ('k1', 'k2'):
+        cache.put(key, frame)
+        time.sleep(0.01)
+    cache.get('k1')  # k1 en son kullanılan olur
+    cache.put('k3', frame)
+    assert 'k1' in cache and 'k3' in cache
+    assert 'k2' not in cache
+    pd.testing.assert_frame_equal(cache.get('k1'), frame)
+
+
+def test_params_key_is_stable():
+    assert params_key('a', {'x': 1, 'y': 2}) == params_key('a', {'y': 2, 'x': 1})
+    assert params_key('a', {'x': 1}) != params_key('a', {'x': 2})
+
+
+def test_pipeline_reuses_cached_stages(raw_file, tmp_path):
+    options = dict(imputation_strategy='median', cache_dir=tmp_path / "cache")
+    first = BostonHousingCleaner(raw_file, tmp_path / "out1.csv", **options)
+    expected = first.run_pipeline()
+    assert first.cached_stages == []
+
+    second = BostonHousingCleaner(raw_file, tmp_path / "out2.csv", **options)
+    result = second.run_pipeline()
+    assert second.cached_stages == ['load', 'impute', 'outliers', 'normalize']
+    assert second.executed_stages == ['save']
+    pd.testing.assert_frame_equal(result, expected)
+
+    # Yalnızca aykırı değer eşiği değişince sadece sonraki aşamalar yeniden hesaplanır
+    third = BostonHousingCleaner(raw_file, tmp_path / "out3.csv", outlier_threshold=2.0, **options)
+    third.run_pipeline()
+    assert third.cached_stages == ['load', 'impute']
+    assert third.executed_stages == ['outliers', 'normalize', 'save']
+
+
+def test_memory_efficient_mode_has_own_cache_entries(raw_file, tmp_path):
+    options = dict(imputation_strategy='median', cache_dir=tmp_path / "cache")
+    BostonHousingCleaner(raw_file, tmp_path / "out1.csv", **options).run_pipeline()
+
+    # float32 / yerinde mod float64 çıktılarını kullanmaz (ve tersi)
+    compact = BostonHousingCleaner(raw_file, tmp_path / "out2.csv", memory_efficient=True, **options)
+    result = compact.run_pipeline()
+    assert compact.cached_stages == []
+    assert set(result.dtypes) == {np.dtype(np.float32)}
+
+    again = BostonHousingCleaner(raw_file, tmp_path / "out3.csv", memory_efficient=True, **options)
+    again.run_pipeline()
+    assert again.cached_stages == ['load', 'impute', 'outliers', 'normalize']
+
+
+def test_input_change_invalidates(raw_file, tmp_path):
+    options = dict(imputation_strategy='median', cache_dir=tmp_path / "cache")
+    BostonHousingCleaner(raw_file, tmp_path / "out.csv", **options).run_pipeline()
+    with open(raw_file, 'a') as f:
+        f.write("1.0,2.0,3.0\n")
+    cleaner = BostonHousingCleaner(raw_file, tmp_path / "out.csv", **options)
+    cleaner.run_pipeline()
+    assert cleaner.cached_stages == []
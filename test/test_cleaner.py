@@ -1,8 +1,13 @@
+import json
 import pytest
 import pandas as pd
 import numpy as np
+from pathlib import Path
 from unittest.mock import patch
 from src.data_processing.cleaner import BostonHousingCleaner
+from src.data_processing.storage import BOSTON_SCHEMA
+
+RAW_DATA = Path(__file__).parent.parent / "data" / "raw" / "HousingData.csv"
 
 
 @pytest.fixture
@@ -32,4 +37,178 @@ def test_integration(mock_read, sample_data, tmp_path):
     cleaner = BostonHousingCleaner("dummy.csv", output_path)
     result = cleaner.run_pipeline()
     assert isinstance(result, pd.DataFrame)
-    assert output_path.exists()
\ No newline at end of file
+    assert output_path.exists()
+
+def test_streaming_pipeline(tmp_path):
+    raw = pd.read_csv(RAW_DATA).head(40)
+    input_path = tmp_path / "raw.csv"
+    raw.to_csv(input_path, index=False)
+    output_path = tmp_path / "clean.csv"
+
+    # ~10 satırlık parçalar
+    cleaner = BostonHousingCleaner(input_path, output_path, chunk_memory_mb=0.002)
+    chunks = list(cleaner.iter_chunks())
+    assert len(chunks) > 1
+    assert chunks[0]['CRIM'].dtype == np.float32
+    assert str(chunks[0]['CHAS'].dtype) == 'Int8'
+
+    summary = cleaner.run_streaming_pipeline()
+    assert summary['rows_read'] == len(raw)
+    assert list(summary['metrics'].index) == ['stream_fit', 'stream_transform']
+    assert summary['metrics'].loc['stream_transform', 'rows_out'] == summary['rows_written']
+    result = pd.read_csv(output_path)
+    assert len(result) == summary['rows_written']
+    assert list(result.columns) == list(raw.columns)
+    assert not result.isnull().any().any()
+
+def test_imputation_strategy(sample_data):
+    cleaner = BostonHousingCleaner("dummy.csv", "dummy_out.csv", imputation_strategy="median")
+    cleaner.df = sample_data.copy()
+    cleaner.handle_missing_values()
+    assert cleaner.df.loc[2, 'CRIM'] == pytest.approx(0.2)
+
+@patch('pandas.read_csv')
+def test_pipeline_stages_run_once(mock_read, sample_data, tmp_path):
+    mock_read.return_value = sample_data
+    cleaner = BostonHousingCleaner("dummy.csv", tmp_path / "clean.csv", imputation_strategy="median")
+    with patch.object(cleaner, 'handle_missing_values', wraps=cleaner.handle_missing_values) as impute:
+        cleaner.run_pipeline()
+    assert impute.call_count == 1
+    assert cleaner.executed_stages == ['load', 'impute', 'outliers', 'normalize', 'save']
+
+@patch('pandas.read_csv')
+def test_pipeline_skip_and_reorder(mock_read, sample_data, tmp_path):
+    mock_read.return_value = sample_data
+    output_path = tmp_path / "clean.csv"
+    cleaner = BostonHousingCleaner("dummy.csv", output_path, imputation_strategy="median")
+    result = cleaner.run_pipeline(stages=['save', 'normalize', 'impute'], skip=['normalize'])
+    # save, bağımlılıklarını öne alır; normalize atlandığı için değerler ölçeklenmez
+    assert cleaner.executed_stages == ['load', 'impute', 'outliers', 'save']
+    assert sorted(result['MEDV']) == [30, 40, 50]
+    assert output_path.exists()
+
+def test_fit_transform_artifact(tmp_path):
+    history = pd.read_csv(RAW_DATA)
+    cleaner = BostonHousingCleaner(RAW_DATA, tmp_path / "clean.csv", imputation_strategy="median")
+    full = cleaner.run_pipeline()
+
+    cleaner.fit(history)
+    artifact_path = tmp_path / "artifacts" / "cleaner.joblib"
+    cleaner.save_artifact(artifact_path)
+
+    fresh = BostonHousingCleaner(RAW_DATA, tmp_path / "unused.csv")
+    fresh.load_artifact(artifact_path)
+    # Yeni gelen satırlar: eğitim yapılmadan uygulanır
+    batch = fresh.transform(history.tail(50))
+    expected = full.loc[full.index.intersection(batch.index)]
+    np.testing.assert_allclose(batch.to_numpy(), expected.to_numpy(), rtol=1e-5, atol=1e-6)
+
+def test_transform_requires_artifact(sample_data):
+    cleaner = BostonHousingCleaner("dummy.csv", "dummy_out.csv")
+    with pytest.raises(RuntimeError):
+        cleaner.transform(sample_data)
+
+@pytest.mark.parametrize("method", ['iqr', 'mahalanobis'])
+def test_streaming_pipeline_multicolumn_outliers(tmp_path, method):
+    input_path = tmp_path / "raw.csv"
+    pd.read_csv(RAW_DATA).to_csv(input_path, index=False)
+    cleaner = BostonHousingCleaner(input_path, tmp_path / "clean.csv", chunk_memory_mb=0.02,
+                                   imputation_strategy="median", outlier_column=None,
+                                   outlier_method=method)
+    summary = cleaner.run_streaming_pipeline()
+    assert summary['chunks'] > 1
+    assert 0 < summary['rows_written'] < summary['rows_read']
+
+def test_memory_efficient_pipeline(tmp_path):
+    output_path = tmp_path / "clean.csv"
+    cleaner = BostonHousingCleaner(RAW_DATA, output_path, imputation_strategy="median",
+                                   memory_efficient=True)
+    result = cleaner.run_pipeline()
+    assert set(result.dtypes) == {np.dtype(np.float32)}
+    assert not result.isnull().any().any()
+    assert list(cleaner.memory_report) == ['load', 'impute', 'outliers', 'normalize', 'save']
+    assert all('peak_rss_mb' in usage for usage in cleaner.memory_report.values())
+
+    reference = BostonHousingCleaner(RAW_DATA, tmp_path / "ref.csv", imputation_strategy="median")
+    expected = reference.run_pipeline()
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-4, atol=1e-4)
+
+@pytest.mark.parametrize("method", ['zscore', 'iqr', 'mad'])
+def test_memory_efficient_outliers_match_block_mask(method):
+    raw = pd.read_csv(RAW_DATA).fillna(0)
+    default = BostonHousingCleaner("dummy.csv", "dummy_out.csv", outlier_method=method)
+    compact = BostonHousingCleaner("dummy.csv", "dummy_out.csv", outlier_method=method, memory_efficient=True)
+    default.df, compact.df = raw.astype(np.float32), raw.astype(np.float32)
+    default.remove_outliers()
+    compact.remove_outliers()
+    assert 0 < len(compact.df) < len(raw)
+    pd.testing.assert_index_equal(compact.df.index, default.df.index)
+
+
+def test_pipeline_metrics(tmp_path):
+    records = []
+    metrics_path = tmp_path / "metrics" / "stages.jsonl"
+    cleaner = BostonHousingCleaner(RAW_DATA, tmp_path / "clean.csv", imputation_strategy="median",
+                                   outlier_column=None, metrics_path=metrics_path,
+                                   metrics_callback=records.append)
+    result, summary = cleaner.run_pipeline(return_metrics=True)
+
+    assert list(summary.index) == ['load', 'impute', 'outliers', 'normalize', 'save']
+    assert (summary['status'] == 'ok').all()
+    assert (summary['wall_s'] >= 0).all()
+    raw = pd.read_csv(RAW_DATA)
+    assert summary.loc['impute', 'nulls_imputed'] == raw.isnull().sum().sum()
+    assert summary.loc['outliers', 'rows_in'] == len(raw)
+    assert summary.loc['outliers', 'rows_out'] == len(result)
+
+    lines = [json.loads(line) for line in metrics_path.read_text(encoding='utf-8').splitlines()]
+    assert [line['stage'] for line in lines] == [record['stage'] for record in records]
+    assert len({line['run_id'] for line in lines}) == 1
+
+@pytest.mark.parametrize("method,workers", [('zscore', 1), ('iqr', 2), ('mad', 1)])
+def test_partitioned_pipeline_matches_single_machine(tmp_path, method, workers):
+    raw = pd.read_csv(RAW_DATA)
+    partitions = tmp_path / "partitions"
+    partitions.mkdir()
+    for i in range(4):
+        raw.iloc[i * 130:(i + 1) * 130].to_csv(partitions / f"part_{i}.csv", index=False)
+
+    reference = BostonHousingCleaner(RAW_DATA, tmp_path / "single.csv", schema=BOSTON_SCHEMA,
+                                     imputation_strategy="median", outlier_column=None,
+                                     outlier_method=method)
+    expected = reference.run_pipeline()
+
+    cleaner = BostonHousingCleaner(partitions, tmp_path / "clean", imputation_strategy="median",
+                                   outlier_column=None, outlier_method=method, chunk_memory_mb=0.005)
+    table = cleaner.run_partitioned_pipeline(workers=workers)
+    assert table['rows_in'].sum() == len(raw)
+    result = pd.concat([pd.read_csv(path) for path in table['output']], ignore_index=True)
+    assert len(result) == len(expected)
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9)
+
+def test_partitioned_cleaner_requires_factory_for_unmergeable_strategy(tmp_path):
+    from src.data_processing.partitioned import PartitionedCleaner
+    pd.read_csv(RAW_DATA).to_csv(tmp_path / "part_0.csv", index=False)
+    with pytest.raises(ValueError, match="imputer_factory"):
+        PartitionedCleaner(tmp_path, tmp_path / "clean", imputation_strategy="rf")
+
+@pytest.mark.parametrize("method", ['iqr', 'mad'])
+def test_streaming_fit_uses_all_chunks(tmp_path, method):
+    from src.data_processing.outliers import univariate_bounds
+    raw = pd.read_csv(RAW_DATA)
+    input_path = tmp_path / "raw.csv"
+    raw.to_csv(input_path, index=False)
+    cleaner = BostonHousingCleaner(input_path, tmp_path / "clean.csv", chunk_memory_mb=0.005,
+                                   imputation_strategy="median", outlier_column=None,
+                                   outlier_method=method)
+    cleaner.run_streaming_pipeline()
+
+    full = pd.concat(cleaner.iter_chunks(), ignore_index=True)
+    values = full.to_numpy(dtype=np.float64, na_value=np.nan)
+    medians = np.nanmedian(values, axis=0)
+    np.testing.assert_allclose(cleaner.artifact.imputer.statistics_, medians)
+    imputed = np.where(np.isnan(values), medians, values)
+    lower, upper = univariate_bounds(imputed, method, None)
+    expected = dict(zip(full.columns, zip(lower, upper)))
+    for col, bounds in cleaner.artifact.outlier_bounds.items():
+        np.testing.assert_allclose(bounds, expected[col])
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import gaussian_kde
+
+from src.data_processing.density import bandwidth, summarize_column, summarize_frame
+
+
+@pytest.fixture
+def bimodal():
+    rng = np.random.default_rng(0)
+    values = np.concatenate([rng.lognormal(size=3000), rng.normal(10, 0.5, 2000)])
+    values[::97] = np.nan
+    return values
+
+
+def test_kde_matches_exact_gaussian_kde(bimodal):
+    summary = summarize_column(bimodal, name='x')
+    x, density = summary.kde()
+    finite = bimodal[np.isfinite(bimodal)]
+    reference = gaussian_kde(finite)(x)
+    assert summary.bw == pytest.approx(bandwidth(finite.std(ddof=1), len(finite)))
+    np.testing.assert_allclose(density, reference, atol=1e-3 * reference.max())
+    assert np.trapezoid(density, x) == pytest.approx(1.0, abs=1e-3)
+
+
+def test_histogram_and_box_from_one_summary(bimodal):
+    summary = summarize_column(pd.Series(bimodal, name='x'))
+    finite = bimodal[np.isfinite(bimodal)]
+    assert summary.name == 'x' and summary.n_missing == np.isnan(bimodal).sum()
+
+    counts, edges = summary.histogram(64)
+    expected, _ = np.histogram(finite, bins=edges)
+    np.testing.assert_array_equal(counts, expected)
+    assert counts.sum() == len(finite)
+
+    q1, median, q3 = np.percentile(finite, [25, 50, 75])
+    assert (summary.box['q1'], summary.box['med'], summary.box['q3']) == (q1, median, q3)
+    inside = finite[(finite >= q1 - 1.5 * (q3 - q1)) & (finite <= q3 + 1.5 * (q3 - q1))]
+    assert summary.box['whishi'] == inside.max()
+    assert len(summary.box['fliers']) == len(finite) - len(inside)
+
+
+def test_summarize_frame_skips_empty_and_constant_columns():
+    df = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'b': [np.nan] * 3, 'c': [5.0] * 3, 'd': list('xyz')})
+    summaries = summarize_frame(df)
+    assert list(summaries) == ['a', 'c']
+    x, density = summaries['c'].kde()
+    assert len(x) == 0
+    assert summaries['c'].histogram()[0].tolist() == [3]
+
+
+def test_auto_histogram_matches_numpy_with_equal_widths(bimodal):
+    finite = bimodal[np.isfinite(bimodal)]
+    heavy = np.random.default_rng(1).lognormal(0, 2, 500)
+    for values in (finite, heavy):
+        counts, edges = summarize_column(values).histogram()
+        assert len(counts) == len(np.histogram_bin_edges(values, 'auto')) - 1
+        np.testing.assert_allclose(np.diff(edges), np.diff(edges)[0])
+        np.testing.assert_array_equal(counts, np.histogram(values, bins=edges)[0])
@@ -0,0 +1,56 @@
+import pytest
+import numpy as np
+from sklearn.impute import SimpleImputer
+from src.data_processing.imputation import (IMPUTATION_STRATEGIES, ColumnStatImputer,
+                                            IndexedKNNImputer, build_imputer)
+
+
+@pytest.fixture
+def correlated_data():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=200)
+    data = np.column_stack([x, 2 * x + rng.normal(0, 0.05, 200), rng.normal(size=200)])
+    corrupted = data.copy()
+    corrupted[::10, 1] = np.nan
+    corrupted[5::20, 2] = np.nan
+    return data, corrupted
+
+
+@pytest.mark.parametrize("strategy", IMPUTATION_STRATEGIES)
+def test_strategies_fill_all_values(correlated_data, strategy):
+    _, corrupted = correlated_data
+    imputer = build_imputer(strategy, max_iter=3)
+    filled = imputer.fit_transform(corrupted)
+    assert filled.shape == corrupted.shape
+    assert not np.isnan(filled).any()
+
+
+def test_knn_uses_neighbours(correlated_data):
+    data, corrupted = correlated_data
+    filled = IndexedKNNImputer(n_neighbors=3).fit_transform(corrupted)
+    missing = np.isnan(corrupted[:, 1])
+    assert np.abs(filled[missing, 1] - data[missing, 1]).mean() < 0.2
+
+
+def test_subsampled_fit(correlated_data):
+    _, corrupted = correlated_data
+    imputer = build_imputer("median", sample_size=50).fit(corrupted)
+    assert not np.isnan(imputer.transform(corrupted)).any()
+
+
+@pytest.mark.parametrize("strategy", ["median", "mean"])
+def test_low_memory_matches_simple_imputer(correlated_data, strategy):
+    _, corrupted = correlated_data
+    expected = SimpleImputer(strategy=strategy).fit_transform(corrupted)
+    values = corrupted.astype(np.float32)
+    imputer = build_imputer(strategy, low_memory=True)
+    assert isinstance(imputer, ColumnStatImputer)
+    filled = imputer.fit_transform(values)
+    # Yerinde doldurulur, tip korunur
+    assert filled is values and filled.dtype == np.float32
+    np.testing.assert_allclose(filled, expected, rtol=1e-5)
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError):
+        build_imputer("magic")
@@ -0,0 +1,30 @@
+import pandas as pd
+import numpy as np
+from src.data_processing.memory import downcast_numeric, frame_memory_mb, track_memory
+
+
+def test_downcast_numeric():
+    df = pd.DataFrame({
+        'price': [1.5, 2.25, np.nan],
+        'rooms': [1, 300, 5],
+        'chas': pd.array([0, 1, None], dtype='Int64'),
+        'name': ['a', 'b', 'c'],
+    })
+    small = downcast_numeric(df)
+    assert small['price'].dtype == np.float32
+    assert small['rooms'].dtype == np.int16
+    assert str(small['chas'].dtype) == 'Int8'
+    assert small['name'].tolist() == ['a', 'b', 'c']
+    assert small['rooms'].tolist() == [1, 300, 5]
+    assert frame_memory_mb(small) < frame_memory_mb(df)
+    # Kaynak veri değişmez
+    assert df['price'].dtype == np.float64
+
+
+def test_track_memory():
+    with track_memory() as usage:
+        block = np.ones((1000, 100))
+    assert set(usage) == {'rss_mb', 'peak_rss_mb', 'peak_exact'}
+    if usage['peak_rss_mb'] is not None:
+        assert usage['peak_rss_mb'] > 0
+    del block
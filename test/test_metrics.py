@@ -0,0 +1,46 @@
+import pytest
+import pandas as pd
+import numpy as np
+from src.data_processing.metrics import StageMetrics, count_nulls
+
+
+def test_track_records_rows_and_nulls():
+    metrics = StageMetrics()
+    metrics.start_run()
+    state = {'df': pd.DataFrame({'a': [1.0, np.nan, 3.0], 'b': [np.nan, np.nan, 1.0]})}
+    with metrics.track('fill', lambda: state['df']):
+        state['df'] = state['df'].fillna(0)
+    with metrics.track('drop', lambda: state['df']):
+        state['df'] = state['df'].iloc[:2]
+
+    fill, drop = metrics.records
+    assert (fill['rows_in'], fill['rows_out'], fill['nulls_imputed']) == (3, 3, 3)
+    assert (drop['rows_in'], drop['rows_out'], drop['nulls_imputed']) == (3, 2, None)
+    assert fill['run_id'] == drop['run_id']
+    assert list(metrics.summary().index) == ['fill', 'drop']
+
+
+def test_null_counts_can_be_disabled():
+    metrics = StageMetrics()
+    metrics.start_run(null_counts=False)
+    state = {'df': pd.DataFrame({'a': [1.0, np.nan]})}
+    with metrics.track('fill', lambda: state['df']):
+        state['df'] = state['df'].fillna(0)
+    record = metrics.records[0]
+    assert record['nulls_in'] is None and record['nulls_imputed'] is None
+    assert (record['rows_in'], record['rows_out']) == (2, 2)
+
+
+def test_track_records_failed_stage():
+    records = []
+    metrics = StageMetrics(callback=records.append)
+    with pytest.raises(RuntimeError):
+        with metrics.track('broken'):
+            raise RuntimeError("hata")
+    assert records[0]['status'] == 'error'
+    assert records[0]['wall_s'] >= 0
+
+
+def test_count_nulls():
+    assert count_nulls(None) == 0
+    assert count_nulls(pd.DataFrame({'a': [1, None], 'b': ['x', None]})) == 2
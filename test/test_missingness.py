@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_processing.missingness import MissingnessMap
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(1003, 4)), columns=list('abcd'))
+    df.loc[rng.random(1003) < 0.2, 'a'] = np.nan
+    df.loc[df['a'].isna() & (rng.random(1003) < 0.5), 'b'] = np.nan
+    df.loc[700:, 'c'] = np.nan
+    return df
+
+
+def test_counts_and_cooccurrence_match_pandas(frame):
+    nulls = MissingnessMap.from_frame(frame)
+    mask = frame.isna().astype(int)
+    pd.testing.assert_series_equal(nulls.counts(), frame.isna().sum(), check_dtype=False)
+    np.testing.assert_array_equal(nulls.cooccurrence().to_numpy(), (mask.T @ mask).to_numpy())
+    assert nulls.cooccurrence(normalize=True).loc['b', 'a'] == 1.0
+    assert nulls.cooccurrence(normalize=True).loc['d'].isna().all()
+
+    top = nulls.top_pairs(2)
+    assert {tuple(row) for row in top[['column_a', 'column_b']].to_numpy()} >= {('a', 'b')}
+    assert (top['rows'] > 0).all()
+
+
+def test_block_fractions(frame):
+    nulls = MissingnessMap.from_frame(frame)
+    fractions, block_rows = nulls.block_fractions(blocks=10)
+    assert block_rows % 8 == 0 and len(fractions) <= 10
+    for i, start in enumerate(range(0, len(frame), block_rows)):
+        expected = frame.iloc[start:start + block_rows].isna().mean().to_numpy()
+        np.testing.assert_allclose(fractions[i], expected, rtol=1e-6)
+
+    small = MissingnessMap.from_frame(frame.head(20))
+    cells, rows = small.block_fractions(blocks=100)
+    assert rows == 1
+    np.testing.assert_array_equal(cells, frame.head(20).isna().to_numpy())
@@ -0,0 +1,46 @@
+import pytest
+import numpy as np
+from src.data_processing.outliers import (OUTLIER_METHODS, MahalanobisDetector,
+                                          outlier_mask, univariate_bounds)
+
+
+@pytest.fixture
+def values():
+    rng = np.random.default_rng(3)
+    x = rng.normal(size=2000)
+    data = np.column_stack([x, x + rng.normal(0, 0.1, 2000), rng.normal(size=2000)])
+    data[10, 2] = 25.0      # tek değişkenli aykırı değer
+    data[20, :2] = [2, -2]  # yalnızca çok değişkenli olarak aykırı
+    return data
+
+
+@pytest.mark.parametrize("method", OUTLIER_METHODS)
+def test_methods_flag_extreme_value(values, method):
+    keep = outlier_mask(values, method)
+    assert keep.dtype == bool and keep.shape == (len(values),)
+    assert not keep[10]
+    assert keep.mean() > 0.95
+
+
+def test_mahalanobis_detects_multivariate_outlier(values):
+    assert outlier_mask(values, 'zscore')[20]
+    assert not outlier_mask(values, 'mahalanobis')[20]
+
+
+def test_chunked_covariance_matches_full_fit(values):
+    full = MahalanobisDetector().fit(values)
+    chunked = MahalanobisDetector().fit_chunks(values[i:i + 300] for i in range(0, len(values), 300))
+    np.testing.assert_allclose(chunked.distances(values), full.distances(values))
+
+
+def test_degenerate_columns_are_not_filtered():
+    data = np.column_stack([np.zeros(100), np.r_[np.ones(90), np.zeros(10)], np.arange(100.0)])
+    for method in ('zscore', 'iqr', 'mad'):
+        lower, upper = univariate_bounds(data, method)
+        assert np.isinf(lower[0]) and np.isinf(upper[0])
+    assert outlier_mask(data, 'iqr').all()
+
+
+def test_unknown_method(values):
+    with pytest.raises(ValueError):
+        outlier_mask(values, 'magic')
@@ -0,0 +1,236 @@
+import os
+import re
+import shutil
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+from PIL import Image
+
+from src.reporting.core import PdfReport, ReportComponent
+from src.reporting.image_pages import encode_image
+from src.reporting.statistics import ReportStatistics
+from src.reporting.templates import DataAnalysisReport
+from src.reporting.text_layout import text_width, wrap_text
+from src.reporting.components import (CorrelationMatrix, DataSummary, DistributionPlots,
+                                      ImageGallery, TableOfContents, TextSection)
+
+
+class ParentOnlyPage(ReportComponent):
+    """Paralel modda da ana süreçte çizilmesi gereken bileşen"""
+    parallel_safe = False
+    rendered_in = []
+
+    def render(self, pdf):
+        ParentOnlyPage.rendered_in.append(os.getpid())
+        plt.figure(figsize=self.figsize)
+        plt.text(0.5, 0.5, self.title)
+        plt.axis('off')
+        pdf.savefig()
+        plt.close()
+
+
+@pytest.fixture
+def components():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(300, 3)), columns=['RM', 'LSTAT', 'MEDV'])
+    return [
+        TableOfContents(["Veri Özeti", "Korelasyon", "Dağılımlar"]),
+        DataSummary(df),
+        ParentOnlyPage("Ara Sayfa"),
+        CorrelationMatrix(df),
+        DistributionPlots(df),
+        TextSection("Sonuç", "Paralel çizim testi"),
+    ]
+
+
+def test_parallel_report_matches_serial(tmp_path, components):
+    serial, parallel = tmp_path / "serial.pdf", tmp_path / "parallel.pdf"
+    ParentOnlyPage.rendered_in.clear()
+    PdfReport(str(serial)).create_report(components)
+    PdfReport(str(parallel), workers=2).create_report(components)
+
+    # Sayfalar aynı sırada ve bayt bayt aynı içerikle yazılır
+    assert parallel.read_bytes() == serial.read_bytes()
+    # parallel_safe = False olan bileşen iki modda da ana süreçte çizilir
+    assert ParentOnlyPage.rendered_in == [os.getpid(), os.getpid()]
+
+
+def test_shared_inputs_are_serialized_once(components):
+    import pickle
+    from src.reporting.core import _dump_component, _shared_tokens
+    tokens, shared = _shared_tokens(components)
+    df = components[1].df
+    assert list(shared.values()) == [df]
+    payload = _dump_component(components[3], tokens)
+    assert len(payload) < len(pickle.dumps(df)) // 2
+    # Serileştirilemeyen bileşen None döndürür ve ana süreçte çizilir
+    components[5].formatter = lambda value: value
+    assert _dump_component(components[5], tokens) is None
+
+
+def test_page_estimates_fill_table_of_contents(tmp_path):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(100, 6)), columns=list('ABCDEF'))
+    df['G'] = np.nan
+    toc = TableOfContents(["Özet", "Dağılımlar", "Sonuç"])
+    summary = DataSummary(df)
+    summary.toc_label = "Özet"
+    distributions = DistributionPlots(df, max_cols=4)
+    distributions.toc_label = "Dağılımlar"
+    closing = TextSection("Sonuç", "Son sayfa")
+    closing.toc_label = "Sonuç"
+
+    # Tamamen eksik sütun çizilmez: 6 sütun / 4 = 2 sayfa
+    assert distributions.estimate_pages() == len(list(distributions.iter_pages())) == 2
+    plt.close('all')
+
+    report = PdfReport(str(tmp_path / "toc.pdf"))
+    report.create_report([toc, summary, distributions, closing])
+    # Veri özeti (7 sütun x 9 satır) iki metin sayfasına taşar
+    assert summary.estimate_pages() == 2
+    assert toc.page_refs == {"Özet": 1, "Dağılımlar": 3, "Sonuç": 5}
+    assert report._next_page - 1 == report._total_pages == 5
+    # Yazıcı fazladan figür açmaz; tüm sayfalar kapatılır
+    assert plt.get_fignums() == []
+
+
+def test_report_statistics_match_pandas():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame(rng.normal(5, 2, size=(500, 3)), columns=['RM', 'LSTAT', 'MEDV'])
+    df['MEDV'] += 3 * df['RM']
+    df.loc[rng.random(500) < 0.2, 'RM'] = np.nan
+    df.loc[rng.random(500) < 0.3, 'LSTAT'] = np.nan
+    df['EMPTY'] = np.nan
+    df['CHAS'] = rng.integers(0, 2, 500)
+    df['TOWN'] = 'Boston'
+
+    stats = ReportStatistics(df)
+    pd.testing.assert_frame_equal(stats.describe(), df.describe(), check_dtype=False)
+    pd.testing.assert_frame_equal(stats.correlation, df.corr(numeric_only=True), check_dtype=False)
+    assert stats.null_counts.to_dict() == df.isna().sum().to_dict()
+    assert list(stats.densities) == ['RM', 'LSTAT', 'MEDV', 'CHAS']
+
+
+def test_template_components_share_statistics():
+    df = pd.DataFrame(np.random.default_rng(3).normal(size=(50, 2)), columns=['RM', 'MEDV'])
+    template = DataAnalysisReport(df)
+    shared = [component.stats for component in template.get_components() if hasattr(component, 'stats')]
+    assert len(shared) == 3 and all(stats is template.stats for stats in shared)
+
+
+def test_page_cache_rerenders_only_changed_sections(tmp_path, components):
+    def build(findings):
+        return components + [TextSection("Bulgular", findings)]
+
+    cache_dir = tmp_path / "cache"
+    first = PdfReport(str(tmp_path / "first.pdf"), cache_dir=str(cache_dir))
+    first.create_report(build("İlk taslak"))
+    assert first.cache_hits == []
+
+    # Aynı girdiler: tüm bölümler önbellekten; çıktı bayt bayt aynı
+    again = PdfReport(str(tmp_path / "again.pdf"), cache_dir=str(cache_dir))
+    again.create_report(build("İlk taslak"))
+    assert len(again.cache_hits) == len(components) + 1
+    assert (tmp_path / "again.pdf").read_bytes() == (tmp_path / "first.pdf").read_bytes()
+
+    # Yalnızca bulgular metni değişti: yalnızca o bölüm yeniden çizilir
+    edited = PdfReport(str(tmp_path / "edited.pdf"), cache_dir=str(cache_dir), workers=2)
+    edited.create_report(build("Düzeltilmiş metin"))
+    assert len(edited.cache_hits) == len(components)
+    assert (tmp_path / "edited.pdf").read_bytes() != (tmp_path / "first.pdf").read_bytes()
+
+
+def test_wrap_text_fits_width():
+    text = "Şehir merkezine yakınlık ve oda sayısı İstanbul'daki gibi fiyatları etkiler. " * 5
+    lines = wrap_text(text, 300, size=12)
+    assert len(lines) > 1
+    assert all(text_width(line, 12) <= 300 for line in lines)
+    assert " ".join(lines).split() == text.split()
+
+
+def test_text_pages_paginate_and_embed_searchable_fonts(tmp_path):
+    section = TextSection("GİRİŞ", "Çok uzun bir ağaç gölgesi paragrafı. " * 400)
+    assert section.estimate_pages() > 1
+
+    path = tmp_path / "text.pdf"
+    PdfReport(str(path)).create_report([section])
+    data = path.read_bytes()
+    assert len(re.findall(rb'/Type\s*/Page(?![s\w])', data)) == section.estimate_pages()
+    # Metin, Type 3 glif çizimleri yerine ToUnicode eşlemeli gömülü TrueType alt kümesiyle yazılır
+    assert b'/Type3' not in data
+    assert b'/FontFile2' in data and b'/ToUnicode' in data
+
+
+def test_image_gallery_embeds_encoded_files_once(tmp_path):
+    images = tmp_path / "images"
+    images.mkdir()
+    pixels = np.random.default_rng(4).integers(0, 255, size=(40, 60, 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(images / "grafik.png")
+    shutil.copy(images / "grafik.png", images / "kopya.png")
+    Image.fromarray(pixels).save(images / "foto.jpg", quality=80)
+    Image.fromarray(np.dstack([pixels, np.full((40, 60), 128, np.uint8)])).save(images / "saydam.png")
+
+    gallery = ImageGallery(str(images), descriptions={"grafik.png": "Açıklama"})
+    assert gallery.estimate_pages() == 4
+    path = tmp_path / "gallery.pdf"
+    PdfReport(str(path)).create_report([gallery])
+    data = path.read_bytes()
+    assert len(re.findall(rb'/Type\s*/Page(?![s\w])', data)) == 4
+    # Aynı içerikli iki dosya tek nesne; saydam resim ve maskesi iki nesne
+    assert len(re.findall(rb'/Subtype\s*/Image', data)) == 4
+    # JPEG dosyası ve alfa kanalsız PNG'nin sıkıştırılmış verisi çözülmeden gömülür
+    assert (images / "foto.jpg").read_bytes() in data
+    assert encode_image(str(images / "grafik.png")).passthrough
+    assert encode_image(str(images / "grafik.png")).data in data
+    assert b'/SMask' in data and b'/Predictor 15' in data
+
+    # Hedef çözünürlük sınırı: en-boy oranı korunarak küçültülür
+    small = encode_image(str(images / "foto.jpg"), max_size=(30, 30))
+    assert (small.width, small.height) == (30, 20) and not small.passthrough
+
+
+def test_image_pages_fall_back_to_figures(tmp_path, monkeypatch):
+    from src.reporting import text_layout
+    monkeypatch.setattr(text_layout, 'NATIVE_PDF', False)
+    images = tmp_path / "images"
+    images.mkdir()
+    pixels = np.random.default_rng(5).integers(0, 255, size=(40, 60, 3), dtype=np.uint8)
+    Image.fromarray(pixels).save(images / "grafik.png")
+    Image.fromarray(np.dstack([pixels, np.full((40, 60), 128, np.uint8)])).save(images / "saydam.png")
+
+    gallery = ImageGallery(str(images))
+    path = tmp_path / "gallery.pdf"
+    PdfReport(str(path)).create_report([gallery])
+    data = path.read_bytes()
+    assert len(re.findall(rb'/Type\s*/Page(?![s\w])', data)) == gallery.estimate_pages() == 2
+    assert b'/Subtype /Image' in data
+    assert plt.get_fignums() == []
+
+def test_text_layout_computed_once_per_render(tmp_path, monkeypatch):
+    section = TextSection("Uzun Bölüm", "Uzun metin. " * 800)
+    calls = []
+    layout = TextSection._layout
+    monkeypatch.setattr(TextSection, '_layout', lambda self: calls.append(1) or layout(self))
+    report = PdfReport(str(tmp_path / "once.pdf"))
+    report.create_report([section])
+    assert len(calls) == 1
+    assert '_pending_layout' not in section.cache_params()
+    # Nitelik değişirse saklanan yerleşim kullanılmaz
+    section.estimate_pages()
+    section.text = "Kısa metin"
+    assert len(list(section.iter_pages())) == 1
+
+def test_text_pages_fall_back_to_figures(tmp_path, monkeypatch):
+    from src.reporting import text_layout
+    monkeypatch.setattr(text_layout, 'NATIVE_PDF', False)
+    section = TextSection("Uzun Bölüm", "Türkçe karakterli uzun metin: ğüşiöç. " * 400)
+    toc = TableOfContents(["Uzun Bölüm"])
+    output = tmp_path / "fallback.pdf"
+    PdfReport(str(output)).create_report([toc, section])
+    data = output.read_bytes()
+    assert len(re.findall(rb'/Type\s*/Page(?![s\w])', data)) == 1 + section.estimate_pages()
+    assert plt.get_fignums() == []
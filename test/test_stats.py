@@ -0,0 +1,68 @@
+import pytest
+import pandas as pd
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+from src.data_processing.stats import ExactQuantiles, RunningStats, compute_stats
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(1)
+    values = rng.normal(5, 2, size=(1000, 3))
+    values[::13, 0] = np.nan
+    return pd.DataFrame(values, columns=['a', 'b', 'c'])
+
+
+def test_streaming_matches_numpy(data):
+    stats = compute_stats(data.iloc[i:i + 150] for i in range(0, len(data), 150))
+    values = data.to_numpy()
+    np.testing.assert_allclose(stats.mean, np.nanmean(values, axis=0))
+    np.testing.assert_allclose(stats.variance(ddof=1), np.nanvar(values, axis=0, ddof=1))
+    np.testing.assert_allclose(stats.min, np.nanmin(values, axis=0))
+    np.testing.assert_allclose(stats.max, np.nanmax(values, axis=0))
+    assert stats.null_count.tolist() == data.isnull().sum().tolist()
+    assert stats.n_rows == len(data)
+
+
+def test_merge_equals_single_pass(data):
+    left = RunningStats(list(data.columns)).update(data.iloc[:300])
+    right = RunningStats(list(data.columns)).update(data.iloc[300:])
+    single = RunningStats(list(data.columns)).update(data)
+    merged = left.merge(right)
+    np.testing.assert_allclose(merged.mean, single.mean)
+    np.testing.assert_allclose(merged.m2, single.m2)
+
+
+def test_scaler_and_bounds(data):
+    complete = data.dropna()
+    stats = RunningStats(list(data.columns)).update(complete)
+    expected = StandardScaler().fit(complete.to_numpy())
+    np.testing.assert_allclose(stats.to_scaler().transform(complete.to_numpy()),
+                               expected.transform(complete.to_numpy()))
+
+    lower, upper = stats.zscore_bounds(2.0)['b']
+    z = np.abs((complete['b'] - complete['b'].mean()) / complete['b'].std())
+    assert ((complete['b'] > lower) & (complete['b'] < upper)).equals(z < 2.0)
+
+
+@pytest.mark.parametrize("center", [None, 'median'])
+def test_exact_quantiles_match_numpy(center):
+    rng = np.random.default_rng(2)
+    values = rng.lognormal(size=(5000, 3)) - 1.0
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[:, 2] = np.round(values[:, 2], 1)  # çok sayıda tekrar eden değer
+    if center == 'median':
+        center = np.nanmedian(values, axis=0)
+        reference = np.abs(values - center)
+    else:
+        reference = values
+
+    quantiles = ExactQuantiles([0, 1, 2], [0.25, 0.5, 0.75], center=center)
+    done = False
+    while not done:
+        partials = [quantiles.sketch().update(part) for part in (values[:1700], values[1700:3100], values[3100:])]
+        merged = partials[0]
+        for partial in partials[1:]:
+            merged.merge(partial)
+        done = quantiles.advance(merged)
+    np.testing.assert_array_equal(quantiles.result(), np.nanpercentile(reference, [25, 50, 75], axis=0))
@@ -0,0 +1,71 @@
+import pytest
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from src.data_processing.storage import (BOSTON_SCHEMA, ChunkWriter, detect_format,
+                                         estimate_chunk_rows, iter_chunks, read_table, write_table)
+
+RAW_DATA = Path(__file__).parent.parent / "data" / "raw" / "HousingData.csv"
+
+
+@pytest.fixture
+def raw_data():
+    return pd.read_csv(RAW_DATA, dtype=BOSTON_SCHEMA)
+
+
+def test_chunk_rows_follow_budget():
+    small = estimate_chunk_rows(BOSTON_SCHEMA, 1)
+    large = estimate_chunk_rows(BOSTON_SCHEMA, 4)
+    assert large == pytest.approx(4 * small, rel=0.01)
+    with pytest.raises(ValueError):
+        estimate_chunk_rows(BOSTON_SCHEMA, 0)
+
+
+def test_detect_format():
+    assert detect_format("a/b.csv") == "csv"
+    assert detect_format("a/b.parquet") == "parquet"
+    assert detect_format("a/b.arrow") == "feather"
+    # Diğer uzantılar önceki gibi CSV'dir
+    assert detect_format("a/b.csv.gz") == detect_format("a/b.txt") == detect_format("a/b") == "csv"
+
+
+def test_compressed_csv_roundtrip(tmp_path):
+    df = pd.DataFrame({'RM': [6.5, 7.1], 'MEDV': [24.0, 30.5]})
+    path = tmp_path / "clean.csv.gz"
+    write_table(df, path)
+    assert path.read_bytes()[:2] == b'\x1f\x8b'  # gzip
+    pd.testing.assert_frame_equal(read_table(path), df)
+
+
+@pytest.mark.parametrize("name", ["data.parquet", "data.feather"])
+def test_columnar_roundtrip_with_projection(raw_data, tmp_path, name):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / name
+    write_table(raw_data, path)
+    result = read_table(path, columns=["CHAS", "MEDV"])
+    assert list(result.columns) == ["CHAS", "MEDV"]
+    assert result["MEDV"].dtype == np.float32
+    assert str(result["CHAS"].dtype) == "Int8"
+    pd.testing.assert_frame_equal(result, raw_data[["CHAS", "MEDV"]])
+
+
+def test_partitioned_parquet(raw_data, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "partitioned.parquet"
+    write_table(raw_data, path, partition_cols=["CHAS"])
+    assert path.is_dir()
+    result = read_table(path, columns=["MEDV"])
+    assert len(result) == len(raw_data)
+
+
+def test_chunk_writer_parquet(raw_data, tmp_path):
+    pytest.importorskip("pyarrow")
+    src = tmp_path / "src.parquet"
+    write_table(raw_data, src)
+    dst = tmp_path / "dst.parquet"
+    with ChunkWriter(dst) as writer:
+        chunks = list(iter_chunks(src, memory_budget_mb=0.01))
+        assert len(chunks) > 1
+        for chunk in chunks:
+            writer.write(chunk)
+    pd.testing.assert_frame_equal(read_table(dst), raw_data)
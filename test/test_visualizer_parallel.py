@@ -0,0 +1,166 @@
+import json
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from scipy import stats
+
+from src.data_processing.visualizer import (BostonVisualizer, binned_counts_2d, decimate_points,
+                                              linear_fit_band)
+
+
+@pytest.fixture
+def housing():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'RM': rng.normal(6, 0.7, 200), 'LSTAT': rng.normal(12, 5, 200)})
+    df['MEDV'] = 5 * df['RM'] - 0.5 * df['LSTAT'] + rng.normal(0, 2, 200)
+    df.loc[::17, 'LSTAT'] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_all_visuals_manifest(housing, tmp_path, workers):
+    visualizer = BostonVisualizer(housing, headless=True)
+    manifest = visualizer.generate_all_visuals(str(tmp_path), workers=workers)
+
+    assert list(manifest['name']) == [name for name, _, _ in visualizer.visual_jobs(str(tmp_path))]
+    assert (manifest['status'] == 'ok').all()
+    assert all(os.path.getsize(path) > 0 for path in manifest['path'])
+    with open(tmp_path / "manifest.json", encoding='utf-8') as f:
+        assert len(json.load(f)['visuals']) == len(manifest)
+
+
+def test_failed_chart_is_reported(housing, tmp_path):
+    visualizer = BostonVisualizer(housing, headless=True)
+    jobs = [("missing.png", "plot_distribution", {"column": "YOK", "save_path": str(tmp_path / "missing.png")}),
+            ("rm.png", "plot_boxplot", {"column": "RM", "save_path": str(tmp_path / "rm.png")})]
+    manifest = visualizer.generate_all_visuals(str(tmp_path), workers=2, jobs=jobs)
+
+    assert list(manifest['status']) == ['error', 'ok']
+    assert manifest.loc[0, 'error']
+
+
+def test_binned_counts_match_histogram2d():
+    rng = np.random.default_rng(1)
+    x, y = rng.normal(size=5000), rng.exponential(size=5000)
+    x[::50] = np.nan
+    counts, x_edges, y_edges = binned_counts_2d(x, y, bins=30)
+    keep = np.isfinite(x)
+    expected, _, _ = np.histogram2d(x[keep], y[keep], bins=[x_edges, y_edges])
+    np.testing.assert_array_equal(counts, expected)
+
+
+def test_linear_fit_band_matches_linregress():
+    rng = np.random.default_rng(2)
+    x = rng.normal(size=300)
+    y = 2 * x + rng.normal(size=300)
+    band = linear_fit_band(x, y)
+    reference = stats.linregress(x, y)
+    assert band['slope'] == pytest.approx(reference.slope)
+    assert band['intercept'] == pytest.approx(reference.intercept)
+    assert np.all(band['upper'] > band['fit']) and np.all(band['lower'] < band['fit'])
+
+
+def test_scatter_with_too_few_points_for_band(tmp_path):
+    df = pd.DataFrame({'RM': [6.0, 7.0, np.nan], 'MEDV': [20.0, 25.0, 30.0]})
+    visualizer = BostonVisualizer(df, headless=True)
+    visualizer.plot_scatter("RM", "MEDV", str(tmp_path / "scatter.png"), large_data=False)
+    assert (tmp_path / "scatter.png").exists()
+    assert plt.get_fignums() == []
+
+
+def test_pairplot_rejects_unknown_diag_kind(housing, tmp_path):
+    with pytest.raises(ValueError):
+        BostonVisualizer(housing, headless=True).plot_pairplot(["RM", "MEDV"], str(tmp_path / "p.png"),
+                                                                diag_kind="kdee")
+    assert plt.get_fignums() == []
+
+
+def test_large_data_mode_renders(housing, tmp_path):
+    visualizer = BostonVisualizer(housing, headless=True)
+    visualizer.plot_scatter("RM", "MEDV", str(tmp_path / "scatter.png"), hue="LSTAT", large_data=True)
+    visualizer.plot_pairplot(["RM", "LSTAT", "MEDV"], str(tmp_path / "pair.png"), large_data=True)
+    assert (tmp_path / "scatter.png").exists() and (tmp_path / "pair.png").exists()
+
+
+def test_decimate_points_keeps_sparse_outliers():
+    rng = np.random.default_rng(3)
+    x, y = rng.normal(size=20000), rng.normal(size=20000)
+    x[123], y[123] = 50.0, 50.0
+    keep = decimate_points(x, y, 1000)
+    assert len(keep) == 1000
+    assert 123 in keep
+    assert np.all(np.diff(keep) > 0)
+
+
+def test_interactive_scatter_shares_plotlyjs(housing, tmp_path):
+    visualizer = BostonVisualizer(housing, headless=True)
+    fig = visualizer.plot_interactive_scatter("RM", "MEDV", output_path=str(tmp_path / "a.html"),
+                                              hover_cols=["LSTAT"], max_points=50, webgl=True)
+    visualizer.plot_interactive_scatter("LSTAT", "MEDV", output_path=str(tmp_path / "b.html"))
+
+    assert fig.data[0].type == 'scattergl'
+    assert len(fig.data[0].x) == 50
+    assert (tmp_path / "plotly.min.js").exists()
+    assert (tmp_path / "a.html").stat().st_size < (tmp_path / "plotly.min.js").stat().st_size
+
+
+def test_interactive_scatter_keeps_float64_before_plotly6(housing, tmp_path, monkeypatch):
+    from src.data_processing import visualizer as module
+    monkeypatch.setattr(module, 'PLOTLY_TYPED_ARRAYS', False)
+    fig = BostonVisualizer(housing, headless=True).plot_interactive_scatter(
+        "RM", "MEDV", output_path=str(tmp_path / "a.html"), include_plotlyjs='cdn')
+    assert np.asarray(fig.data[0].x).dtype == np.float64
+
+
+def test_figure_cache_skips_rendering(housing, tmp_path):
+    cache_dir, out = tmp_path / "cache", tmp_path / "out"
+    visualizer = BostonVisualizer(housing, headless=True, cache_dir=str(cache_dir))
+    first = visualizer.generate_all_visuals(str(out))
+    second = BostonVisualizer(housing, headless=True, cache_dir=str(cache_dir)).generate_all_visuals(str(out))
+    assert not first['cached'].any() and second['cached'].all()
+
+    # Yalnızca kullandığı sütun değişen grafikler yeniden çizilir
+    changed = housing.assign(LSTAT=housing['LSTAT'] + 1)
+    third = BostonVisualizer(changed, headless=True, cache_dir=str(cache_dir))
+    third.plot_scatter("RM", "MEDV", str(out / "scatter.png"))
+    assert third.last_cache_hit
+    third.plot_boxplot("LSTAT", str(out / "box.png"))
+    assert not third.last_cache_hit
+
+    third.invalidate_cache("plot_scatter")
+    third.plot_scatter("RM", "MEDV", str(out / "scatter.png"))
+    assert not third.last_cache_hit
+    third.invalidate_cache()
+    assert third.cache.size_bytes() == 0
+
+
+def test_figure_key_ignores_backend(housing):
+    visualizer = BostonVisualizer(housing, headless=True)
+    key = visualizer.figure_key('plot_scatter', {}, ['RM', 'MEDV'])
+    with plt.rc_context({'backend': 'pdf', 'interactive': True}):
+        assert visualizer.figure_key('plot_scatter', {}, ['RM', 'MEDV']) == key
+    with plt.rc_context({'axes.titlesize': 20}):
+        assert visualizer.figure_key('plot_scatter', {}, ['RM', 'MEDV']) != key
+
+
+def test_render_presets(housing, tmp_path):
+    draft = BostonVisualizer(housing, headless=True, preset='draft')
+    manifest = draft.generate_all_visuals(str(tmp_path / "draft"))
+    assert manifest['name'].iloc[0] == "missing_data.webp"
+    with open(manifest['path'].iloc[0], 'rb') as f:
+        assert f.read(12)[8:] == b'WEBP'
+
+    vector = BostonVisualizer(pd.concat([housing] * 20, ignore_index=True), headless=True,
+                              preset='standard', image_format='svg')
+    vector.plot_scatter("RM", "MEDV", str(tmp_path / "scatter.svg"), large_data=False, trendline=False)
+    # 4000 noktalık scatter katmanı SVG içinde tek bir gömülü görüntüdür
+    assert "<image" in (tmp_path / "scatter.svg").read_text()
+
+    with pytest.raises(ValueError):
+        BostonVisualizer(housing, preset='poster')
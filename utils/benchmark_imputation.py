@@ -0,0 +1,77 @@
+"""
+Eksik veri doldurma stratejilerinin süre ve doğruluk karşılaştırması.
+
+Ham Boston verisinden istenen boyutlarda sentetik veri üretir, değerlerin bir
+kısmını silip her stratejiyle geri doldurur; süreyi ve silinen değerler
+üzerindeki normalize RMSE'yi tablo halinde yazdırır.
+
+Kullanım:
+  python -m utils.benchmark_imputation [--rows 1000 10000] [--strategies median knn hgb]
+                                       [--n-jobs -1] [--sample-size 20000]
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(PROJECT_ROOT)
+
+from src.data_processing.imputation import IMPUTATION_STRATEGIES, build_imputer
+
+RAW_DATA = os.path.join(PROJECT_ROOT, "data", "raw", "HousingData.csv")
+
+
+def make_dataset(n_rows, missing_rate=0.05, seed=0):
+    """Ham veriden gürültülü örnekleme ile n_rows satırlık veri ve eksiklik maskesi üretir"""
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(RAW_DATA).dropna().to_numpy(dtype=np.float64)
+    data = base[rng.integers(0, len(base), n_rows)]
+    data += rng.normal(0, 0.01, data.shape) * data.std(axis=0)
+    mask = rng.random(data.shape) < missing_rate
+    mask[:, -1] = False  # Hedef değişken (MEDV) eksiksiz kalsın
+    corrupted = data.copy()
+    corrupted[mask] = np.nan
+    return data, corrupted, mask
+
+
+def run(rows, strategies, n_jobs=None, sample_size=None):
+    results = []
+    for n_rows in rows:
+        truth, corrupted, mask = make_dataset(n_rows)
+        scale = truth.std(axis=0)
+        for strategy in strategies:
+            imputer = build_imputer(strategy, n_jobs=n_jobs, sample_size=sample_size)
+            start = time.perf_counter()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                filled = imputer.fit(corrupted).transform(corrupted)
+            elapsed = time.perf_counter() - start
+            errors = ((filled - truth) / scale)[mask]
+            results.append({
+                "rows": n_rows,
+                "strategy": strategy,
+                "seconds": round(elapsed, 3),
+                "nrmse": round(float(np.sqrt(np.mean(errors ** 2))), 4),
+            })
+            print(f"  {strategy:>6} | {n_rows:>8} satır | {elapsed:8.2f} sn")
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Eksik veri doldurma stratejileri karşılaştırması")
+    parser.add_argument("--rows", nargs="+", type=int, default=[1000, 10000],
+                        help="Denenecek veri boyutları (satır)")
+    parser.add_argument("--strategies", nargs="+", default=list(IMPUTATION_STRATEGIES),
+                        choices=IMPUTATION_STRATEGIES, help="Karşılaştırılacak stratejiler")
+    parser.add_argument("--n-jobs", type=int, default=None, help="Paralel iş sayısı (-1: tüm çekirdekler)")
+    parser.add_argument("--sample-size", type=int, default=None,
+                        help="Eğitimde kullanılacak en fazla satır sayısı")
+    args = parser.parse_args()
+
+    table = run(args.rows, args.strategies, args.n_jobs, args.sample_size)
+    print("\n=== SONUÇLAR ===")
+    print(table.pivot(index="strategy", columns="rows", values=["seconds", "nrmse"]).to_string())
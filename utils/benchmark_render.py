@@ -0,0 +1,84 @@
+"""
+Görselleştirme çıktı ön ayarlarının süre ve dosya boyutu karşılaştırması.
+
+Ham Boston verisinden istenen boyutta gürültülü örneklem üretir ve temel grafikleri
+her ön ayar (draft/standard/publication) ve format ile çizer; grafik başına süreyi
+ve dosya boyutunu tablo halinde yazdırır.
+
+Kullanım:
+  python -m utils.benchmark_render [--rows 20000] [--presets draft standard publication]
+                                   [--formats png webp svg pdf]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import warnings
+import matplotlib
+matplotlib.use('Agg')
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(PROJECT_ROOT)
+
+from src.data_processing.visualizer import IMAGE_FORMATS, RENDER_PRESETS, BostonVisualizer
+
+RAW_DATA = os.path.join(PROJECT_ROOT, "data", "raw", "HousingData.csv")
+
+# (grafik adı, metot, argümanlar); interaktif HTML ön ayardan etkilenmediği için dahil değil
+CHARTS = [
+    ("missing_data", "plot_missing_data", {}),
+    ("correlation_matrix", "plot_correlation_matrix", {}),
+    ("medv_distribution", "plot_distribution", {"column": "MEDV"}),
+    ("rm_medv_scatter", "plot_scatter", {"x_col": "RM", "y_col": "MEDV", "large_data": False}),
+]
+
+
+def make_dataset(n_rows, seed=0):
+    """Ham veriden gürültülü örnekleme ile n_rows satırlık veri üretir (eksik değerler korunur)"""
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(RAW_DATA)
+    df = base.iloc[rng.integers(0, len(base), n_rows)].reset_index(drop=True)
+    noise = rng.normal(0, 0.01, df.shape) * base.std().to_numpy()
+    return df + noise
+
+
+def run(n_rows, presets, formats):
+    df = make_dataset(n_rows)
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        for preset in presets:
+            for image_format in formats or [RENDER_PRESETS[preset]['format']]:
+                visualizer = BostonVisualizer(df, headless=True, preset=preset, image_format=image_format)
+                for name, method, kwargs in CHARTS:
+                    path = os.path.join(output_dir, f"{preset}_{name}.{image_format}")
+                    start = time.perf_counter()
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore")
+                        getattr(visualizer, method)(save_path=path, **kwargs)
+                    elapsed = time.perf_counter() - start
+                    results.append({
+                        "preset": preset,
+                        "format": image_format,
+                        "chart": name,
+                        "seconds": round(elapsed, 3),
+                        "kb": round(os.path.getsize(path) / 1024, 1),
+                    })
+                    print(f"  {preset:>11} | {image_format:>4} | {name:<20} | {elapsed:6.2f} sn")
+    return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Görselleştirme çıktı ön ayarları karşılaştırması")
+    parser.add_argument("--rows", type=int, default=20000, help="Veri boyutu (satır)")
+    parser.add_argument("--presets", nargs="+", default=list(RENDER_PRESETS), choices=list(RENDER_PRESETS),
+                        help="Karşılaştırılacak ön ayarlar")
+    parser.add_argument("--formats", nargs="+", default=None, choices=IMAGE_FORMATS,
+                        help="Denenecek formatlar (varsayılan: her ön ayarın kendi formatı)")
+    args = parser.parse_args()
+
+    table = run(args.rows, args.presets, args.formats)
+    print("\n=== SONUÇLAR ===")
+    print(table.groupby(["preset", "format"], sort=False)[["seconds", "kb"]].sum().to_string())